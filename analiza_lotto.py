@@ -3,217 +3,191 @@
 Analiza wyników lotto - szukanie prawidłowości i statystyk
 """
 
-import pandas as pd
+from collections import Counter
+
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from datetime import datetime
-from collections import Counter, defaultdict
-import re
+
+from dane_lotto import (KOLUMNY_LICZB, SCIEZKA_HISTORII, ramka_danych, rozklad_powtorzen, wczytaj_historie,
+                        wynik_analizy)
+from statystyki_lotto import najczestsze, statystyka_czestotliwosci, statystyka_sekwencji
 
 def wczytaj_dane_lotto(plik_csv):
     """Wczytuje dane z pliku CSV i przetwarza je"""
-    dane = []
-    
-    with open(plik_csv, 'r', encoding='utf-8') as f:
-        for linia in f:
-            linia = linia.strip()
-            if not linia:
-                continue
-                
-            # Parsowanie linii: "1. 27.01.1957 8,12,31,39,43,45"
-            parts = linia.split(' ')
-            if len(parts) >= 3:
-                numer_losowania = parts[0].rstrip('.')
-                data_str = parts[1]
-                liczby_str = ' '.join(parts[2:])
-                
-                # Parsowanie daty
-                try:
-                    data = datetime.strptime(data_str, '%d.%m.%Y')
-                except:
-                    continue
-                
-                # Parsowanie liczb
-                try:
-                    liczby = [int(x) for x in liczby_str.split(',')]
-                    if len(liczby) == 6:  # Sprawdzamy czy to standardowe lotto (6 liczb)
-                        dane.append({
-                            'numer_losowania': int(numer_losowania),
-                            'data': data,
-                            'liczby': sorted(liczby),
-                            'liczba_1': liczby[0] if len(liczby) > 0 else None,
-                            'liczba_2': liczby[1] if len(liczby) > 1 else None,
-                            'liczba_3': liczby[2] if len(liczby) > 2 else None,
-                            'liczba_4': liczby[3] if len(liczby) > 3 else None,
-                            'liczba_5': liczby[4] if len(liczby) > 4 else None,
-                            'liczba_6': liczby[5] if len(liczby) > 5 else None,
-                        })
-                except:
-                    continue
-    
-    return pd.DataFrame(dane)
-
-def analiza_czestotliwosci(df):
+    return ramka_danych(wczytaj_historie(plik_csv))
+
+def _dodaj_liczniki(wynik, nowy):
+    """Łączy wyniki addytywne: liczniki się sumują, liczba losowań też"""
+    return {'rozklad': wynik['rozklad'] + nowy['rozklad'], 'losowan': wynik['losowan'] + nowy['losowan']}
+
+def oblicz_czestotliwosci(historia):
+    wynik = statystyka_czestotliwosci(historia.liczby)
+    wynik['ranking'] = najczestsze(wynik['czestotliwosc'], len(wynik['czestotliwosc']))
+    return wynik
+
+def analiza_czestotliwosci(historia):
     """Analiza częstotliwości występowania liczb"""
     print("=== ANALIZA CZĘSTOTLIWOŚCI LICZB ===")
     
-    # Zbieranie wszystkich wylosowanych liczb
-    wszystkie_liczby = []
-    for _, row in df.iterrows():
-        wszystkie_liczby.extend(row['liczby'])
-    
-    # Zliczanie wystąpień
-    czestotliwosc = Counter(wszystkie_liczby)
+    wynik = wynik_analizy(historia, 'czestotliwosc', oblicz_czestotliwosci)
+    ranking, losowan = wynik['ranking'], wynik['losowan']
     
-    print(f"Łączna liczba losowań: {len(df)}")
+    print(f"Łączna liczba losowań: {losowan}")
     print(f"Najczęściej losowane liczby:")
-    for liczba, ilosc in czestotliwosc.most_common(10):
-        procent = (ilosc / len(df)) * 100
+    for liczba, ilosc in ranking[:10]:
+        procent = (ilosc / losowan) * 100
         print(f"  {liczba}: {ilosc} razy ({procent:.1f}%)")
     
     print(f"\nNajrzadziej losowane liczby:")
-    for liczba, ilosc in czestotliwosc.most_common()[-10:]:
-        procent = (ilosc / len(df)) * 100
+    for liczba, ilosc in ranking[-10:]:
+        procent = (ilosc / losowan) * 100
         print(f"  {liczba}: {ilosc} razy ({procent:.1f}%)")
     
-    return czestotliwosc
+    return wynik
 
-def analiza_sum_i_srednych(df):
+def oblicz_sumy_i_srednie(historia):
+    sumy = ramka_danych(historia)['suma'].to_numpy()
+    
+    return {
+        'sumy': sumy,
+        'srednie': sumy / 6,
+        'srednia': float(sumy.mean()),
+        'mediana': float(np.median(sumy)),
+        'odchylenie': float(sumy.std()),
+        'min': int(sumy.min()),
+        'max': int(sumy.max()),
+    }
+
+def analiza_sum_i_srednych(historia):
     """Analiza sum wylosowanych liczb"""
     print("\n=== ANALIZA SUM I ŚREDNICH ===")
     
-    sumy = [sum(row['liczby']) for _, row in df.iterrows()]
-    srednie = [np.mean(row['liczby']) for _, row in df.iterrows()]
+    wynik = wynik_analizy(historia, 'sumy_i_srednie', oblicz_sumy_i_srednie)
     
-    print(f"Średnia suma wylosowanych liczb: {np.mean(sumy):.1f}")
-    print(f"Mediana sumy: {np.median(sumy):.1f}")
-    print(f"Odchylenie standardowe sum: {np.std(sumy):.1f}")
-    print(f"Minimalna suma: {min(sumy)}")
-    print(f"Maksymalna suma: {max(sumy)}")
+    print(f"Średnia suma wylosowanych liczb: {wynik['srednia']:.1f}")
+    print(f"Mediana sumy: {wynik['mediana']:.1f}")
+    print(f"Odchylenie standardowe sum: {wynik['odchylenie']:.1f}")
+    print(f"Minimalna suma: {wynik['min']}")
+    print(f"Maksymalna suma: {wynik['max']}")
     
-    return sumy, srednie
+    return wynik
+
+def oblicz_parzyste(historia):
+    rozklad = ramka_danych(historia)['parzyste'].value_counts()
+    return {'rozklad': Counter({int(k): int(v) for k, v in rozklad.items()}), 'losowan': len(historia)}
 
-def analiza_par_i_nieparzystych(df):
+def analiza_par_i_nieparzystych(historia):
     """Analiza liczb parzystych i nieparzystych"""
     print("\n=== ANALIZA LICZB PARZYSTYCH I NIEPARZYSTYCH ===")
     
-    statystyki_parzyste = []
-    
-    for _, row in df.iterrows():
-        parzyste = sum(1 for x in row['liczby'] if x % 2 == 0)
-        nieparzyste = 6 - parzyste
-        statystyki_parzyste.append(parzyste)
-    
-    rozklad_parzystych = Counter(statystyki_parzyste)
+    wynik = wynik_analizy(historia, 'parzyste', oblicz_parzyste,
+                          dopisz=lambda wynik, nowe: _dodaj_liczniki(wynik, oblicz_parzyste(nowe)))
+    rozklad_parzystych = wynik['rozklad']
     
     print("Rozkład liczby parzystych w losowaniu:")
     for ilosc_parzystych in sorted(rozklad_parzystych.keys()):
         wystapienia = rozklad_parzystych[ilosc_parzystych]
-        procent = (wystapienia / len(df)) * 100
+        procent = (wystapienia / wynik['losowan']) * 100
         print(f"  {ilosc_parzystych} parzystych: {wystapienia} razy ({procent:.1f}%)")
+    
+    return wynik
+
+def oblicz_dziesiatki(historia):
+    liczby = ramka_danych(historia)[KOLUMNY_LICZB].to_numpy()
+    dziesiatki = np.bincount(((liczby - 1) // 10).ravel(), minlength=5)
+    return {'rozklad': Counter({d: int(ile) for d, ile in enumerate(dziesiatki) if ile}), 'losowan': len(historia)}
 
-def analiza_dziesiątek(df):
+def analiza_dziesiątek(historia):
     """Analiza rozkładu według dziesiątek"""
     print("\n=== ANALIZA ROZKŁADU WEDŁUG DZIESIĄTEK ===")
     
-    dziesiatki = defaultdict(int)
-    
-    for _, row in df.iterrows():
-        for liczba in row['liczby']:
-            dziesiatka = (liczba - 1) // 10
-            dziesiatki[dziesiatka] += 1
+    wynik = wynik_analizy(historia, 'dziesiatki', oblicz_dziesiatki,
+                          dopisz=lambda wynik, nowe: _dodaj_liczniki(wynik, oblicz_dziesiatki(nowe)))
+    dziesiatki = wynik['rozklad']
     
     print("Rozkład według dziesiątek:")
     for dziesiatka in sorted(dziesiatki.keys()):
         zakres = f"{dziesiatka*10+1}-{min((dziesiatka+1)*10, 49)}"
         ilosc = dziesiatki[dziesiatka]
-        procent = (ilosc / (len(df) * 6)) * 100
+        procent = (ilosc / (wynik['losowan'] * 6)) * 100
         print(f"  {zakres}: {ilosc} razy ({procent:.1f}%)")
+    
+    return wynik
+
+def oblicz_sekwencje(historia):
+    najdluzsza = statystyka_sekwencji(historia.liczby)['najdluzsza']
+    return {
+        'najdluzsza': najdluzsza,
+        'sekwencje_2': int((najdluzsza >= 2).sum()),
+        'sekwencje_3_plus': int((najdluzsza >= 3).sum()),
+        'max_sekwencja': int(najdluzsza.max()),
+        'losowan': len(historia),
+    }
 
-def analiza_sekwencji(df):
+def analiza_sekwencji(historia):
     """Analiza sekwencji kolejnych liczb"""
     print("\n=== ANALIZA SEKWENCJI KOLEJNYCH LICZB ===")
     
-    sekwencje_2 = 0
-    sekwencje_3_plus = 0
-    max_sekwencja = 0
-    
-    for _, row in df.iterrows():
-        liczby = sorted(row['liczby'])
-        aktualna_sekwencja = 1
-        najdluzsza_sekwencja = 1
-        
-        for i in range(1, len(liczby)):
-            if liczby[i] == liczby[i-1] + 1:
-                aktualna_sekwencja += 1
-                najdluzsza_sekwencja = max(najdluzsza_sekwencja, aktualna_sekwencja)
-            else:
-                aktualna_sekwencja = 1
-        
-        if najdluzsza_sekwencja >= 2:
-            sekwencje_2 += 1
-        if najdluzsza_sekwencja >= 3:
-            sekwencje_3_plus += 1
-        
-        max_sekwencja = max(max_sekwencja, najdluzsza_sekwencja)
-    
-    print(f"Losowania z sekwencją co najmniej 2 kolejnych liczb: {sekwencje_2} ({(sekwencje_2/len(df)*100):.1f}%)")
-    print(f"Losowania z sekwencją co najmniej 3 kolejnych liczb: {sekwencje_3_plus} ({(sekwencje_3_plus/len(df)*100):.1f}%)")
-    print(f"Najdłuższa znaleziona sekwencja: {max_sekwencja}")
-
-def analiza_powtorzen(df):
-    """Analiza powtórzeń liczb w kolejnych losowaniach"""
-    print("\n=== ANALIZA POWTÓRZEŃ W KOLEJNYCH LOSOWANIACH ===")
+    wynik = wynik_analizy(historia, 'sekwencje', oblicz_sekwencje)
+    sekwencje_2, sekwencje_3_plus, losowan = wynik['sekwencje_2'], wynik['sekwencje_3_plus'], wynik['losowan']
     
-    powtorzenia = []
+    print(f"Losowania z sekwencją co najmniej 2 kolejnych liczb: {sekwencje_2} ({(sekwencje_2/losowan*100):.1f}%)")
+    print(f"Losowania z sekwencją co najmniej 3 kolejnych liczb: {sekwencje_3_plus} ({(sekwencje_3_plus/losowan*100):.1f}%)")
+    print(f"Najdłuższa znaleziona sekwencja: {wynik['max_sekwencja']}")
     
-    for i in range(1, len(df)):
-        poprzednie = set(df.iloc[i-1]['liczby'])
-        aktualne = set(df.iloc[i]['liczby'])
-        wspolne = len(poprzednie.intersection(aktualne))
-        powtorzenia.append(wspolne)
+    return wynik
+
+def analiza_powtorzen(historia):
+    """Analiza powtórzeń liczb w kolejnych losowaniach"""
+    print("\n=== ANALIZA POWTÓRZEŃ W KOLEJNYCH LOSOWANIACH ===")
     
-    rozklad_powt = Counter(powtorzenia)
+    rozklad_powt = wynik_analizy(historia, 'powtorzenia', lambda h: rozklad_powtorzen(h.maski)[0])
+    liczba_par = rozklad_powt.sum()
     
     print("Rozkład powtórzeń liczb w kolejnym losowaniu:")
-    for ilosc_powt in sorted(rozklad_powt.keys()):
+    for ilosc_powt in np.flatnonzero(rozklad_powt):
         wystapienia = rozklad_powt[ilosc_powt]
-        procent = (wystapienia / len(powtorzenia)) * 100
+        procent = (wystapienia / liczba_par) * 100
         print(f"  {ilosc_powt} powtórzeń: {wystapienia} razy ({procent:.1f}%)")
+    
+    return rozklad_powt
 
-def analiza_trendy_czasowe(df):
+def oblicz_trendy_czasowe(historia):
+    df = ramka_danych(historia)
+    srednie_sumy = df.groupby(df['rok'] // 10 * 10)['suma'].mean()
+    return {int(dekada): float(srednia) for dekada, srednia in srednie_sumy.items()}
+
+def analiza_trendy_czasowe(historia):
     """Analiza trendów w czasie"""
     print("\n=== ANALIZA TRENDÓW CZASOWYCH ===")
     
     # Grupowanie po dekadach
-    df['dekada'] = (df['data'].dt.year // 10) * 10
+    srednie_sumy = wynik_analizy(historia, 'trendy_czasowe', oblicz_trendy_czasowe)
     
     print("Średnia suma wylosowanych liczb w dekadach:")
-    for dekada in sorted(df['dekada'].unique()):
-        dane_dekady = df[df['dekada'] == dekada]
-        srednia_suma = np.mean([sum(row['liczby']) for _, row in dane_dekady.iterrows()])
+    for dekada, srednia_suma in srednie_sumy.items():
         print(f"  {dekada}s: {srednia_suma:.1f}")
+    
+    return srednie_sumy
 
-def main():
+def main(plik_historii=SCIEZKA_HISTORII):
     """Główna funkcja analizy"""
     print("Wczytywanie danych...")
-    df = wczytaj_dane_lotto('wyniki-lotto-all-time.csv')
+    historia = wczytaj_historie(plik_historii)
     
-    if df.empty:
+    if not len(historia):
         print("Nie udało się wczytać danych!")
         return
     
-    print(f"Wczytano {len(df)} losowań z okresu {df['data'].min()} - {df['data'].max()}")
+    print(f"Wczytano {len(historia)} losowań z okresu {historia.daty[0]} - {historia.daty[-1]}")
     
-    # Przeprowadzanie analiz
-    czestotliwosc = analiza_czestotliwosci(df)
-    sumy, srednie = analiza_sum_i_srednych(df)
-    analiza_par_i_nieparzystych(df)
-    analiza_dziesiątek(df)
-    analiza_sekwencji(df)
-    analiza_powtorzen(df)
-    analiza_trendy_czasowe(df)
+    # Przeprowadzanie analiz (wyniki z cache, jeśli historia się nie zmieniła)
+    analiza_czestotliwosci(historia)
+    analiza_sum_i_srednych(historia)
+    analiza_par_i_nieparzystych(historia)
+    analiza_dziesiątek(historia)
+    analiza_sekwencji(historia)
+    analiza_powtorzen(historia)
+    analiza_trendy_czasowe(historia)
     
     print("\n=== PODSUMOWANIE NAJWAŻNIEJSZYCH OBSERWACJI ===")
     print("1. Sprawdź czy któreś liczby wyraźnie odstają od średniej częstotliwości")
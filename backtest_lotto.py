@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Backtest kuponów lotto na całej historii losowań
+Liczy, ile razy każdy kupon trafiłby 3, 4, 5 i 6 liczb w przeszłości
+"""
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import kupony_lotto
+from dane_lotto import SCIEZKA_HISTORII, bitmapy_liczb, parsuj_pola, popcount, wczytaj_historie
+from kupony_lotto import sprawdz_kupony
+
+# Kupony przetwarzane naraz w jednym kroku (ogranicza pamięć do ~BLOK * 6 * W słów)
+BLOK_KUPONOW = 256
+# Kupony wysyłane naraz do jednego procesu roboczego
+ZADANIE_KUPONOW = 1 << 16
+
+NAZWY_TRAFIEN = {3: 'trójka', 4: 'czwórka', 5: 'piątka', 6: 'szóstka'}
+
+# Stan procesów roboczych (ustawiany raz w inicjalizatorze puli)
+_bitmapy = None
+_losowan = 0
+
+
+def _trafienia_bloku(kupony, bitmapy, losowan):
+    """Rozkład trafień (T, 7) dla bloku kuponów
+
+    Bitmapy 6 liczb kuponu są sumowane bitowo (sumatory pełne na całych
+    słowach), więc dla każdego losowania dostajemy 3-bitowy licznik
+    trafień, a popcount odpowiednich kombinacji bitów daje liczbę losowań
+    z dokładnie j trafieniami.
+    """
+    x = bitmapy[kupony.astype(np.intp) - 1]
+    a, b, c, d, e, f = (x[:, i] for i in range(6))
+
+    suma_abc, przeniesienie_abc = a ^ b ^ c, (a & b) | (c & (a ^ b))
+    suma_def, przeniesienie_def = d ^ e ^ f, (d & e) | (f & (d ^ e))
+    bit0 = suma_abc ^ suma_def
+    przeniesienie = suma_abc & suma_def
+    bit1 = przeniesienie_abc ^ przeniesienie_def ^ przeniesienie
+    bit2 = (przeniesienie_abc & przeniesienie_def) | (przeniesienie & (przeniesienie_abc ^ przeniesienie_def))
+    nie0, nie1, nie2 = ~bit0, ~bit1, ~bit2
+
+    trafienia = np.zeros((len(kupony), 7), dtype=np.int64)
+    for j, maska in ((1, bit0 & nie1 & nie2), (2, nie0 & bit1 & nie2), (3, bit0 & bit1 & nie2),
+                     (4, nie0 & nie1 & bit2), (5, bit0 & nie1 & bit2), (6, nie0 & bit1 & bit2)):
+        trafienia[:, j] = popcount(maska).sum(axis=1)
+    trafienia[:, 0] = losowan - trafienia[:, 1:].sum(axis=1)
+    return trafienia
+
+
+def _trafienia_kuponow(kupony, bitmapy, losowan, blok=BLOK_KUPONOW):
+    wynik = np.empty((len(kupony), 7), dtype=np.int64)
+    for poczatek in range(0, len(kupony), blok):
+        wynik[poczatek:poczatek + blok] = _trafienia_bloku(kupony[poczatek:poczatek + blok], bitmapy, losowan)
+    return wynik
+
+
+def _inicjuj_proces(bitmapy, losowan):
+    global _bitmapy, _losowan
+    _bitmapy, _losowan = bitmapy, losowan
+
+
+def _zadanie(kupony):
+    return _trafienia_kuponow(kupony, _bitmapy, _losowan)
+
+
+def backtest(kupony, historia, procesy=1, blok=BLOK_KUPONOW):
+    """Backtest kuponów na historii losowań
+
+    kupony  - macierz (T, 6) liczb 1-49
+    procesy - liczba procesów roboczych (1 = bez puli procesów)
+
+    Zwraca słownik z macierzą 'trafienia' (T, 7) - dla każdego kuponu ile
+    losowań miało z nim dokładnie 0..6 wspólnych liczb - oraz łącznym
+    rozkładem 'suma' (7,).
+    """
+    kupony = sprawdz_kupony(kupony)
+    bitmapy = bitmapy_liczb(historia.liczby)
+    losowan = len(historia)
+
+    if procesy > 1 and len(kupony) > ZADANIE_KUPONOW:
+        bloki = [kupony[i:i + ZADANIE_KUPONOW] for i in range(0, len(kupony), ZADANIE_KUPONOW)]
+        with ProcessPoolExecutor(max_workers=procesy, initializer=_inicjuj_proces,
+                                 initargs=(bitmapy, losowan)) as pula:
+            trafienia = np.concatenate(list(pula.map(_zadanie, bloki)))
+    else:
+        trafienia = _trafienia_kuponow(kupony, bitmapy, losowan, blok)
+
+    return {
+        'kupony': kupony,
+        'losowan': losowan,
+        'trafienia': trafienia,
+        'suma': trafienia.sum(axis=0),
+    }
+
+
+def wczytaj_kupony(plik):
+    """Wczytuje kupony z pliku .kup, .npy (macierz (T, 6)) lub tekstowego (6 liczb w linii)
+
+    W pliku tekstowym każda linia z liczbami musi mieć ich dokładnie 6 -
+    inaczej ValueError z liczbą odrzuconych linii (linie bez cyfr, np.
+    nagłówek, są pomijane).
+    """
+    if plik.endswith('.kup'):
+        return kupony_lotto.wczytaj_kupony(plik)
+    if plik.endswith('.npy'):
+        return np.load(plik)
+    with open(plik, 'rb') as f:
+        dane = f.read()
+    kupony = parsuj_pola(dane, 6)
+    bufor = np.frombuffer(dane, dtype=np.uint8)
+    cyfra = (bufor >= ord('0')) & (bufor <= ord('9'))
+    linii = len(np.unique(np.cumsum(bufor == ord('\n'))[cyfra]))
+    if linii != len(kupony):
+        raise ValueError(f"Linie pliku {plik} bez dokładnie 6 liczb: {linii - len(kupony)} z {linii}")
+    return kupony
+
+
+def kupony_z_generatora(strategia, ile, ziarno=None, procesy=1):
+    """Generuje kupony strategią z InteligentnyLottoGenerator (ten sam zestaw dla tego samego ziarna)"""
+    from lotto_generator import InteligentnyLottoGenerator
+
+    return InteligentnyLottoGenerator().generate_batch(strategia, ile, ziarno, procesy=procesy)
+
+
+def wyswietl_wyniki(wynik, najlepszych=10):
+    """Wyświetla łączny rozkład trafień i najlepsze kupony"""
+    kupony, trafienia, suma = wynik['kupony'], wynik['trafienia'], wynik['suma']
+    par = len(kupony) * wynik['losowan']
+
+    print("=" * 60)
+    print("📊 BACKTEST KUPONÓW")
+    print("=" * 60)
+    print(f"Kupony: {len(kupony):,}   Losowania: {wynik['losowan']:,}   Par kupon-losowanie: {par:,}")
+
+    print("\nŁączny rozkład trafień:")
+    for j in range(6, -1, -1):
+        procent = suma[j] / par * 100 if par else 0.0
+        nazwa = f" ({NAZWY_TRAFIEN[j]})" if j in NAZWY_TRAFIEN else ""
+        print(f"  {j} trafień{nazwa}: {suma[j]:,} ({procent:.4f}%)")
+
+    if len(kupony):
+        print(f"\nKupony z jakąkolwiek wygraną (3+): {np.count_nonzero(trafienia[:, 3:].sum(axis=1)):,}")
+        print(f"\nNajlepsze kupony (wg najwyższych trafień):")
+        kolejnosc = np.lexsort(tuple(-trafienia[:, j] for j in range(3, 7)))[:najlepszych]
+        for i in kolejnosc:
+            liczby = ', '.join(map(str, kupony[i]))
+            opis = ', '.join(f"{NAZWY_TRAFIEN[j]}: {trafienia[i, j]}" for j in range(6, 2, -1))
+            print(f"  {liczby}  →  {opis}")
+    print("=" * 60)
+
+
+def main(argv=None):
+    """Punkt wejścia CLI"""
+    parser = argparse.ArgumentParser(description="Backtest kuponów lotto na historii losowań")
+    zrodlo = parser.add_mutually_exclusive_group(required=True)
+    zrodlo.add_argument('plik', nargs='?', help="plik z kuponami (.kup, .npy lub tekst, 6 liczb w linii)")
+    zrodlo.add_argument('--strategia', help="wygeneruj kupony strategią generatora (np. gorace, zimne)")
+    parser.add_argument('--ile', type=int, default=1000, help="liczba kuponów dla --strategia")
+    parser.add_argument('--ziarno', type=int, help="ziarno kuponów --strategia (powtarzalne wyniki)")
+    parser.add_argument('--historia', default=SCIEZKA_HISTORII, help="plik CSV z historią losowań")
+    parser.add_argument('--procesy', type=int, default=1,
+                        help=f"liczba procesów roboczych (0 = {os.cpu_count()}, tyle ile rdzeni)")
+    parser.add_argument('--zapisz', help="zapisz macierz trafień (T, 7) do pliku .npy")
+    args = parser.parse_args(argv)
+
+    try:
+        historia = wczytaj_historie(args.historia)
+        procesy = args.procesy or os.cpu_count()
+        kupony = (kupony_z_generatora(args.strategia, args.ile, args.ziarno, procesy) if args.strategia
+                  else wczytaj_kupony(args.plik))
+        wynik = backtest(kupony, historia, procesy=procesy)
+    except (OSError, ValueError) as e:
+        print(f"❌ Błąd: {e}")
+        sys.exit(1)
+
+    wyswietl_wyniki(wynik)
+    if args.zapisz:
+        np.save(args.zapisz, wynik['trafienia'])
+        print(f"Zapisano macierz trafień do pliku: {args.zapisz}")
+
+
+if __name__ == "__main__":
+    main()
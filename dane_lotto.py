@@ -0,0 +1,534 @@
+#!/usr/bin/env python3
+"""
+Wspólne wczytywanie historii losowań lotto do tablic NumPy
+"""
+
+import functools
+import hashlib
+import io
+import json
+import os
+import pickle
+
+import numpy as np
+
+PLIK_HISTORII = 'wyniki-lotto-all-time.csv'
+SCIEZKA_HISTORII = os.path.join(os.path.dirname(os.path.abspath(__file__)), PLIK_HISTORII)
+
+# Kolumny ramek danych z kolejnymi (posortowanymi) liczbami losowania
+KOLUMNY_LICZB = [f'n{i}' for i in range(1, 7)]
+
+# Binarny cache historii trzymany obok pliku CSV
+KATALOG_CACHE = '{}.cache'
+WERSJA_CACHE = 3
+KOLUMNY_CACHE = ('liczby', 'daty', 'numery', 'maski')
+
+# Wyniki analiz trzymane w podkatalogu cache historii
+KATALOG_WYNIKOW = 'wyniki'
+WERSJA_WYNIKOW = 1
+
+# Rozmiar bloku przy strumieniowym hashowaniu pliku
+ROZMIAR_BLOKU = 1 << 20
+
+# Tyle bajtów tekstu parsujemy naraz (bloki dzielone na granicach linii)
+BLOK_PARSOWANIA = 1 << 20
+
+# Każda poprawna linia "1. 27.01.1957 8,12,31,39,43,45" to dokładnie 10 liczb:
+# numer losowania, dzień, miesiąc, rok i 6 wylosowanych liczb
+POL_W_LINII = 10
+
+
+class HistoriaLosowan:
+    """Historia losowań w postaci tablic kolumnowych
+
+    liczby  - macierz (N, 6) uint8 z posortowanymi liczbami
+    daty    - tablica datetime64[D]
+    numery  - tablica int32 z numerami losowań
+    maski   - tablica uint64, bit (n-1) ustawiony gdy wylosowano liczbę n
+    odcisk  - SHA-256 zawartości pliku źródłowego (jeśli znany)
+    katalog - katalog cache historii (None, gdy historia nie jest w cache)
+    """
+
+    def __init__(self, liczby, daty, numery, maski=None, odcisk=None, katalog=None):
+        self.liczby = liczby
+        self.daty = daty
+        self.numery = numery
+        self.maski = maski if maski is not None else maski_z_liczb(liczby)
+        self.odcisk = odcisk
+        self.katalog = katalog
+
+    def __len__(self):
+        return len(self.liczby)
+
+    def __getitem__(self, wiersze):
+        """Wycinek historii (dla slice - widoki kolumn bez kopiowania)"""
+        return HistoriaLosowan(self.liczby[wiersze], self.daty[wiersze],
+                               self.numery[wiersze], self.maski[wiersze])
+
+
+@functools.lru_cache(maxsize=1)
+def ramka_danych(historia):
+    """Ramka danych pandas z historii: same kolumny liczbowe o zwartych typach
+
+    n1..n6 (uint8) to widoki kolumn macierzy liczb; suma, parzyste, rok
+    i miesiąc są policzone z góry. pandas jest importowane dopiero tutaj.
+    """
+    import pandas as pd
+
+    liczby = np.asarray(historia.liczby)
+    lata = historia.daty.astype('datetime64[Y]').astype(np.int64) + 1970
+    miesiace = historia.daty.astype('datetime64[M]').astype(np.int64) % 12 + 1
+
+    dane = {
+        'numer_losowania': historia.numery,
+        'data': historia.daty.astype('datetime64[ns]'),
+    }
+    for i, kolumna in enumerate(KOLUMNY_LICZB):
+        dane[kolumna] = liczby[:, i]
+    dane.update({
+        'suma': liczby.sum(axis=1, dtype=np.uint16),
+        'parzyste': (liczby % 2 == 0).sum(axis=1, dtype=np.uint8),
+        'rok': lata.astype(np.uint16),
+        'miesiac': miesiace.astype(np.uint8),
+    })
+    return pd.DataFrame(dane)
+
+
+def maski_z_liczb(liczby):
+    """Zamienia macierz (N, k) liczb 1-49 na tablicę masek bitowych uint64"""
+    liczby = np.asarray(liczby)
+    bity = np.left_shift(np.uint64(1), liczby.astype(np.uint64) - np.uint64(1))
+    return np.bitwise_or.reduce(bity, axis=-1)
+
+
+def bitmapy_liczb(liczby):
+    """Bitmapy losowań dla każdej liczby: tablica (49, W) uint64
+
+    Bit t słowa bitmapy liczby n jest ustawiony, gdy n padła w losowaniu t
+    (losowania upakowane po 64 w słowie, nadmiarowe bity są zerami).
+    """
+    liczby = np.asarray(liczby)
+    jedynkowa = np.zeros((len(liczby), 49), dtype=bool)
+    jedynkowa[np.arange(len(liczby))[:, None], liczby.astype(np.intp) - 1] = True
+    upakowane = np.packbits(jedynkowa, axis=0, bitorder='little')
+    dopelnienie = np.zeros((-len(upakowane) % 8, 49), dtype=np.uint8)
+    return np.ascontiguousarray(np.concatenate((upakowane, dopelnienie)).T).view(np.uint64)
+
+
+def _popcount_tablica(x):
+    """Popcount przez tablicę 256 wartości - dla NumPy bez bitwise_count"""
+    bajty = np.ascontiguousarray(x, dtype=np.uint64)[..., None].view(np.uint8)
+    return _BITY_W_BAJCIE[bajty].sum(axis=-1, dtype=np.uint8)
+
+
+_BITY_W_BAJCIE = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1).astype(np.uint8)
+popcount = getattr(np, 'bitwise_count', _popcount_tablica)
+
+
+def wspolne_liczby(maski_a, maski_b):
+    """Ile liczb mają wspólnych losowania/kupony (z broadcastingiem)"""
+    return popcount(np.bitwise_and(maski_a, maski_b))
+
+
+def rozklad_powtorzen(maski, opoznienia=(1,)):
+    """Rozkład liczby wspólnych liczb między losowaniem i a i-k
+
+    Zwraca macierz (len(opoznienia), 7): wiersz dla każdego opóźnienia k,
+    kolumna j to liczba par losowań mających dokładnie j wspólnych liczb.
+    """
+    maski = np.asarray(maski)
+    rozklad = np.zeros((len(opoznienia), 7), dtype=np.int64)
+    for i, k in enumerate(opoznienia):
+        if 0 < k < len(maski):
+            rozklad[i] = np.bincount(wspolne_liczby(maski[k:], maski[:-k]), minlength=7)
+    return rozklad
+
+
+def _parsuj_blok(bufor, pol_w_linii):
+    """parsuj_pola dla jednego bloku całych linii (indeksy pól zamiast sum po bajtach)"""
+    cyfra = (bufor >= ord('0')) & (bufor <= ord('9'))
+    granice = np.flatnonzero(np.diff(cyfra, prepend=False, append=False)).astype(np.int32)
+    poczatki, konce = granice[::2], granice[1::2]
+    dlugosci = konce - poczatki
+
+    # Wartość każdego pola: suma cyfr ważona potęgami 10 od końca pola
+    indeksy_cyfr = np.flatnonzero(cyfra).astype(np.int32)
+    wykladnik = np.repeat(konce - 1, dlugosci) - indeksy_cyfr
+    wartosci_cyfr = (bufor[indeksy_cyfr] - ord('0')).astype(np.int64) * 10 ** wykladnik.astype(np.int64)
+    pierwsze_cyfry = np.zeros(len(poczatki), dtype=np.int32)
+    np.cumsum(dlugosci[:-1], out=pierwsze_cyfry[1:])
+    pola = np.add.reduceat(wartosci_cyfr, pierwsze_cyfry) if len(poczatki) else wartosci_cyfr
+
+    # Pierwsze pole każdej linii (pola są posortowane, więc wystarczy szukać
+    # nowych linii wśród początków pól) i odrzucenie linii o złej liczbie pól
+    nowe_linie = np.flatnonzero(bufor == ord('\n'))
+    pierwsze = np.concatenate(([0], np.searchsorted(poczatki, nowe_linie), [len(poczatki)]))
+    start = pierwsze[:-1][np.diff(pierwsze) == pol_w_linii]
+    # Pola dłuższe niż int32 obcinamy do INT32_MAX, więc nie przechodzą walidacji
+    pola = np.minimum(pola, np.iinfo(np.int32).max).astype(np.int32)
+    return pola[start[:, None] + np.arange(pol_w_linii)]
+
+
+def parsuj_pola(dane, pol_w_linii=POL_W_LINII, blok=BLOK_PARSOWANIA):
+    """Parsuje cały tekst pliku zwektoryzowanymi przebiegami po blokach
+
+    Polem jest każdy ciąg cyfr. Zwraca macierz (L, pol_w_linii) int32 z
+    polami tych linii, które mają dokładnie pol_w_linii pól. Tekst jest
+    dzielony na bloki po ok. `blok` bajtów na granicach linii, więc
+    pamięć pomocnicza nie rośnie z rozmiarem pliku.
+    """
+    bufor = np.frombuffer(dane, dtype=np.uint8)
+    czesci = [np.empty((0, pol_w_linii), dtype=np.int32)]
+    poczatek = 0
+    while poczatek < len(bufor):
+        koniec = poczatek + blok
+        if koniec < len(bufor):
+            # Blok kończy się za ostatnią nową linią (dłuższa linia - za najbliższą)
+            nowe_linie = np.flatnonzero(bufor[poczatek:koniec] == ord('\n'))
+            if len(nowe_linie):
+                koniec = poczatek + int(nowe_linie[-1]) + 1
+            else:
+                nastepne = np.flatnonzero(bufor[koniec:] == ord('\n'))
+                koniec = koniec + int(nastepne[0]) + 1 if len(nastepne) else len(bufor)
+        czesci.append(_parsuj_blok(bufor[poczatek:koniec], pol_w_linii))
+        poczatek = koniec
+    return np.concatenate(czesci)
+
+
+def parsuj_historie(dane):
+    """Zamienia surowe bajty pliku CSV na HistoriaLosowan"""
+    pola = parsuj_pola(dane)
+
+    numery, dzien, miesiac, rok = pola[:, 0], pola[:, 1], pola[:, 2], pola[:, 3]
+    liczby = pola[:, 4:]
+
+    # Odrzucamy linie z niepoprawną datą lub liczbami spoza 1-49
+    poprawne = ((dzien >= 1) & (dzien <= 31) & (miesiac >= 1) & (miesiac <= 12)
+                & np.all((liczby >= 1) & (liczby <= 49), axis=1))
+    miesiace = ((rok - 1970).astype('datetime64[Y]').astype('datetime64[M]')
+                + (miesiac - 1).astype('timedelta64[M]'))
+    daty = miesiace.astype('datetime64[D]') + (dzien - 1).astype('timedelta64[D]')
+    # Daty typu 31.02 przechodzą na kolejny miesiąc - takie linie też odrzucamy
+    poprawne &= daty.astype('datetime64[M]') == miesiace
+
+    liczby = np.sort(liczby[poprawne].astype(np.uint8), axis=1)
+    return HistoriaLosowan(liczby, daty[poprawne], numery[poprawne].astype(np.int32))
+
+
+def _stan_pliku(plik_csv):
+    """Rozmiar i czas modyfikacji pliku - szybki klucz cache"""
+    stat = os.stat(plik_csv)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _katalog_cache(plik_csv):
+    return KATALOG_CACHE.format(plik_csv)
+
+
+def _wczytaj_meta(katalog):
+    try:
+        with open(os.path.join(katalog, 'meta.json'), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if meta.get('wersja') != WERSJA_CACHE:
+        return None
+    return meta
+
+
+def zapisz_json(sciezka, dane):
+    """Zapisuje JSON atomowo (plik tymczasowy + os.replace)"""
+    tymczasowy = f'{sciezka}.{os.getpid()}.tmp'
+    with open(tymczasowy, 'w', encoding='utf-8') as f:
+        json.dump(dane, f)
+    os.replace(tymczasowy, sciezka)
+
+
+def zapisz_npy(sciezka, tablica):
+    """Zapisuje tablicę .npy atomowo (plik tymczasowy + os.replace)"""
+    tymczasowy = f'{sciezka[:-len(".npy")]}.{os.getpid()}.tmp.npy'
+    np.save(tymczasowy, tablica)
+    os.replace(tymczasowy, sciezka)
+
+
+def _zapisz_meta(katalog, meta):
+    zapisz_json(os.path.join(katalog, 'meta.json'), meta)
+
+
+def _otworz_cache(katalog, meta):
+    """Otwiera kolumny z cache jako tablice mapowane w pamięci (bez kopiowania)"""
+    kolumny = {nazwa: np.load(os.path.join(katalog, f'{nazwa}.npy'), mmap_mode='r')
+               for nazwa in KOLUMNY_CACHE}
+    return HistoriaLosowan(odcisk=meta['sha256'], katalog=katalog, **kolumny)
+
+
+def _zapisz_cache(katalog, historia, rozmiar, mtime):
+    """Zapisuje kolumny historii do cache; meta.json zapisywane na końcu"""
+    os.makedirs(katalog, exist_ok=True)
+    for nazwa in KOLUMNY_CACHE:
+        zapisz_npy(os.path.join(katalog, f'{nazwa}.npy'), getattr(historia, nazwa))
+    _zapisz_meta(katalog, {
+        'wersja': WERSJA_CACHE,
+        'rozmiar': rozmiar,
+        'mtime_ns': mtime,
+        'sha256': historia.odcisk,
+        'przesuniecie': rozmiar,
+        'liczba_losowan': len(historia),
+        'ostatni_numer': int(historia.numery[-1]) if len(historia) else 0,
+    })
+
+
+def _dopisz_do_npy(sciezka, wiersze, oczekiwane_wiersze):
+    """Dopisuje wiersze na końcu pliku .npy i przepisuje nagłówek w miejscu
+
+    Zwraca False, gdy plik ma inną liczbę wierszy niż oczekiwana (np. po
+    przerwanym dopisywaniu) albo nowy nagłówek nie mieści się w starym -
+    wtedy trzeba zapisać cache od nowa.
+    """
+    with open(sciezka, 'r+b') as f:
+        if np.lib.format.read_magic(f) != (1, 0):
+            return False
+        ksztalt, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+        poczatek_danych = f.tell()
+        if (fortran or dtype != wiersze.dtype or ksztalt[0] != oczekiwane_wiersze
+                or ksztalt[1:] != wiersze.shape[1:]):
+            return False
+
+        naglowek = io.BytesIO()
+        nowy_ksztalt = (ksztalt[0] + len(wiersze),) + ksztalt[1:]
+        np.lib.format.write_array_header_1_0(naglowek, {
+            'descr': np.lib.format.dtype_to_descr(dtype),
+            'fortran_order': False,
+            'shape': nowy_ksztalt,
+        })
+        if naglowek.tell() != poczatek_danych:
+            return False
+
+        f.seek(0, os.SEEK_END)
+        f.write(np.ascontiguousarray(wiersze).tobytes())
+        f.seek(0)
+        f.write(naglowek.getvalue())
+    return True
+
+
+def _dopisz_przyrostowo(plik_csv, katalog, meta, rozmiar, mtime):
+    """Parsuje tylko dopisany koniec pliku i dokleja go do cache
+
+    Zwraca None, gdy wcześniej wczytana część pliku została zmieniona -
+    wtedy trzeba przebudować cache w całości. Wczytana część jest tylko
+    hashowana strumieniowo (bez parsowania), więc parsowanie i dopisywanie
+    kosztuje tyle, ile jest nowych losowań.
+    """
+    przesuniecie = meta.get('przesuniecie')
+    if przesuniecie is None or rozmiar <= przesuniecie:
+        return None
+
+    hasher = hashlib.sha256()
+    with open(plik_csv, 'rb') as f:
+        pozostalo = przesuniecie
+        ostatni_bajt = b''
+        while pozostalo:
+            blok = f.read(min(ROZMIAR_BLOKU, pozostalo))
+            if not blok:
+                return None
+            hasher.update(blok)
+            pozostalo -= len(blok)
+            ostatni_bajt = blok[-1:]
+        if hasher.hexdigest() != meta['sha256']:
+            return None
+        ogon = f.read()
+
+    # Doklejenie tekstu bez nowej linii zmieniłoby ostatnie wczytane losowanie
+    if ostatni_bajt not in (b'', b'\n') and not ogon.startswith((b'\n', b'\r\n')):
+        return None
+
+    nowe = parsuj_historie(ogon)
+    if len(nowe) and int(nowe.numery[0]) <= meta['ostatni_numer']:
+        return None
+    if len(nowe) and np.any(np.diff(nowe.numery) <= 0):
+        return None
+
+    for nazwa in KOLUMNY_CACHE:
+        if len(nowe) and not _dopisz_do_npy(os.path.join(katalog, f'{nazwa}.npy'), getattr(nowe, nazwa),
+                                             meta['liczba_losowan']):
+            return None
+
+    hasher.update(ogon)
+    meta = dict(meta,
+                rozmiar=rozmiar,
+                mtime_ns=mtime,
+                sha256=hasher.hexdigest(),
+                przesuniecie=rozmiar,
+                liczba_losowan=meta['liczba_losowan'] + len(nowe),
+                ostatni_numer=int(nowe.numery[-1]) if len(nowe) else meta['ostatni_numer'])
+    _zapisz_meta(katalog, meta)
+    return _otworz_cache(katalog, meta)
+
+
+def wczytaj_historie(plik_csv=SCIEZKA_HISTORII, cache=True, przyrostowo=True):
+    """Wczytuje historię losowań z pliku CSV
+
+    Przy cache=True sparsowana historia jest trzymana w katalogu
+    <plik_csv>.cache i otwierana przez np.memmap. Cache jest ważny dopóki
+    zgadza się rozmiar i czas modyfikacji pliku; gdy któryś się zmieni,
+    porównywany jest hash zawartości i w razie różnicy cache jest budowany
+    od nowa.
+
+    Gdy plik urósł, a przyrostowo=True, parsowane są wyłącznie nowe linie
+    dopisane na końcu (nowe losowania), a pełna przebudowa następuje dopiero
+    po wykryciu zmiany we wcześniej wczytanej części pliku.
+    """
+    rozmiar, mtime = _stan_pliku(plik_csv)
+    katalog = _katalog_cache(plik_csv)
+    meta = _wczytaj_meta(katalog) if cache else None
+
+    if meta and meta['rozmiar'] == rozmiar and meta['mtime_ns'] == mtime:
+        try:
+            return _otworz_cache(katalog, meta)
+        except (OSError, ValueError, KeyError):
+            meta = None
+
+    if meta and przyrostowo:
+        try:
+            historia = _dopisz_przyrostowo(plik_csv, katalog, meta, rozmiar, mtime)
+        except (OSError, ValueError, KeyError):
+            historia = None
+        if historia is not None:
+            return historia
+
+    with open(plik_csv, 'rb') as f:
+        dane = f.read()
+    odcisk = hashlib.sha256(dane).hexdigest()
+
+    if not cache:
+        historia = parsuj_historie(dane)
+        historia.odcisk = odcisk
+        return historia
+
+    if meta and meta['sha256'] == odcisk:
+        # Plik tylko "dotknięty" - zawartość bez zmian, odświeżamy klucz
+        try:
+            historia = _otworz_cache(katalog, meta)
+            _zapisz_meta(katalog, dict(meta, rozmiar=rozmiar, mtime_ns=mtime))
+            return historia
+        except (OSError, ValueError, KeyError):
+            pass
+
+    historia = parsuj_historie(dane)
+    historia.odcisk = odcisk
+    try:
+        _zapisz_cache(katalog, historia, rozmiar, mtime)
+        historia.katalog = katalog
+    except OSError:
+        # Brak prawa zapisu obok pliku - działamy bez cache
+        pass
+    return historia
+
+
+def _hash_masek(maski):
+    return hashlib.sha256(np.ascontiguousarray(maski).tobytes()).hexdigest()
+
+
+def tablica_pochodna(historia, nazwa, oblicz, dopisz=None):
+    """Tablica wyliczana z historii i trzymana obok niej w cache
+
+    oblicz(historia) liczy tablicę dla całej historii. Jeśli podano
+    dopisz(tablica, nowe), a zapisana tablica pochodzi z krótszej historii
+    o tych samych początkowych losowaniach, to zamiast liczyć od nowa
+    dokładane są tylko nowe losowania (nowe to wycinek HistoriaLosowan).
+    Aktualna tablica jest otwierana przez np.memmap tylko do odczytu.
+    """
+    if historia.katalog is None:
+        return oblicz(historia)
+
+    sciezka = os.path.join(historia.katalog, f'{nazwa}.npy')
+    sciezka_meta = os.path.join(historia.katalog, f'{nazwa}.json')
+    try:
+        with open(sciezka_meta, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        meta = None
+
+    if meta and meta['odcisk'] == historia.odcisk and meta['losowan'] == len(historia):
+        try:
+            return np.load(sciezka, mmap_mode='r')
+        except (OSError, ValueError):
+            pass
+
+    tablica = None
+    if (meta and dopisz is not None and meta['losowan'] <= len(historia)
+            and meta['maski_sha'] == _hash_masek(historia.maski[:meta['losowan']])):
+        try:
+            tablica = dopisz(np.load(sciezka), historia[meta['losowan']:])
+        except (OSError, ValueError):
+            tablica = None
+    if tablica is None:
+        tablica = oblicz(historia)
+
+    try:
+        zapisz_npy(sciezka, tablica)
+        zapisz_json(sciezka_meta, {
+            'odcisk': historia.odcisk,
+            'losowan': len(historia),
+            'maski_sha': _hash_masek(historia.maski),
+        })
+    except OSError:
+        pass
+    return tablica
+
+
+def klucz_parametrow(parametry):
+    """Krótki, stabilny skrót parametrów analizy (kolejność kluczy bez znaczenia)"""
+    tekst = json.dumps(parametry or {}, sort_keys=True, default=repr)
+    return hashlib.sha256(tekst.encode('utf-8')).hexdigest()[:16]
+
+
+def wynik_analizy(historia, nazwa, oblicz, parametry=None, dopisz=None, wersja=1):
+    """Wynik analizy historii trzymany w cache obok historii
+
+    Kluczem jest odcisk historii, nazwa analizy i jej parametry, więc
+    zmiana parametrów jednej analizy nie dotyka pozostałych. oblicz(historia)
+    liczy wynik od zera; analizy addytywne podają dopisz(wynik, nowe), które
+    po dopisaniu losowań do historii przelicza tylko nowe losowania (jak
+    w tablica_pochodna). Wynik musi dać się zapisać przez pickle i nie
+    powinien zawierać obiektów pandas. Zmiana sposobu liczenia analizy
+    wymaga podniesienia jej `wersja`, co unieważnia stare wyniki.
+    """
+    if historia.katalog is None:
+        return oblicz(historia)
+
+    sciezka = os.path.join(historia.katalog, KATALOG_WYNIKOW,
+                           f'{nazwa}-v{wersja}-{klucz_parametrow(parametry)}.pkl')
+    try:
+        with open(sciezka, 'rb') as f:
+            zapis = pickle.load(f)
+        if zapis['wersja'] != WERSJA_WYNIKOW:
+            zapis = None
+    except (OSError, pickle.UnpicklingError, EOFError, KeyError, AttributeError, ImportError):
+        zapis = None
+
+    if zapis and zapis['odcisk'] == historia.odcisk and zapis['losowan'] == len(historia):
+        return zapis['wynik']
+
+    wynik = None
+    if (zapis and dopisz is not None and zapis['losowan'] <= len(historia)
+            and zapis['maski_sha'] == _hash_masek(historia.maski[:zapis['losowan']])):
+        wynik = dopisz(zapis['wynik'], historia[zapis['losowan']:])
+    if wynik is None:
+        wynik = oblicz(historia)
+
+    try:
+        os.makedirs(os.path.dirname(sciezka), exist_ok=True)
+        tymczasowy = f'{sciezka}.{os.getpid()}.tmp'
+        with open(tymczasowy, 'wb') as f:
+            pickle.dump({
+                'wersja': WERSJA_WYNIKOW,
+                'odcisk': historia.odcisk,
+                'losowan': len(historia),
+                'maski_sha': _hash_masek(historia.maski),
+                'wynik': wynik,
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tymczasowy, sciezka)
+    except OSError:
+        pass
+    return wynik
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Źródła entropii generatora jako rejestr wtyczek
+Źródła dostępne na bieżącej platformie zbierane są równolegle w wątkach
+demona, z pomiarem czasu każdego źródła i wspólnym limitem czasu całej
+zbiórki (zawieszone źródło nie blokuje też zakończenia programu).
+"""
+
+import hashlib
+import itertools
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+# Domyślny limit czasu całej zbiórki w sekundach
+LIMIT_CZASU = 0.25
+# Ile wpisów katalogu tymczasowego czytamy (na zajętych hostach są ich tysiące)
+WPISOW_TMP = 10
+
+# Nazwa -> (funkcja, opis, czy_dostepne); kolejność rejestracji to kolejność w hashu
+ZRODLA = {}
+
+
+def zrodlo(nazwa, opis, dostepne=None):
+    """Dekorator rejestrujący funkcję bez argumentów jako źródło entropii
+
+    `dostepne` to funkcja sprawdzająca, czy źródło działa na tej
+    platformie; niedostępne źródła nie są w ogóle uruchamiane.
+    """
+    def zarejestruj(funkcja):
+        ZRODLA[nazwa] = (funkcja, opis, dostepne or (lambda: True))
+        return funkcja
+    return zarejestruj
+
+
+def _skrot(dane):
+    return hashlib.sha256(dane if isinstance(dane, bytes) else dane.encode()).hexdigest()[:16]
+
+
+def _linux():
+    return sys.platform.startswith('linux')
+
+
+@zrodlo('czas', '🕐 Czas systemowy (ns)')
+def _czas():
+    return time.time_ns()
+
+
+@zrodlo('procesy', '⚙️  Procesy (/proc/loadavg)', _linux)
+def _procesy():
+    with open('/proc/loadavg', 'r') as f:
+        return f.read().strip()
+
+
+@zrodlo('pid', '⚙️  PID procesu', lambda: not _linux())
+def _pid():
+    return os.getpid()
+
+
+@zrodlo('pamiec', '💾 Entropia pamięci (/proc/meminfo)', _linux)
+def _pamiec_linux():
+    with open('/proc/meminfo', 'rb') as f:
+        return _skrot(f.read())
+
+
+@zrodlo('vm_stat', '💾 Entropia pamięci (vm_stat)',
+        lambda: sys.platform == 'darwin' and shutil.which('vm_stat') is not None)
+def _pamiec_macos():
+    import subprocess
+    wynik = subprocess.run(['vm_stat'], capture_output=True, timeout=LIMIT_CZASU, check=True)
+    return _skrot(wynik.stdout)
+
+
+@zrodlo('pliki_tmp', '📁 Entropia katalogu tymczasowego')
+def _pliki_tmp():
+    katalog = tempfile.gettempdir()
+    stan = os.stat(katalog)
+    with os.scandir(katalog) as wpisy:
+        nazwy = [wpis.name for wpis in itertools.islice(wpisy, WPISOW_TMP)]
+    return f"{stan.st_mtime_ns}:{_skrot(''.join(nazwy))}"
+
+
+@zrodlo('io', '⚡ Opóźnienie I/O (ns)')
+def _io():
+    poczatek = time.perf_counter_ns()
+    with open(os.devnull, 'w') as f:
+        f.write('test')
+    return time.perf_counter_ns() - poczatek
+
+
+@zrodlo('urandom', '🔑 os.urandom')
+def _urandom():
+    return os.urandom(32).hex()
+
+
+def dostepne_zrodla():
+    """Nazwy zarejestrowanych źródeł działających na tej platformie"""
+    return [nazwa for nazwa, (_, _, dostepne) in ZRODLA.items() if dostepne()]
+
+
+def zbierz_entropie(nazwy=None, limit_czasu=LIMIT_CZASU, szybko=False):
+    """Zbiera entropię ze źródeł równolegle, czekając najwyżej `limit_czasu` sekund
+
+    szybko=True używa tylko os.urandom (bez wątków). Źródła, które nie
+    zdążyły albo zgłosiły wyjątek, są pomijane; gdy nie zdąży żadne,
+    używany jest os.urandom. Zwraca słownik z 'hash' (sha256 hex),
+    'wartosci' {nazwa: wartość} źródeł, które weszły do hasha,
+    'czasy_ms' {nazwa: ms} i 'pominiete' {nazwa: powód}.
+    """
+    nazwy = ['urandom'] if szybko else dostepne_zrodla() if nazwy is None else list(nazwy)
+    nieznane = [nazwa for nazwa in nazwy if nazwa not in ZRODLA]
+    if nieznane:
+        raise ValueError(f"Nieznane źródło entropii: {', '.join(nieznane)} (dostępne: {', '.join(ZRODLA)})")
+
+    czasy = {}
+
+    def uruchom(nazwa):
+        poczatek = time.perf_counter()
+        try:
+            return ZRODLA[nazwa][0]()
+        finally:
+            czasy[nazwa] = round((time.perf_counter() - poczatek) * 1000, 3)
+
+    wartosci, pominiete = {}, {}
+    if len(nazwy) == 1:
+        try:
+            wartosci[nazwy[0]] = uruchom(nazwy[0])
+        except Exception as e:
+            pominiete[nazwy[0]] = f'błąd: {e}'
+    else:
+        wyniki = {}
+
+        def watek(nazwa):
+            try:
+                wyniki[nazwa] = (True, uruchom(nazwa))
+            except Exception as e:
+                wyniki[nazwa] = (False, e)
+
+        watki = [threading.Thread(target=watek, args=(nazwa,), name=f'entropia-{nazwa}', daemon=True)
+                 for nazwa in nazwy]
+        koniec = time.perf_counter() + limit_czasu
+        for w in watki:
+            w.start()
+        for w in watki:
+            w.join(max(0.0, koniec - time.perf_counter()))
+
+        gotowe = dict(wyniki)
+        for nazwa in nazwy:
+            if nazwa not in gotowe:
+                pominiete[nazwa] = 'limit czasu'
+                czasy.setdefault(nazwa, round(limit_czasu * 1000, 3))
+            elif gotowe[nazwa][0]:
+                wartosci[nazwa] = gotowe[nazwa][1]
+            else:
+                pominiete[nazwa] = f'błąd: {gotowe[nazwa][1]}'
+
+    if not wartosci:
+        wartosci['urandom'] = uruchom('urandom')
+
+    polaczone = ''.join(f'{nazwa}={wartosc};' for nazwa, wartosc in wartosci.items())
+    return {
+        'hash': hashlib.sha256(polaczone.encode()).hexdigest(),
+        'wartosci': wartosci,
+        'czasy_ms': {nazwa: czasy[nazwa] for nazwa in nazwy + ['urandom'] if nazwa in czasy},
+        'pominiete': pominiete,
+    }
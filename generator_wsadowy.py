@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Wsadowe generowanie kuponów strategiami generatora (NumPy)
+Kupon w trakcie losowania to wiersz maski (N, 49); każdy krok strategii
+dokłada liczby do wszystkich wierszy naraz, bez pętli po kuponach.
+"""
+
+import functools
+
+import numpy as np
+
+from statystyki_lotto import LICZB_W_LOSOWANIU, LICZBY
+
+# Kupony losowane w jednym kroku (ogranicza pamięć macierzy (N, 49))
+BLOK_WSADU = 1 << 16
+# Kupony w jednym strumieniu Philox przy losowaniu z ziarnem (jednostka odtwarzania)
+BLOK_STRUMIENIA = 1 << 14
+# Pierwszy blok wsadu; kolejne są dwa razy większe aż do pełnego bloku, więc
+# pojedyncze kupony i odtwarzanie nie losują całego BLOK_STRUMIENIA
+PIERWSZY_BLOK = 1 << 6
+# Tyle kolejnych rund bez kuponu spełniającego filtry kończy losowanie błędem
+MAKS_PUSTYCH_RUND = 16
+# Kolumny macierzy (N, 49): kolumna i to liczba i+1
+WSZYSTKIE = np.arange(LICZBY)
+PARZYSTE = WSZYSTKIE[1::2]
+NIEPARZYSTE = WSZYSTKIE[::2]
+
+
+def kolumny_liczb(liczby):
+    """Kolumny macierzy (N, 49) odpowiadające liczbom 1-49"""
+    return np.asarray(liczby, dtype=np.intp) - 1
+
+
+def _przelacz_losowe(rng, wybrane, kolumny, ile, stan):
+    """W każdym wierszu przełącza `ile` losowych kolumn spośród `kolumny` o stanie `stan`
+
+    Losowanie z odrzucaniem: w każdej rundzie wiersz losuje jedną kolumnę
+    i ponawia, jeśli trafił w kolumnę o innym stanie. `ile` to liczba lub
+    tablica (N,) liczb dla każdego wiersza.
+    """
+    brakuje = np.array(np.broadcast_to(ile, len(wybrane)))
+    wiersze = np.flatnonzero(brakuje)
+    while len(wiersze):
+        kolumna = kolumny[rng.integers(0, len(kolumny), size=len(wiersze))]
+        trafione = wybrane[wiersze, kolumna] == stan
+        wybrane[wiersze[trafione], kolumna[trafione]] = not stan
+        brakuje[wiersze[trafione]] -= 1
+        wiersze = wiersze[brakuje[wiersze] > 0]
+
+
+def dobierz(rng, wybrane, kolumny, ile):
+    """Dokłada do każdego wiersza `ile` różnych liczb z kolumn `kolumny` spoza już wybranych"""
+    _przelacz_losowe(rng, wybrane, kolumny, ile, False)
+
+
+def dodaj_pare(rng, wybrane):
+    """Dokłada do każdego wiersza parę kolejnych liczb (start 1-47)"""
+    wiersze = np.arange(len(wybrane))
+    start = rng.integers(0, LICZBY - 2, size=len(wybrane))
+    wybrane[wiersze, start] = True
+    wybrane[wiersze, start + 1] = True
+
+
+def wyrownaj_parzystosc(rng, wybrane, parzystych=LICZB_W_LOSOWANIU // 2):
+    """Sprowadza każdy wiersz do `parzystych` parzystych i reszty nieparzystych
+
+    Nadmiarowe liczby jednej parzystości są usuwane losowo i zastępowane
+    losowymi niewybranymi liczbami drugiej parzystości.
+    """
+    nadmiar = wybrane[:, PARZYSTE].sum(axis=1) - parzystych
+    for kolumny, ile in ((PARZYSTE, nadmiar.clip(0)), (NIEPARZYSTE, (-nadmiar).clip(0))):
+        _przelacz_losowe(rng, wybrane, kolumny, ile, True)
+    for kolumny, ile in ((NIEPARZYSTE, nadmiar.clip(0)), (PARZYSTE, (-nadmiar).clip(0))):
+        _przelacz_losowe(rng, wybrane, kolumny, ile, False)
+
+
+def losuj_pozycje(aliasy, rng, wybrane):
+    """Po jednej liczbie z tablicy aliasów każdej pozycji; powtórzenia losowane ponownie"""
+    for progi, aliasy_pozycji in aliasy:
+        do_losowania = np.arange(len(wybrane))
+        while len(do_losowania):
+            i = rng.integers(0, LICZBY, size=len(do_losowania))
+            liczba = np.where(rng.random(len(do_losowania)) < progi[i], i, aliasy_pozycji[i])
+            nowe = ~wybrane[do_losowania, liczba]
+            wybrane[do_losowania[nowe], liczba[nowe]] = True
+            do_losowania = do_losowania[~nowe]
+
+
+def dostosuj_kupon(liczby, rng=None):
+    """Lista liczb 1-49 -> kupon (6,) uint8 z 3 parzystymi i 3 nieparzystymi
+
+    rng to ziarno lub numpy.random.Generator (jak w np.random.default_rng).
+    Powtórzenia są pomijane, brakujące liczby dolosowywane, a nadmiarowe
+    losowo usuwane; parzystość wyrównuje ten sam krok co w strategiach.
+    """
+    liczby = np.unique(np.asarray(liczby, dtype=np.int64))
+    if len(liczby) and (liczby[0] < 1 or liczby[-1] > LICZBY):
+        raise ValueError("Liczby na kuponach muszą być z zakresu 1-49")
+    rng = np.random.default_rng(rng)
+    wybrane = np.zeros((1, LICZBY), dtype=bool)
+    wybrane[0, kolumny_liczb(liczby)] = True
+    nadmiar = len(liczby) - LICZB_W_LOSOWANIU
+    _przelacz_losowe(rng, wybrane, WSZYSTKIE, max(nadmiar, 0), True)
+    dobierz(rng, wybrane, WSZYSTKIE, max(-nadmiar, 0))
+    wyrownaj_parzystosc(rng, wybrane)
+    return na_kupony(wybrane)[0]
+
+
+def plany_strategii(gorace, zimne, neutralne, zalegle, ostatnie_gorace, ostatnie_zimne, aliasy):
+    """Kroki wsadowe każdej strategii: listy funkcji krok(rng, wybrane)
+
+    Kroki odpowiadają strategiom generatora pojedynczych kuponów, łącznie
+    z wyrównaniem do 3 parzystych i 3 nieparzystych (poza pozycyjną).
+    """
+    def z(liczby, ile):
+        return functools.partial(dobierz, kolumny=kolumny_liczb(liczby), ile=ile)
+
+    def reszta(ile):
+        return functools.partial(dobierz, kolumny=WSZYSTKIE, ile=ile)
+
+    aliasy = np.asarray(aliasy)
+    return {
+        'gorace': [z(gorace, 4), reszta(2), wyrownaj_parzystosc],
+        'zimne': [z(zalegle, 3), reszta(3), wyrownaj_parzystosc],
+        'mieszana': [z(gorace, 2), z(zimne, 2), z(neutralne, 2), wyrownaj_parzystosc],
+        'pozycyjna': [functools.partial(losuj_pozycje, list(zip(aliasy[:, 0], aliasy[:, 1].astype(np.intp))))],
+        'sekwencje': [dodaj_pare, reszta(4), wyrownaj_parzystosc],
+        'dziesiatki': [z(range(1, 11), 1), z(range(11, 21), 1), z(range(21, 31), 1), z(range(31, 41), 1),
+                       z(range(1, 41), 2), wyrownaj_parzystosc],
+        'ostatnie_trendy': [z(ostatnie_gorace, 3), z(ostatnie_zimne, 2), reszta(1), wyrownaj_parzystosc],
+    }
+
+
+def na_kupony(wybrane):
+    """Maska (N, 49) z sześcioma liczbami w wierszu -> posortowane kupony (N, 6) uint8"""
+    return (np.flatnonzero(wybrane) % LICZBY + 1).astype(np.uint8).reshape(-1, LICZB_W_LOSOWANIU)
+
+
+def losuj_blok(kroki, rng, wierszy):
+    """Jeden blok (wierszy, 6) kuponów wylosowanych krokami strategii z generatora rng"""
+    wybrane = np.zeros((wierszy, LICZBY), dtype=bool)
+    for krok in kroki:
+        krok(rng, wybrane)
+    return na_kupony(wybrane)
+
+
+def _w_zakresie_sumy(kupony, zakres_sumy):
+    if zakres_sumy is None:
+        return kupony
+    sumy = kupony.sum(axis=1, dtype=np.int32)
+    return np.compress((sumy >= zakres_sumy[0]) & (sumy <= zakres_sumy[1]), kupony, axis=0)
+
+
+def ziarno_korzenia(ziarno=None):
+    """SeedSequence z ziarna (liczba, SeedSequence albo None = świeża entropia systemu)"""
+    return ziarno if isinstance(ziarno, np.random.SeedSequence) else np.random.SeedSequence(ziarno)
+
+
+def rozmiar_bloku(numer, blok=BLOK_STRUMIENIA):
+    """Liczba kuponów w bloku `numer` wsadu: PIERWSZY_BLOK, dwa razy więcej, ... aż do `blok`"""
+    return min(PIERWSZY_BLOK << min(numer, blok.bit_length()), blok)
+
+
+def blok_kuponu(indeks, blok=BLOK_STRUMIENIA):
+    """(numer bloku, wiersz w bloku) kuponu numer `indeks` wsadu"""
+    numer = 0
+    while rozmiar_bloku(numer, blok) < blok:
+        if indeks < rozmiar_bloku(numer, blok):
+            return numer, indeks
+        indeks -= rozmiar_bloku(numer, blok)
+        numer += 1
+    dalej, wiersz = divmod(indeks, blok)
+    return numer + dalej, wiersz
+
+
+def strumien_bloku(korzen, numer):
+    """Generator Philox bloku `numer`: to samo co korzen.spawn(numer + 1)[numer], bez tworzenia poprzednich"""
+    return np.random.Generator(np.random.Philox(
+        np.random.SeedSequence(korzen.entropy, spawn_key=korzen.spawn_key + (numer,))))
+
+
+# Stan procesów roboczych (ustawiany raz w inicjalizatorze puli)
+_kroki = None
+
+
+def _inicjuj_proces(kroki):
+    global _kroki
+    _kroki = kroki
+
+
+def _zadanie(zadanie):
+    korzen, numer, wierszy = zadanie
+    return losuj_blok(_kroki, strumien_bloku(korzen, numer), wierszy)
+
+
+def losuj_wsad(kroki, ile, rng=None, zakres_sumy=None, procesy=1, blok=None, filtr=None):
+    """Macierz (ile, 6) uint8 kuponów wylosowanych krokami strategii
+
+    rng to ziarno (liczba, SeedSequence albo None) lub numpy.random.Generator.
+    Kupony losowane są pełnymi blokami: pierwszy ma PIERWSZY_BLOK kuponów,
+    każdy kolejny dwa razy więcej, aż do `blok` (rozmiar_bloku). Przy
+    ziarnie blok numer j ma własny strumień Philox z SeedSequence ziarna;
+    kupon i zależy więc tylko od (ziarno, strategia, blok, i), a nie od
+    `ile` ani od liczby procesów (`procesy` > 1 rozdziela bloki między
+    procesy). Generator przekazany wprost jest używany sekwencyjnie w
+    jednym procesie. Kupony z sumą spoza `zakres_sumy` (min, max) są
+    odrzucane, a brakujące dolosowywane kolejnymi blokami. Tak samo działa
+    filtr(kupony), który dostaje kolejne bloki i zwraca kupony do
+    zachowania (np. IndeksKombinacji.filtr_partii). Gdy przez
+    MAKS_PUSTYCH_RUND kolejnych rund żaden kupon nie przejdzie filtrów,
+    zgłaszany jest ValueError.
+    """
+    pula = None
+    if isinstance(rng, np.random.Generator):
+        blok = blok or BLOK_WSADU
+
+        def bloki(pierwszy, ile_blokow):
+            return [losuj_blok(kroki, rng, rozmiar_bloku(numer, blok))
+                    for numer in range(pierwszy, pierwszy + ile_blokow)]
+    else:
+        korzen = ziarno_korzenia(rng)
+        blok = blok or BLOK_STRUMIENIA
+
+        def bloki(pierwszy, ile_blokow):
+            nonlocal pula
+            zadania = [(korzen, numer, rozmiar_bloku(numer, blok)) for numer in range(pierwszy, pierwszy + ile_blokow)]
+            if procesy <= 1 or ile_blokow == 1:
+                return [losuj_blok(kroki, strumien_bloku(korzen, numer), wierszy) for _, numer, wierszy in zadania]
+            if pula is None:
+                from concurrent.futures import ProcessPoolExecutor
+                pula = ProcessPoolExecutor(max_workers=procesy, initializer=_inicjuj_proces, initargs=(kroki,))
+            return list(pula.map(_zadanie, zadania))
+
+    filtrowane = zakres_sumy is not None or filtr is not None
+    kupony = np.empty((ile, LICZB_W_LOSOWANIU), dtype=np.uint8)
+    gotowe, numer, pustych = 0, 0, 0
+    try:
+        while gotowe < ile:
+            # Runda to tyle bloków, ile brakuje kuponów (z filtrem co najmniej po bloku na proces);
+            # bloki są filtrowane po kolei, więc wynik nie zależy od podziału na rundy
+            ile_blokow, wierszy = 0, 0
+            while wierszy < ile - gotowe or (filtrowane and ile_blokow < procesy):
+                wierszy += rozmiar_bloku(numer + ile_blokow, blok)
+                ile_blokow += 1
+            przed = gotowe
+            for nowe in bloki(numer, ile_blokow):
+                nowe = _w_zakresie_sumy(nowe, zakres_sumy)
+                if filtr is not None:
+                    nowe = filtr(nowe)
+                nowe = nowe[:ile - gotowe]
+                kupony[gotowe:gotowe + len(nowe)] = nowe
+                gotowe += len(nowe)
+            numer += ile_blokow
+            pustych = pustych + 1 if gotowe == przed else 0
+            if pustych >= MAKS_PUSTYCH_RUND:
+                raise ValueError(f"Strategia nie daje kuponów spełniających filtry (zakres sumy: {zakres_sumy})")
+    finally:
+        if pula is not None:
+            pula.shutdown()
+    return kupony
+
+
+def odtworz_kupon(kroki, ziarno, indeks, blok=None):
+    """Kupon numer `indeks` wsadu losowanego z ziarnem (bez filtra sum), z jednego bloku"""
+    blok = blok or BLOK_STRUMIENIA
+    numer, wiersz = blok_kuponu(indeks, blok)
+    return losuj_blok(kroki, strumien_bloku(ziarno_korzenia(ziarno), numer), rozmiar_bloku(numer, blok))[wiersz]
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Indeks przynależności kombinacji: już wylosowane i już wydane kupony
+Bitmapa 1 bit na każdą z 13 983 816 rang kolex (ok. 1,7 MB)
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from dane_lotto import tablica_pochodna, zapisz_json, zapisz_npy
+from kombinacje import liczba_kombinacji, ranga_kolex
+from kupony_lotto import dopisz_kupony, kupony_na_rangi, otworz_rangi
+
+KOMBINACJI = liczba_kombinacji(6)
+ROZMIAR_BITMAPY = (KOMBINACJI + 7) // 8
+
+
+def pusta_bitmapa():
+    return np.zeros(ROZMIAR_BITMAPY, dtype=np.uint8)
+
+
+def _dodaj_posortowane(bitmapa, rangi):
+    bajty = rangi >> 3
+    pierwsze = np.flatnonzero(np.concatenate(([True], bajty[1:] != bajty[:-1])))
+    bitmapa[bajty[pierwsze]] |= np.bitwise_or.reduceat((1 << (rangi & 7)).astype(np.uint8), pierwsze)
+
+
+def dodaj_rangi(bitmapa, rangi):
+    """Ustawia w bitmapie (w miejscu) bity podanych rang
+
+    Rangi są sortowane, a bity rang z tego samego bajtu łączone przez
+    np.bitwise_or.reduceat, więc każdy bajt jest zapisywany raz.
+    """
+    rangi = np.sort(np.asarray(rangi, dtype=np.int64).ravel())
+    if len(rangi):
+        _dodaj_posortowane(bitmapa, rangi)
+    return bitmapa
+
+
+def zawiera(bitmapa, rangi):
+    """Dla każdej rangi: czy jej bit jest ustawiony (O(1) na zapytanie)"""
+    rangi = np.asarray(rangi, dtype=np.int64)
+    return ((bitmapa[rangi >> 3] >> (rangi & 7).astype(np.uint8)) & 1).astype(bool)
+
+
+def ustaw_nowe(bitmapa, rangi):
+    """Test-and-set: maska rang, których bitu nie było w bitmapie; ich bity są ustawiane
+
+    Z rang powtórzonych w obrębie wywołania nowe jest tylko pierwsze
+    wystąpienie. Powtórzenia są szukane wyłącznie wśród rang spoza
+    bitmapy; permutacja sortująca jest liczona tylko, gdy jakieś są, i
+    wskazuje wiersze grup równych rang.
+    """
+    rangi = np.asarray(rangi, dtype=np.int64)
+    nowe = ~zawiera(bitmapa, rangi)
+    kandydaci = np.flatnonzero(nowe)
+    posortowane = np.sort(rangi[kandydaci])
+    rowne = posortowane[1:] == posortowane[:-1]
+    if rowne.any():
+        w_grupie = np.concatenate(([False], rowne)) | np.concatenate((rowne, [False]))
+        podejrzane = np.sort(kandydaci[np.argsort(rangi[kandydaci])[w_grupie]])
+        _, pierwsze = np.unique(rangi[podejrzane], return_index=True)
+        nowe[podejrzane] = False
+        nowe[podejrzane[pierwsze]] = True
+    if len(posortowane):
+        _dodaj_posortowane(bitmapa, posortowane)
+    return nowe
+
+
+def bitmapa_wylosowanych(historia):
+    """Bitmapa kombinacji, które padły w historii (w cache historii, dopisywana przyrostowo)"""
+    def oblicz(h):
+        return dodaj_rangi(pusta_bitmapa(), ranga_kolex(h.liczby))
+
+    def dopisz(bitmapa, nowe):
+        return dodaj_rangi(bitmapa, ranga_kolex(nowe.liczby))
+
+    return tablica_pochodna(historia, 'bitmapa_wylosowanych', oblicz, dopisz)
+
+
+def _hash_rang(rangi):
+    return hashlib.sha256(np.ascontiguousarray(rangi).tobytes()).hexdigest()
+
+
+def bitmapa_wydanych(plik_wydanych):
+    """Bitmapa kuponów zapisanych w pliku .kup
+
+    Obok pliku trzymana jest gotowa bitmapa z liczbą kuponów, które
+    obejmuje. Jest ważna bez sprawdzania, dopóki zgadza się rozmiar i czas
+    modyfikacji pliku; w przeciwnym razie porównywany jest hash objętych
+    rang - gdy się zgadza (plik tylko dopisany), dokładane są wyłącznie
+    nowe kupony, a gdy nie, bitmapa jest budowana od nowa.
+    """
+    if not os.path.exists(plik_wydanych):
+        return pusta_bitmapa()
+
+    rangi = otworz_rangi(plik_wydanych)
+    stat = os.stat(plik_wydanych)
+    sciezka = f'{plik_wydanych}.bitmapa.npy'
+    sciezka_meta = f'{plik_wydanych}.bitmapa.json'
+    try:
+        with open(sciezka_meta, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        objete = meta['kuponow']
+        if meta['rozmiar'] == stat.st_size and meta['mtime_ns'] == stat.st_mtime_ns and objete == len(rangi):
+            aktualna = True
+        elif objete <= len(rangi) and meta['sha256'] == _hash_rang(rangi[:objete]):
+            aktualna = False
+        else:
+            raise ValueError
+        bitmapa = np.load(sciezka)
+        if len(bitmapa) != ROZMIAR_BITMAPY:
+            raise ValueError
+        if aktualna:
+            return bitmapa
+    except (OSError, ValueError, KeyError, TypeError):
+        objete, bitmapa = 0, pusta_bitmapa()
+
+    dodaj_rangi(bitmapa, rangi[objete:])
+    try:
+        # meta.json na końcu: po przerwanym zapisie hash objętych rang nie pasuje
+        # albo bitmapa ma tylko nadmiarowe bity kuponów, które i tak są dokładane
+        zapisz_npy(sciezka, bitmapa)
+        zapisz_json(sciezka_meta, {
+            'kuponow': len(rangi),
+            'rozmiar': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': _hash_rang(rangi),
+        })
+    except OSError:
+        pass
+    return bitmapa
+
+
+class IndeksKombinacji:
+    """Zbiór kombinacji do pominięcia: wylosowane w historii i/lub już wydane"""
+
+    def __init__(self, historia=None, plik_wydanych=None):
+        self.plik_wydanych = plik_wydanych
+        self.bitmapa = pusta_bitmapa()
+        if historia is not None:
+            self.bitmapa |= bitmapa_wylosowanych(historia)
+        if plik_wydanych is not None:
+            self.bitmapa |= bitmapa_wydanych(plik_wydanych)
+
+    def zawiera(self, kupony):
+        """Maska bool: które kupony (macierz (N, 6)) są w indeksie"""
+        return zawiera(self.bitmapa, kupony_na_rangi(kupony))
+
+    def odfiltruj(self, kupony):
+        """Kupony spoza indeksu, bez powtórzeń w obrębie partii (kolejność zachowana)"""
+        kupony = np.asarray(kupony)
+        return kupony[ustaw_nowe(self.bitmapa.copy(), kupony_na_rangi(kupony))]
+
+    def filtr_partii(self):
+        """Filtr kolejnych bloków jednej partii kuponów (dla losuj_wsad)
+
+        Przepuszcza kupony spoza indeksu i bez powtórzeń w całej partii
+        (także między blokami): jeden test-and-set na kopii bitmapy na
+        blok. Kupony muszą być posortowane (jak z losuj_wsad), bo rangi
+        liczone są bez sprawdzania. Sam indeks się nie zmienia - wydane
+        kupony zapisuje dopiero dodaj_wydane.
+        """
+        bitmapa = self.bitmapa.copy()
+
+        def filtr(kupony):
+            return np.compress(ustaw_nowe(bitmapa, ranga_kolex(kupony)), kupony, axis=0)
+        return filtr
+
+    def dodaj_wydane(self, kupony):
+        """Zapisuje kupony jako wydane (w pliku .kup, jeśli podano) i dodaje do indeksu"""
+        rangi = kupony_na_rangi(kupony)
+        dodaj_rangi(self.bitmapa, rangi)
+        if self.plik_wydanych is not None:
+            dopisz_kupony(self.plik_wydanych, kupony)
+
+    def __len__(self):
+        return int(np.unpackbits(self.bitmapa).sum())
@@ -3,204 +3,125 @@
 Generator liczb lotto oparty na analizie statystycznej
 """
 
-import random
-import numpy as np
+import argparse
 from collections import Counter
 from datetime import datetime
 
+from dane_lotto import SCIEZKA_HISTORII, wczytaj_historie
+from generator_wsadowy import dostosuj_kupon, losuj_wsad, odtworz_kupon, plany_strategii, ziarno_korzenia
+from statystyki_lotto import (aliasy_pozycji, gorace_zimne, macierz_pozycyjna_historii, przerwy_historii,
+                              skumulowane_czestotliwosci)
+
+# Strategie losowania kompletnego: (nazwa, nagłówek, strategia wsadowa)
+STRATEGIE_KOMPLETNE = [
+    ("Gorące liczby", "🔥 STRATEGIA: Liczby gorące", 'gorace'),
+    ("Zimne liczby", "❄️ STRATEGIA: Liczby zimne (wyrównanie)", 'zimne'),
+    ("Mieszana", "🎯 STRATEGIA: Mieszana (gorące + zimne)", 'mieszana'),
+    ("Pozycyjna", "📊 STRATEGIA: Pozycyjna", 'pozycyjna'),
+    ("Z sekwencjami", "🔗 STRATEGIA: Z sekwencjami", 'sekwencje'),
+    ("Równomierne dziesiątki", "🔢 STRATEGIA: Równomierne dziesiątki", 'dziesiatki'),
+]
+
 class InteligentnyGeneratorLotto:
     
-    def __init__(self):
-        # Dane z analizy - liczby gorące i zimne
-        self.liczby_gorace = [17, 21, 34, 38, 24, 27, 4, 6, 25, 13]
-        self.liczby_zimne = [48, 43, 47, 12, 44, 33, 35, 23, 16, 39]
+    def __init__(self, plik_historii=SCIEZKA_HISTORII, wyklucz_wylosowane=False, plik_wydanych=None,
+                 okno_trendow=100):
+        # Dane z analizy - liczby gorące i zimne liczone z historii losowań
+        historia = wczytaj_historie(plik_historii)
+        
+        # Indeks kombinacji do pominięcia (już wylosowane / już wydane)
+        self.indeks = None
+        if wyklucz_wylosowane or plik_wydanych:
+            from indeks_kombinacji import IndeksKombinacji
+            self.indeks = IndeksKombinacji(historia if wyklucz_wylosowane else None, plik_wydanych)
+        skumulowane = skumulowane_czestotliwosci(historia.liczby)
+        self.liczby_gorace, self.liczby_zimne = gorace_zimne(skumulowane)
         self.liczby_neutralne = [i for i in range(1, 50) if i not in self.liczby_gorace and i not in self.liczby_zimne]
+        # Liczby najdłużej czekające na wylosowanie
+        self.liczby_zalegle = przerwy_historii(historia).zalegle()
+        # Rozkład liczb na pozycjach posortowanego losowania (tablice aliasów)
+        self.aliasy_pozycji = aliasy_pozycji(macierz_pozycyjna_historii(historia))
+        # Gorące i zimne z ostatnich `okno_trendow` losowań
+        self.ostatnie_gorace, self.ostatnie_zimne = gorace_zimne(
+            skumulowane, max(0, len(historia) - okno_trendow))
+        # Strategie w wersji wsadowej (NumPy)
+        self.plany_wsadowe = plany_strategii(self.liczby_gorace, self.liczby_zimne, self.liczby_neutralne,
+                                             self.liczby_zalegle, self.ostatnie_gorace, self.ostatnie_zimne,
+                                             self.aliasy_pozycji)
         
         # Statystyki z analizy
         self.suma_min = 120
         self.suma_max = 180
         self.suma_srednia = 149
+    
+    def generate_batch(self, strategy, n, rng=None, zakres_sumy=None, procesy=1):
+        """Macierz (n, 6) uint8 posortowanych kuponów strategii losowanych wsadowo
         
-        # Przedziały dziesiątek (41-49 rzadziej)
-        self.przedzial_1_10 = list(range(1, 11))
-        self.przedzial_11_20 = list(range(11, 21))
-        self.przedzial_21_30 = list(range(21, 31))
-        self.przedzial_31_40 = list(range(31, 41))
-        self.przedzial_41_49 = list(range(41, 50))
+        Strategie jak w InteligentnyLottoGenerator (gorace, zimne, mieszana,
+        pozycyjna, sekwencje, dziesiatki, ostatnie_trendy); przy ziarnie
+        wynik nie zależy od liczby procesów. Z indeksem wykluczeń kupony
+        z indeksu i powtórzenia są pomijane, a brakujące dolosowywane.
+        """
+        filtr = self.indeks.filtr_partii() if self.indeks is not None else None
+        return losuj_wsad(self._plan(strategy), n, rng, zakres_sumy, procesy, filtr=filtr)
     
-    def generuj_strategia_gorace(self):
+    def replay_ticket(self, strategy, seed, index):
+        """Odtwarza kupon numer `index` z generate_batch(strategy, n, seed) (bez zakresu sum i indeksu)"""
+        return odtworz_kupon(self._plan(strategy), seed, index)
+    
+    def _plan(self, strategy):
+        if strategy not in self.plany_wsadowe:
+            raise ValueError(f"Nieznana strategia: {strategy} (dostępne: {', '.join(self.plany_wsadowe)})")
+        return self.plany_wsadowe[strategy]
+    
+    def generuj_strategia_gorace(self, ziarno=None):
         """Strategia oparta na liczbach gorących"""
-        print("🔥 STRATEGIA: Liczby gorące")
-        
-        liczby = []
-        
-        # 4 liczby z gorących
-        liczby.extend(random.sample(self.liczby_gorace, 4))
-        
-        # 2 liczby z neutralnych/zimnych
-        pozostale = [i for i in range(1, 50) if i not in liczby]
-        liczby.extend(random.sample(pozostale, 2))
-        
-        return self._dostosuj_do_kryteriow(liczby)
+        return self.generate_batch('gorace', 1, ziarno)[0].tolist()
     
-    def generuj_strategia_zimne(self):
+    def generuj_strategia_zimne(self, ziarno=None):
         """Strategia oparta na liczbach zimnych (teoria wyrównania)"""
-        print("❄️ STRATEGIA: Liczby zimne (wyrównanie)")
-        
-        liczby = []
-        
-        # 3 liczby z zimnych
-        liczby.extend(random.sample(self.liczby_zimne, 3))
-        
-        # 3 liczby z pozostałych
-        pozostale = [i for i in range(1, 50) if i not in liczby]
-        liczby.extend(random.sample(pozostale, 3))
-        
-        return self._dostosuj_do_kryteriow(liczby)
+        return self.generate_batch('zimne', 1, ziarno)[0].tolist()
     
-    def generuj_strategia_mieszana(self):
+    def generuj_strategia_mieszana(self, ziarno=None):
         """Strategia mieszana (50/50 gorące/zimne)"""
-        print("🎯 STRATEGIA: Mieszana (gorące + zimne)")
-        
-        liczby = []
-        
-        # 2 gorące
-        liczby.extend(random.sample(self.liczby_gorace, 2))
-        
-        # 2 zimne
-        liczby.extend(random.sample(self.liczby_zimne, 2))
-        
-        # 2 neutralne
-        liczby.extend(random.sample(self.liczby_neutralne, 2))
-        
-        return self._dostosuj_do_kryteriow(liczby)
+        return self.generate_batch('mieszana', 1, ziarno)[0].tolist()
     
-    def generuj_strategia_pozycyjna(self):
+    def generuj_strategia_pozycyjna(self, ziarno=None):
         """Strategia oparta na analizie pozycyjnej"""
-        print("📊 STRATEGIA: Pozycyjna")
-        
-        liczby = []
-        
-        # Pozycja 1: małe liczby (1-15)
-        liczby.append(random.choice(range(1, 16)))
-        
-        # Pozycja 2: średnie-małe (10-25)
-        liczby.append(random.choice([x for x in range(10, 26) if x not in liczby]))
-        
-        # Pozycja 3: średnie (15-35)
-        liczby.append(random.choice([x for x in range(15, 36) if x not in liczby]))
-        
-        # Pozycja 4: średnie-duże (20-40)
-        liczby.append(random.choice([x for x in range(20, 41) if x not in liczby]))
-        
-        # Pozycja 5: duże (30-45)
-        liczby.append(random.choice([x for x in range(30, 46) if x not in liczby]))
-        
-        # Pozycja 6: bardzo duże (35-49)
-        liczby.append(random.choice([x for x in range(35, 50) if x not in liczby]))
-        
-        return sorted(liczby)
+        return self.generate_batch('pozycyjna', 1, ziarno)[0].tolist()
     
-    def generuj_strategia_sekwencje(self):
+    def generuj_strategia_sekwencje(self, ziarno=None):
         """Strategia z uwzględnieniem sekwencji"""
-        print("🔗 STRATEGIA: Z sekwencjami")
-        
-        liczby = []
-        
-        # Dodaj jedną parę kolejnych liczb (49.9% losowań ma sekwencje)
-        start_sekwencji = random.randint(1, 47)
-        liczby.extend([start_sekwencji, start_sekwencji + 1])
-        
-        # Dodaj 4 pozostałe liczby
-        pozostale = [i for i in range(1, 50) if i not in liczby]
-        liczby.extend(random.sample(pozostale, 4))
-        
-        return self._dostosuj_do_kryteriow(liczby)
+        return self.generate_batch('sekwencje', 1, ziarno)[0].tolist()
     
-    def generuj_strategia_dziesiatki(self):
+    def generuj_strategia_dziesiatki(self, ziarno=None):
         """Strategia z równomiernym rozkładem dziesiątek"""
-        print("🔢 STRATEGIA: Równomierne dziesiątki")
-        
-        liczby = []
-        
-        # Po jednej z każdego przedziału (oprócz 41-49)
-        liczby.append(random.choice(self.przedzial_1_10))
-        liczby.append(random.choice(self.przedzial_11_20))
-        liczby.append(random.choice(self.przedzial_21_30))
-        liczby.append(random.choice(self.przedzial_31_40))
-        
-        # Ostatnie 2 z dowolnych przedziałów
-        wszystkie_oproc_41_49 = (self.przedzial_1_10 + self.przedzial_11_20 + 
-                                self.przedzial_21_30 + self.przedzial_31_40)
-        dostepne = [x for x in wszystkie_oproc_41_49 if x not in liczby]
-        liczby.extend(random.sample(dostepne, 2))
-        
-        return self._dostosuj_do_kryteriow(liczby)
+        return self.generate_batch('dziesiatki', 1, ziarno)[0].tolist()
     
-    def _dostosuj_do_kryteriow(self, liczby):
-        """Dostosowuje liczby do kryteriów statystycznych"""
-        liczby = list(set(liczby))  # usuń duplikaty
-        
-        # Upewnij się, że mamy 6 liczb
-        while len(liczby) < 6:
-            nowa = random.randint(1, 49)
-            if nowa not in liczby:
-                liczby.append(nowa)
-        
-        if len(liczby) > 6:
-            liczby = random.sample(liczby, 6)
-        
-        # Dostosuj do 3 parzystych + 3 nieparzystych
-        parzyste = [x for x in liczby if x % 2 == 0]
-        nieparzyste = [x for x in liczby if x % 2 == 1]
-        
-        if len(parzyste) != 3:
-            # Skoryguj proporcje
-            if len(parzyste) > 3:
-                # Za dużo parzystych
-                nadmiar = len(parzyste) - 3
-                do_usuniecia = random.sample(parzyste, nadmiar)
-                for x in do_usuniecia:
-                    liczby.remove(x)
-                    # Dodaj nieparzystą
-                    while True:
-                        nowa = random.choice([i for i in range(1, 50, 2) if i not in liczby])
-                        liczby.append(nowa)
-                        break
-            else:
-                # Za mało parzystych
-                brakuje = 3 - len(parzyste)
-                do_usuniecia = random.sample(nieparzyste, brakuje)
-                for x in do_usuniecia:
-                    liczby.remove(x)
-                    # Dodaj parzystą
-                    while True:
-                        nowa = random.choice([i for i in range(2, 50, 2) if i not in liczby])
-                        liczby.append(nowa)
-                        break
-        
-        return sorted(liczby)
+    def _dostosuj_do_kryteriow(self, liczby, ziarno=None):
+        """Dostosowuje liczby do kryteriów statystycznych (6 różnych, 3 parzyste i 3 nieparzyste)"""
+        return dostosuj_kupon(liczby, ziarno).tolist()
     
-    def generuj_losowanie_kompletne(self):
-        """Generuje kompletne losowanie ze wszystkimi strategiami"""
+    def generuj_losowanie_kompletne(self, ziarno=None):
+        """Generuje kompletne losowanie ze wszystkimi strategiami
+        
+        Każda strategia losuje z własnego strumienia SeedSequence ziarna
+        (liczba albo None = świeża entropia systemu), więc wypisane ziarno
+        odtwarza wszystkie zestawy.
+        """
+        korzen = ziarno_korzenia(ziarno)
         print("=" * 60)
         print("🎲 INTELIGENTNY GENERATOR LOTTO")
         print(f"📅 {datetime.now().strftime('%d.%m.%Y %H:%M')}")
+        print(f"🔁 Ziarno: {korzen.entropy}")
         print("=" * 60)
         
-        strategie = [
-            ("Gorące liczby", self.generuj_strategia_gorace),
-            ("Zimne liczby", self.generuj_strategia_zimne),
-            ("Mieszana", self.generuj_strategia_mieszana),
-            ("Pozycyjna", self.generuj_strategia_pozycyjna),
-            ("Z sekwencjami", self.generuj_strategia_sekwencje),
-            ("Równomierne dziesiątki", self.generuj_strategia_dziesiatki)
-        ]
-        
         wyniki = {}
         
-        for nazwa, funkcja in strategie:
-            liczby = funkcja()
+        for (nazwa, naglowek, strategia), strumien in zip(STRATEGIE_KOMPLETNE,
+                                                         korzen.spawn(len(STRATEGIE_KOMPLETNE))):
+            print(naglowek)
+            liczby = self._generuj_spoza_indeksu(strategia, strumien)
             suma = sum(liczby)
             parzyste = sum(1 for x in liczby if x % 2 == 0)
             
@@ -235,6 +156,13 @@ class InteligentnyGeneratorLotto:
         
         return wyniki
     
+    def _generuj_spoza_indeksu(self, strategia, ziarno):
+        """Pierwszy zestaw wsadu strategii z ziarna spoza indeksu wykluczeń (zapisany jako wydany)"""
+        liczby = self.generate_batch(strategia, 1, ziarno)
+        if self.indeks is not None:
+            self.indeks.dodaj_wydane(liczby)
+        return liczby[0].tolist()
+    
     def _znajdz_sekwencje(self, liczby):
         """Znajduje sekwencje w liczbach"""
         liczby = sorted(liczby)
@@ -251,9 +179,15 @@ class InteligentnyGeneratorLotto:
         
         return sekwencje
 
-def main():
-    generator = InteligentnyGeneratorLotto()
-    wyniki = generator.generuj_losowanie_kompletne()
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inteligentny generator lotto - wszystkie strategie")
+    parser.add_argument('--historia', default=SCIEZKA_HISTORII, help="plik CSV z historią losowań")
+    parser.add_argument('--ziarno', type=int,
+                        help="ziarno (wypisywane przy każdym uruchomieniu) - odtwarza wszystkie zestawy")
+    args = parser.parse_args(argv)
+    
+    generator = InteligentnyGeneratorLotto(args.historia)
+    wyniki = generator.generuj_losowanie_kompletne(args.ziarno)
     
     print("\n" + "="*60)
     print("📈 STATYSTYKI WYGENEROWANYCH ZESTAWÓW:")
@@ -272,7 +206,7 @@ def main():
     for liczba, freq in czestotliwosc.most_common(10):
         print(f"  {liczba}: {freq} razy")
     
-    print(f"\nŚrednia suma wygenerowanych zestawów: {np.mean(wszystkie_sumy):.1f}")
+    print(f"\nŚrednia suma wygenerowanych zestawów: {sum(wszystkie_sumy) / len(wszystkie_sumy):.1f}")
     print(f"Zakres sum: {min(wszystkie_sumy)} - {max(wszystkie_sumy)}")
 
 if __name__ == "__main__":
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Numeracja kombinacji liczb 1-49 (ranga w porządku koleksykograficznym)
+"""
+
+import itertools
+import math
+
+import numpy as np
+
+LICZBY = 49
+
+# DWUMIANY[n, k] = C(n, k) dla n = 0..49 i k = 0..6
+DWUMIANY = np.array([[math.comb(n, k) for k in range(7)] for n in range(LICZBY + 1)], dtype=np.int64)
+# Kolumny DWUMIANY jako ciągłe tablice: KOLUMNY_DWUMIANOW[k][n] = C(n, k)
+KOLUMNY_DWUMIANOW = [np.ascontiguousarray(DWUMIANY[:, k]) for k in range(7)]
+
+
+def liczba_kombinacji(k):
+    """Ile jest k-elementowych podzbiorów liczb 1-49"""
+    return math.comb(LICZBY, k)
+
+
+def ranga_kolex(kombinacje):
+    """Ranga koleksykograficzna posortowanych rosnąco kombinacji (..., k)
+
+    Dla liczb x1 < x2 < ... < xk ranga to suma C(xi - 1, i), czyli liczba
+    od 0 do C(49, k) - 1.
+    """
+    kombinacje = np.asarray(kombinacje)
+    ranga = np.zeros(kombinacje.shape[:-1], dtype=np.int64)
+    for i in range(kombinacje.shape[-1]):
+        ranga += KOLUMNY_DWUMIANOW[i + 1].take(kombinacje[..., i].astype(np.intp) - 1)
+    return ranga
+
+
+def z_rangi_kolex(rangi, k):
+    """Odwrotność ranga_kolex: macierz (N, k) posortowanych liczb 1-49"""
+    reszta = np.array(rangi, dtype=np.int64, ndmin=1)
+    kombinacje = np.empty((len(reszta), k), dtype=np.uint8)
+    for i in range(k, 0, -1):
+        # Największe x z C(x, i) <= reszta (kolumna dwumianów jest niemalejąca)
+        x = np.searchsorted(DWUMIANY[:, i], reszta, side='right') - 1
+        kombinacje[:, i - 1] = x + 1
+        reszta -= DWUMIANY[x, i]
+    return kombinacje
+
+
+def podzbiory_losowan(liczby, k):
+    """Wszystkie k-elementowe podzbiory każdego losowania: tablica (N, C(6, k), k)"""
+    liczby = np.asarray(liczby)
+    pozycje = np.array(list(itertools.combinations(range(liczby.shape[1]), k)))
+    return liczby[:, pozycje]
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Zwarty zapis kuponów: każdy kupon 6 z 49 jako ranga kolex uint32 (4 bajty)
+"""
+
+import os
+import struct
+
+import numpy as np
+
+from kombinacje import ranga_kolex, z_rangi_kolex
+
+# Nagłówek pliku .kup: magia, wersja, liczb na kuponie, zarezerwowane, liczba kuponów
+MAGIA = b'LOTTOKUP'
+WERSJA_PLIKU = 1
+NAGLOWEK = struct.Struct('<8sHHIQ8x')
+DTYPE_RANGI = np.dtype('<u4')
+
+# Tyle kuponów naraz oddaje iteruj_kupony
+BLOK_KUPONOW = 1 << 20
+
+
+def sprawdz_kupony(kupony):
+    """Zwraca kupony jako posortowaną macierz (T, 6) uint8 albo zgłasza ValueError"""
+    kupony = np.asarray(kupony, dtype=np.int64)
+    if kupony.ndim != 2 or kupony.shape[1] != 6:
+        raise ValueError(f"Kupony muszą być macierzą (T, 6), a nie {kupony.shape}")
+    kupony = np.sort(kupony, axis=1)
+    if kupony.size and (kupony.min() < 1 or kupony.max() > 49):
+        raise ValueError("Liczby na kuponach muszą być z zakresu 1-49")
+    if np.any(np.diff(kupony, axis=1) == 0):
+        raise ValueError("Liczby na kuponie nie mogą się powtarzać")
+    return kupony.astype(np.uint8)
+
+
+def kupony_na_rangi(kupony):
+    """Macierz (N, 6) liczb 1-49 -> tablica rang uint32 (kolejność liczb dowolna)
+
+    Liczby spoza 1-49 i powtórzone na kuponie dają ValueError (sprawdz_kupony).
+    """
+    return ranga_kolex(sprawdz_kupony(kupony)).astype(np.uint32)
+
+
+def rangi_na_kupony(rangi):
+    """Tablica rang -> macierz (N, 6) uint8 posortowanych liczb"""
+    return z_rangi_kolex(np.asarray(rangi, dtype=np.int64), 6)
+
+
+def _czytaj_naglowek(f):
+    dane = f.read(NAGLOWEK.size)
+    if len(dane) != NAGLOWEK.size:
+        raise ValueError("Plik kuponów jest za krótki")
+    magia, wersja, k, _, liczba = NAGLOWEK.unpack(dane)
+    if magia != MAGIA or wersja != WERSJA_PLIKU or k != 6:
+        raise ValueError("Nieznany format pliku kuponów")
+    return liczba
+
+
+def zapisz_kupony(plik, kupony):
+    """Zapisuje kupony (macierz (N, 6)) do nowego pliku .kup"""
+    rangi = kupony_na_rangi(kupony)
+    tymczasowy = f'{plik}.{os.getpid()}.tmp'
+    with open(tymczasowy, 'wb') as f:
+        f.write(NAGLOWEK.pack(MAGIA, WERSJA_PLIKU, 6, 0, len(rangi)))
+        f.write(rangi.astype(DTYPE_RANGI).tobytes())
+    os.replace(tymczasowy, plik)
+    return len(rangi)
+
+
+def dopisz_kupony(plik, kupony):
+    """Dopisuje kupony na końcu pliku .kup (tworzy plik, gdy go nie ma)
+
+    Dane trafiają za ostatni zapisany kupon, a licznik w nagłówku jest
+    aktualizowany na końcu, więc przerwane dopisywanie nie psuje pliku.
+    Zwraca łączną liczbę kuponów w pliku.
+    """
+    if not os.path.exists(plik):
+        return zapisz_kupony(plik, kupony)
+
+    rangi = kupony_na_rangi(kupony)
+    with open(plik, 'r+b') as f:
+        liczba = _czytaj_naglowek(f)
+        f.seek(NAGLOWEK.size + liczba * DTYPE_RANGI.itemsize)
+        f.write(rangi.astype(DTYPE_RANGI).tobytes())
+        f.truncate()
+        f.flush()
+        f.seek(0)
+        f.write(NAGLOWEK.pack(MAGIA, WERSJA_PLIKU, 6, 0, liczba + len(rangi)))
+    return liczba + len(rangi)
+
+
+def otworz_rangi(plik):
+    """Rangi kuponów z pliku .kup jako np.memmap tylko do odczytu"""
+    with open(plik, 'rb') as f:
+        liczba = _czytaj_naglowek(f)
+    if liczba == 0:
+        return np.empty(0, dtype=DTYPE_RANGI)
+    return np.memmap(plik, dtype=DTYPE_RANGI, mode='r', offset=NAGLOWEK.size, shape=(liczba,))
+
+
+def wczytaj_kupony(plik):
+    """Wszystkie kupony z pliku .kup jako macierz (N, 6) uint8"""
+    return rangi_na_kupony(otworz_rangi(plik))
+
+
+def iteruj_kupony(plik, blok=BLOK_KUPONOW):
+    """Kupony z pliku .kup blokami (macierze (<=blok, 6)) przy stałym zużyciu pamięci"""
+    rangi = otworz_rangi(plik)
+    for poczatek in range(0, len(rangi), blok):
+        yield rangi_na_kupony(rangi[poczatek:poczatek + blok])
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Wspólny punkt wejścia: generate, analyze, report, plot, backtest
+Każde polecenie importuje tylko potrzebne moduły, więc pandas, matplotlib
+i scipy ładują się dopiero wtedy, gdy polecenie ich używa.
+"""
+
+import argparse
+import importlib
+import sys
+import time
+
+START = time.perf_counter()
+
+# Biblioteki, których załadowanie raportuje --import-time
+CIEZKIE_MODULY = ('numpy', 'pandas', 'matplotlib', 'seaborn', 'scipy')
+
+# Czasy importu modułów poleceń (nazwa, sekundy)
+czasy_importu = []
+
+
+def importuj(nazwa):
+    """Importuje moduł polecenia i zapisuje czas importu"""
+    poczatek = time.perf_counter()
+    modul = importlib.import_module(nazwa)
+    czasy_importu.append((nazwa, time.perf_counter() - poczatek))
+    return modul
+
+
+def argumenty_historii(args):
+    return () if args.historia is None else (args.historia,)
+
+
+def polecenie_generate(args):
+    argv = ['--json'] if args.json else ['--quiet'] if args.quiet else []
+    if args.szybka_entropia:
+        argv.append('--szybka-entropia')
+    if args.ziarno is not None:
+        argv += ['--ziarno', args.ziarno]
+    if args.historia is not None:
+        argv += ['--historia', args.historia]
+    return importuj('lotto_generator').main(argv)
+
+
+def polecenie_analyze(args):
+    return importuj('analiza_lotto').main(*argumenty_historii(args))
+
+
+def polecenie_report(args):
+    return importuj('szczegolowa_analiza_lotto').main(*argumenty_historii(args))
+
+
+def polecenie_plot(args):
+    dane_lotto = importuj('dane_lotto')
+    wykresy_lotto = importuj('wykresy_lotto')
+    historia = dane_lotto.wczytaj_historie(*argumenty_historii(args))
+    for nazwa, (plik, narysowany) in wykresy_lotto.generuj_wykresy(
+            historia, args.katalog, procesy=args.procesy, dpi=args.dpi, wymus=args.wymus).items():
+        print(f"{plik}{'' if narysowany else ' (bez zmian)'}")
+
+
+def polecenie_backtest(args):
+    argv = list(args.argumenty)
+    if args.historia is not None:
+        argv += ['--historia', args.historia]
+    return importuj('backtest_lotto').main(argv)
+
+
+def raport_importow():
+    """Wypisuje na stderr czasy importu i załadowane ciężkie biblioteki"""
+    print(f"⏱️  Start do końca: {(time.perf_counter() - START) * 1000:.1f} ms", file=sys.stderr)
+    for nazwa, czas in czasy_importu:
+        print(f"   import {nazwa}: {czas * 1000:.1f} ms", file=sys.stderr)
+    zaladowane = [nazwa for nazwa in CIEZKIE_MODULY if nazwa in sys.modules]
+    print(f"   załadowane biblioteki: {', '.join(zaladowane) or 'brak'}", file=sys.stderr)
+
+
+def main(argv=None):
+    """Punkt wejścia CLI"""
+    parser = argparse.ArgumentParser(description="Generator i analiza wyników lotto")
+    parser.add_argument('--historia', help="plik CSV z historią losowań")
+    parser.add_argument('--import-time', action='store_true',
+                        help="wypisz na stderr czasy importu i załadowane biblioteki")
+    polecenia = parser.add_subparsers(dest='polecenie', required=True)
+
+    generate = polecenia.add_parser('generate', help="wygeneruj liczby")
+    tryb = generate.add_mutually_exclusive_group()
+    tryb.add_argument('--json', action='store_true', help="bez opóźnień, jeden obiekt JSON na stdout")
+    tryb.add_argument('--quiet', action='store_true', help="bez opóźnień, tylko liczby na stdout")
+    generate.add_argument('--szybka-entropia', action='store_true', help="entropia tylko z os.urandom")
+    generate.add_argument('--ziarno', metavar='HASH', help="odtwórz zestaw z hasha entropii (hex)")
+    generate.set_defaults(funkcja=polecenie_generate)
+    polecenia.add_parser('analyze', help="podstawowa analiza historii").set_defaults(funkcja=polecenie_analyze)
+    polecenia.add_parser('report', help="szczegółowy raport z wykresami").set_defaults(funkcja=polecenie_report)
+
+    wykresy = polecenia.add_parser('plot', help="narysuj wykresy do katalogu")
+    wykresy.add_argument('--katalog', default='wykresy', help="katalog na pliki PNG")
+    wykresy.add_argument('--procesy', type=int, help="liczba procesów rysujących (domyślnie tyle ile rdzeni)")
+    wykresy.add_argument('--dpi', type=int, default=150, help="rozdzielczość wykresów")
+    wykresy.add_argument('--wymus', action='store_true', help="rysuj także niezmienione wykresy")
+    wykresy.set_defaults(funkcja=polecenie_plot)
+
+    backtest = polecenia.add_parser('backtest', help="backtest kuponów (argumenty jak w backtest_lotto.py)",
+                                    add_help=False)
+    backtest.set_defaults(funkcja=polecenie_backtest)
+
+    # Argumenty backtestu przekazywane są dalej bez zmian
+    args, reszta = parser.parse_known_args(argv)
+    if reszta and args.polecenie != 'backtest':
+        parser.error(f"nieznane argumenty: {' '.join(reszta)}")
+    args.argumenty = reszta
+    try:
+        args.funkcja(args)
+    finally:
+        if args.import_time:
+            raport_importow()
+
+
+if __name__ == "__main__":
+    main()
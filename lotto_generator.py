@@ -4,28 +4,60 @@ Inteligentny generator liczb lotto oparty na analizie statystycznej i entropii
 Generuje 6 liczb z zakresu 1-49 używając różnych strategii eksperckkich
 """
 
-import random
+import argparse
+import json
 import time
-import hashlib
-import os
 import sys
 from datetime import datetime
-import subprocess
-from collections import Counter
+
+from dane_lotto import SCIEZKA_HISTORII, wczytaj_historie
+from entropia_lotto import LIMIT_CZASU, ZRODLA, zbierz_entropie
+from generator_wsadowy import dostosuj_kupon, losuj_wsad, odtworz_kupon, plany_strategii
+from statystyki_lotto import (aliasy_pozycji, gorace_zimne, macierz_pozycyjna_historii, przerwy_historii,
+                              skumulowane_czestotliwosci)
+
+# Wersja schematu wyjścia --json (zmiana kluczy wymaga podniesienia)
+WERSJA_SCHEMATU_JSON = 1
 
 class InteligentnyLottoGenerator:
-    def __init__(self):
-        self.numbers = set()
+    def __init__(self, plik_historii=SCIEZKA_HISTORII, okno_trendow=100,
+                 wyklucz_wylosowane=False, plik_wydanych=None, cicho=False,
+                 szybka_entropia=False, limit_entropii=LIMIT_CZASU, ziarno=None):
+        # Źródła, które weszły do ostatniego hasha entropii
         self.entropy_sources = []
-        
-        # Dane z analizy statystycznej (oparte na 7223 losowaniach)
-        self.liczby_gorace = [17, 21, 34, 38, 24, 27, 4, 6, 25, 13]  # Najczęstsze
-        self.liczby_zimne = [48, 43, 47, 12, 44, 33, 35, 23, 16, 39]  # Najrzadsze
+        # Tryb cichy: bez opóźnień i ozdobnych komunikatów (dla --json / --quiet)
+        self.cicho = cicho
+        # Tylko os.urandom zamiast zbierania wszystkich źródeł
+        self.szybka_entropia = szybka_entropia
+        self.limit_entropii = limit_entropii
+        # Czas każdego źródła entropii w ms i źródła pominięte (z powodem)
+        self.czasy_entropii = {}
+        self.pominiete_zrodla = {}
+        # Hash entropii (hex) podany zamiast zbierania entropii, do odtwarzania zestawów
+        self.ziarno = ziarno
+        
+        # Dane z analizy statystycznej liczone na bieżąco z historii losowań
+        self.historia = wczytaj_historie(plik_historii)
+        
+        # Indeks kombinacji do pominięcia (już wylosowane / już wydane)
+        self.indeks = None
+        if wyklucz_wylosowane or plik_wydanych:
+            from indeks_kombinacji import IndeksKombinacji
+            self.indeks = IndeksKombinacji(self.historia if wyklucz_wylosowane else None, plik_wydanych)
+        skumulowane = skumulowane_czestotliwosci(self.historia.liczby)
+        self.liczby_gorace, self.liczby_zimne = gorace_zimne(skumulowane)  # Najczęstsze / najrzadsze
         self.liczby_neutralne = [i for i in range(1, 50) if i not in self.liczby_gorace and i not in self.liczby_zimne]
         
-        # Ostatnie trendy (z ostatnich 100 losowań)
-        self.ostatnie_gorace = [20, 49, 17, 30, 11, 28, 36, 38, 22, 37]
-        self.ostatnie_zimne = [47, 14, 16, 27, 32, 33, 45, 26, 4, 1]
+        # Przerwy: liczby najdłużej czekające na wylosowanie
+        self.przerwy = przerwy_historii(self.historia)
+        self.liczby_zalegle = self.przerwy.zalegle()
+        
+        # Rozkład liczb na pozycjach posortowanego losowania (tablice aliasów)
+        self.aliasy_pozycji = aliasy_pozycji(macierz_pozycyjna_historii(self.historia))
+        
+        # Ostatnie trendy (z ostatnich `okno_trendow` losowań)
+        self.ostatnie_gorace, self.ostatnie_zimne = gorace_zimne(
+            skumulowane, max(0, len(self.historia) - okno_trendow))
         
         # Parametry statystyczne
         self.suma_optymalna = 149  # Średnia z analizy
@@ -40,8 +72,13 @@ class InteligentnyLottoGenerator:
             'pozycyjna': 'Rozkład pozycyjny',
             'sekwencje': 'Z uwzględnieniem sekwencji',
             'dziesiatki': 'Równomierne dziesiątki',
-            'ostatnie_trendy': 'Ostatnie trendy (100 losowań)'
+            'ostatnie_trendy': f'Ostatnie trendy ({okno_trendow} losowań)'
         }
+        
+        # Te same strategie w wersji wsadowej (NumPy)
+        self.plany_wsadowe = plany_strategii(self.liczby_gorace, self.liczby_zimne, self.liczby_neutralne,
+                                             self.liczby_zalegle, self.ostatnie_gorace, self.ostatnie_zimne,
+                                             self.aliasy_pozycji)
     def wybierz_strategie(self, entropy_hash):
         """Wybiera strategię na podstawie entropii (zapewnia różnorodność)"""
         # Używamy hash'a do deterministycznego ale nieprzewidywalnego wyboru
@@ -49,255 +86,120 @@ class InteligentnyLottoGenerator:
         strategie_lista = list(self.strategie.keys())
         wybrana = strategie_lista[hash_value % len(strategie_lista)]
         
-        print(f"🎯 Wybrana strategia: {self.strategie[wybrana]}")
+        self._wypisz(f"🎯 Wybrana strategia: {self.strategie[wybrana]}")
         return wybrana
     
-    def generuj_strategie_gorace(self):
+    def _wypisz(self, *args):
+        """print pomijany w trybie cichym"""
+        if not self.cicho:
+            print(*args)
+    
+    def _czekaj(self, sekundy):
+        """Opóźnienie efektu wizualnego (pomijane w trybie cichym)"""
+        if not self.cicho:
+            time.sleep(sekundy)
+    
+    def generate_batch(self, strategy, n, rng=None, zakres_sumy=None, procesy=1):
+        """Macierz (n, 6) uint8 posortowanych kuponów strategii losowanych wsadowo
+        
+        rng to ziarno (liczba, SeedSequence, None) lub numpy.random.Generator;
+        przy ziarnie wynik nie zależy od liczby procesów. zakres_sumy
+        (min, max) odrzuca kupony z sumą spoza zakresu. Z indeksem wykluczeń
+        (wyklucz_wylosowane / plik_wydanych) kupony z indeksu i powtórzenia
+        są pomijane, a brakujące dolosowywane; kuponów nie zapisuje się
+        jako wydanych.
+        """
+        filtr = self.indeks.filtr_partii() if self.indeks is not None else None
+        return losuj_wsad(self._plan(strategy), n, rng, zakres_sumy, procesy, filtr=filtr)
+    
+    def replay_ticket(self, strategy, seed, index):
+        """Odtwarza kupon numer `index` z generate_batch(strategy, n, seed) (bez zakresu sum i indeksu)"""
+        return odtworz_kupon(self._plan(strategy), seed, index)
+    
+    def _plan(self, strategy):
+        if strategy not in self.plany_wsadowe:
+            raise ValueError(f"Nieznana strategia: {strategy} (dostępne: {', '.join(self.plany_wsadowe)})")
+        return self.plany_wsadowe[strategy]
+    
+    def generuj_strategie_gorace(self, ziarno=None):
         """Strategia: liczby historycznie najczęstsze"""
-        liczby = []
-        # 4 liczby z historycznie gorących
-        liczby.extend(random.sample(self.liczby_gorace, 4))
-        # 2 liczby z neutralnych
-        pozostale = [i for i in range(1, 50) if i not in liczby]
-        liczby.extend(random.sample(pozostale, 2))
-        return self._dostosuj_kryteria(liczby)
+        return self.generate_batch('gorace', 1, ziarno)[0].tolist()
     
-    def generuj_strategie_zimne(self):
-        """Strategia: liczby rzadkie (teoria wyrównania)"""
-        liczby = []
-        # 3 liczby z zimnych
-        liczby.extend(random.sample(self.liczby_zimne, 3))
-        # 3 pozostałe
-        pozostale = [i for i in range(1, 50) if i not in liczby]
-        liczby.extend(random.sample(pozostale, 3))
-        return self._dostosuj_kryteria(liczby)
+    def generuj_strategie_zimne(self, ziarno=None):
+        """Strategia: liczby zaległe, najdłużej niewylosowane (teoria wyrównania)"""
+        return self.generate_batch('zimne', 1, ziarno)[0].tolist()
     
-    def generuj_strategie_mieszana(self):
+    def generuj_strategie_mieszana(self, ziarno=None):
         """Strategia: mix gorących i zimnych"""
-        liczby = []
-        liczby.extend(random.sample(self.liczby_gorace, 2))
-        liczby.extend(random.sample(self.liczby_zimne, 2))
-        liczby.extend(random.sample(self.liczby_neutralne, 2))
-        return self._dostosuj_kryteria(liczby)
+        return self.generate_batch('mieszana', 1, ziarno)[0].tolist()
     
-    def generuj_strategie_pozycyjna(self):
-        """Strategia: rozkład pozycyjny (każda pozycja ma swój zakres)"""
-        liczby = []
-        zakresy = [(1, 15), (10, 25), (15, 35), (20, 40), (30, 45), (35, 49)]
-        
-        for i, (min_val, max_val) in enumerate(zakresy):
-            dostepne = [x for x in range(min_val, max_val + 1) if x not in liczby]
-            if dostepne:
-                liczby.append(random.choice(dostepne))
-        
-        # Upewnij się, że mamy 6 liczb
-        while len(liczby) < 6:
-            nowa = random.randint(1, 49)
-            if nowa not in liczby:
-                liczby.append(nowa)
-                
-        return sorted(liczby[:6])
+    def generuj_strategie_pozycyjna(self, ziarno=None):
+        """Strategia: rozkład pozycyjny (każda pozycja losowana z rozkładu historycznego)"""
+        return self.generate_batch('pozycyjna', 1, ziarno)[0].tolist()
     
-    def generuj_strategie_sekwencje(self):
+    def generuj_strategie_sekwencje(self, ziarno=None):
         """Strategia: z sekwencjami (49.9% losowań ma sekwencje 2+)"""
-        liczby = []
-        # Dodaj parę kolejnych liczb
-        start = random.randint(1, 47)
-        liczby.extend([start, start + 1])
-        # Dodaj 4 pozostałe
-        pozostale = [i for i in range(1, 50) if i not in liczby]
-        liczby.extend(random.sample(pozostale, 4))
-        return self._dostosuj_kryteria(liczby)
+        return self.generate_batch('sekwencje', 1, ziarno)[0].tolist()
     
-    def generuj_strategie_dziesiatki(self):
+    def generuj_strategie_dziesiatki(self, ziarno=None):
         """Strategia: równomierne dziesiątki (unika 41-49)"""
-        liczby = []
-        # Po jednej z każdego przedziału oprócz 41-49
-        przedzialy = [
-            list(range(1, 11)),    # 1-10
-            list(range(11, 21)),   # 11-20  
-            list(range(21, 31)),   # 21-30
-            list(range(31, 41))    # 31-40
-        ]
-        
-        for przedzial in przedzialy:
-            liczby.append(random.choice(przedzial))
-        
-        # 2 dodatkowe z dowolnych przedziałów (oprócz 41-49)
-        wszystkie_oproc_41_49 = []
-        for przedzial in przedzialy:
-            wszystkie_oproc_41_49.extend(przedzial)
-        
-        dostepne = [x for x in wszystkie_oproc_41_49 if x not in liczby]
-        liczby.extend(random.sample(dostepne, 2))
-        
-        return self._dostosuj_kryteria(liczby)
+        return self.generate_batch('dziesiatki', 1, ziarno)[0].tolist()
     
-    def generuj_strategie_ostatnie_trendy(self):
-        """Strategia: ostatnie trendy z 100 losowań"""
-        liczby = []
-        # 3 z ostatnio gorących
-        liczby.extend(random.sample(self.ostatnie_gorace, 3))
-        # 2 z ostatnio zimnych (kontrary)
-        liczby.extend(random.sample(self.ostatnie_zimne, 2))
-        # 1 neutralna
-        pozostale = [i for i in range(1, 50) if i not in liczby]
-        liczby.append(random.choice(pozostale))
-        return self._dostosuj_kryteria(liczby)
+    def generuj_strategie_ostatnie_trendy(self, ziarno=None):
+        """Strategia: ostatnie trendy z ostatnich losowań"""
+        return self.generate_batch('ostatnie_trendy', 1, ziarno)[0].tolist()
     
-    def _dostosuj_kryteria(self, liczby):
-        """Dostosowuje liczby do kryteriów statystycznych"""
-        liczby = list(set(liczby))  # Usuń duplikaty
-        
-        # Upewnij się że mamy 6 liczb
-        while len(liczby) < 6:
-            nowa = random.randint(1, 49)
-            if nowa not in liczby:
-                liczby.append(nowa)
-        
-        if len(liczby) > 6:
-            liczby = random.sample(liczby, 6)
-        
-        # Dostosuj do 3 parzystych + 3 nieparzystych (34.1% losowań)
-        parzyste = [x for x in liczby if x % 2 == 0]
-        nieparzyste = [x for x in liczby if x % 2 == 1]
-        
-        # Skoryguj proporcje jeśli trzeba
-        if len(parzyste) != 3:
-            liczby = self._popraw_parzyste_nieparzyste(liczby)
-        
-        return sorted(liczby)
-    
-    def _popraw_parzyste_nieparzyste(self, liczby):
-        """Poprawia proporcje parzystych/nieparzystych do 3/3"""
-        parzyste = [x for x in liczby if x % 2 == 0]
-        nieparzyste = [x for x in liczby if x % 2 == 1]
-        
-        if len(parzyste) > 3:
-            # Za dużo parzystych
-            nadmiar = parzyste[3:]
-            for x in nadmiar:
-                liczby.remove(x)
-                # Dodaj nieparzystą
-                while True:
-                    nowa = random.choice(range(1, 50, 2))
-                    if nowa not in liczby:
-                        liczby.append(nowa)
-                        break
-        elif len(parzyste) < 3:
-            # Za mało parzystych
-            brakuje = 3 - len(parzyste)
-            nadmiar_nieparzystych = nieparzyste[3:]
-            for i in range(min(brakuje, len(nadmiar_nieparzystych))):
-                liczby.remove(nadmiar_nieparzystych[i])
-                # Dodaj parzystą
-                while True:
-                    nowa = random.choice(range(2, 50, 2))
-                    if nowa not in liczby:
-                        liczby.append(nowa)
-                        break
-        
-        return liczby
+    def _dostosuj_kryteria(self, liczby, ziarno=None):
+        """Dostosowuje liczby do kryteriów statystycznych (6 różnych, 3 parzyste i 3 nieparzyste)"""
+        return dostosuj_kupon(liczby, ziarno).tolist()
     
     def collect_entropy(self):
-        """Zbiera różne źródła entropii do generowania liczb"""
-        entropy_data = []
-        
-        # 1. Czas systemowy z mikrosekundami
-        current_time = time.time()
-        entropy_data.append(str(current_time))
-        print(f"🕐 Czas systemowy: {current_time}")
-        
-        # 2. Procesy systemowe
-        try:
-            # Liczba uruchomionych procesów
-            process_count = len(os.listdir('/proc')) if os.path.exists('/proc') else len(str(os.getpid()))
-            entropy_data.append(str(process_count))
-            print(f"⚙️  Liczba procesów: {process_count}")
-        except:
-            entropy_data.append(str(os.getpid()))
-            print(f"⚙️  PID procesu: {os.getpid()}")
-        
-        # 3. Użycie pamięci/CPU
-        try:
-            # Na macOS używamy vm_stat
-            vm_output = subprocess.check_output(['vm_stat'], text=True)
-            memory_entropy = sum(ord(c) for c in vm_output[:100])
-            entropy_data.append(str(memory_entropy))
-            print(f"💾 Entropia pamięci: {memory_entropy}")
-        except:
-            # Fallback - użycie random urandom
-            memory_entropy = int.from_bytes(os.urandom(4), 'big')
-            entropy_data.append(str(memory_entropy))
-            print(f"💾 Entropia systemowa: {memory_entropy}")
-        
-        # 4. Stan plików tymczasowych
-        try:
-            temp_files = os.listdir('/tmp')
-            temp_entropy = len(temp_files) + sum(len(f) for f in temp_files[:10])
-            entropy_data.append(str(temp_entropy))
-            print(f"📁 Entropia plików temp: {temp_entropy}")
-        except:
-            temp_entropy = hash(str(datetime.now()))
-            entropy_data.append(str(temp_entropy))
-            print(f"📁 Entropia czasu: {temp_entropy}")
-        
-        # 5. Opóźnienia I/O
-        start_io = time.perf_counter()
-        try:
-            with open('/dev/null', 'w') as f:
-                f.write('test')
-        except:
-            pass
-        io_delay = int((time.perf_counter() - start_io) * 1000000)
-        entropy_data.append(str(io_delay))
-        print(f"⚡ Opóźnienie I/O: {io_delay} μs")
-        
-        # 6. Hash z kombinacji wszystkich źródeł
-        combined = ''.join(entropy_data)
-        hash_entropy = hashlib.sha256(combined.encode()).hexdigest()
-        print(f"🔐 Hash entropii: {hash_entropy[:16]}...")
-        
-        return hash_entropy
+        """Zbiera entropię z zarejestrowanych źródeł (równolegle, z limitem czasu)"""
+        wynik = zbierz_entropie(limit_czasu=self.limit_entropii, szybko=self.szybka_entropia)
+        for nazwa, wartosc in wynik['wartosci'].items():
+            self._wypisz(f"{ZRODLA[nazwa][1]}: {wartosc}")
+        for nazwa, powod in wynik['pominiete'].items():
+            self._wypisz(f"⚠️  {ZRODLA[nazwa][1]}: pominięte ({powod})")
+        
+        self.entropy_sources = list(wynik['wartosci'])
+        self.czasy_entropii = wynik['czasy_ms']
+        self.pominiete_zrodla = wynik['pominiete']
+        self._wypisz(f"🔐 Hash entropii: {wynik['hash'][:16]}...")
+        
+        return wynik['hash']
     
     def generate_from_entropy(self, entropy_hash):
         """Generuje liczby używając inteligentnych strategii opartych na entropii"""
-        print("\n🎲 Wybór strategii na podstawie entropii...")
+        self._wypisz("\n🎲 Wybór strategii na podstawie entropii...")
         
         # Wybierz strategię na podstawie entropii
         strategia = self.wybierz_strategie(entropy_hash)
         
-        # Mapowanie strategii do funkcji
-        strategie_funkcje = {
-            'gorace': self.generuj_strategie_gorace,
-            'zimne': self.generuj_strategie_zimne,
-            'mieszana': self.generuj_strategie_mieszana,
-            'pozycyjna': self.generuj_strategie_pozycyjna,
-            'sekwencje': self.generuj_strategie_sekwencje,
-            'dziesiatki': self.generuj_strategie_dziesiatki,
-            'ostatnie_trendy': self.generuj_strategie_ostatnie_trendy
-        }
+        # Generuj liczby według wybranej strategii; hash entropii jest też ziarnem
+        # liczb, więc ten sam hash (--ziarno) odtwarza ten sam zestaw
+        self._wypisz("🧮 Generowanie liczb...")
+        self._czekaj(0.3)
         
-        # Generuj liczby według wybranej strategii
-        print("🧮 Generowanie liczb...")
-        time.sleep(0.3)
-        
-        liczby = strategie_funkcje[strategia]()
+        liczby = self._generuj_spoza_indeksu(strategia, int(entropy_hash, 16))
         
         # Dodaj efekt wizualny
         for i, liczba in enumerate(liczby):
-            time.sleep(0.2)
-            print(f"  Liczba {i+1}: {liczba}")
+            self._czekaj(0.2)
+            self._wypisz(f"  Liczba {i+1}: {liczba}")
         
         return liczby, strategia
     
+    def _generuj_spoza_indeksu(self, strategia, ziarno):
+        """Pierwszy zestaw wsadu strategii z ziarna spoza indeksu wykluczeń (zapisany jako wydany)"""
+        liczby = self.generate_batch(strategia, 1, ziarno)
+        if self.indeks is not None:
+            self.indeks.dodaj_wydane(liczby)
+        return liczby[0].tolist()
+    
     def display_results(self, liczby, strategia):
         """Wyświetla wyniki z rekomendacjami eksperta"""
-        suma = sum(liczby)
-        parzyste = sum(1 for x in liczby if x % 2 == 0)
-        
-        # Sprawdź sekwencje
-        sekwencje = self._znajdz_sekwencje(liczby)
+        cechy = self.cechy_zestawu(liczby)
+        suma, parzyste, sekwencje = cechy['suma'], cechy['parzyste'], cechy['sekwencje']
         
         print("\n" + "="*60)
         print("🎯 TWOJE SZCZĘŚLIWE LICZBY LOTTO:")
@@ -319,7 +221,7 @@ class InteligentnyLottoGenerator:
             print(f"   🔗 Sekwencje: brak")
             
         # Ocena jakości
-        ocena = self._ocen_zestaw(liczby, suma, parzyste, sekwencje)
+        ocena = self._ocen_zestaw(self._punkty_zestawu(liczby, suma, parzyste, sekwencje))
         print(f"   ⭐ Ocena eksperta: {ocena}")
         
         print("="*60)
@@ -336,6 +238,39 @@ class InteligentnyLottoGenerator:
             'ocena': ocena
         }
     
+    def cechy_zestawu(self, liczby):
+        """Cechy zestawu oceniane przez eksperta"""
+        return {
+            'suma': sum(liczby),
+            'parzyste': sum(1 for x in liczby if x % 2 == 0),
+            'sekwencje': self._znajdz_sekwencje(liczby),
+            'liczby_41_49': sum(1 for x in liczby if 41 <= x <= 49),
+            'gorace': sum(1 for x in liczby if x in self.liczby_gorace),
+        }
+    
+    def wynik_json(self, liczby, strategia, entropy_hash, czas_ms):
+        """Wynik generowania jako słownik o stałym schemacie (wyjście --json)"""
+        cechy = self.cechy_zestawu(liczby)
+        punkty = self._punkty_zestawu(liczby, cechy['suma'], cechy['parzyste'], cechy['sekwencje'])
+        lata = self.historia.daty[[0, -1]].astype('datetime64[Y]').astype(int) + 1970
+        return {
+            'wersja_schematu': WERSJA_SCHEMATU_JSON,
+            'liczby': [int(x) for x in liczby],
+            'strategia': strategia,
+            'opis_strategii': self.strategie[strategia],
+            'cechy': cechy,
+            'ocena': {'punkty': punkty, 'opis': self._ocen_zestaw(punkty)},
+            'entropia': {
+                'hash': entropy_hash,
+                'zrodla': self.entropy_sources,
+                'zrodla_ms': self.czasy_entropii,
+                'pominiete': self.pominiete_zrodla,
+            },
+            'historia': {'losowan': len(self.historia), 'od': int(lata[0]), 'do': int(lata[1])},
+            'wygenerowano': datetime.now().isoformat(timespec='seconds'),
+            'czas_ms': round(czas_ms, 3),
+        }
+    
     def _znajdz_sekwencje(self, liczby):
         """Znajduje sekwencje kolejnych liczb"""
         liczby = sorted(liczby)
@@ -352,8 +287,8 @@ class InteligentnyLottoGenerator:
         
         return sekwencje
     
-    def _ocen_zestaw(self, liczby, suma, parzyste, sekwencje):
-        """Ocenia jakość zestawu według kryteriów statystycznych"""
+    def _punkty_zestawu(self, liczby, suma, parzyste, sekwencje):
+        """Punkty jakości zestawu według kryteriów statystycznych"""
         punkty = 0
         
         # Suma w optymalnym zakresie (120-180)
@@ -382,6 +317,10 @@ class InteligentnyLottoGenerator:
         if gorace_w_zestawie >= 2:
             punkty += 1
         
+        return punkty
+    
+    def _ocen_zestaw(self, punkty):
+        """Słowna ocena zestawu na podstawie punktów"""
         if punkty >= 6:
             return "DOSKONAŁY ⭐⭐⭐⭐⭐"
         elif punkty >= 4:
@@ -395,29 +334,68 @@ class InteligentnyLottoGenerator:
     
     def run(self):
         """Główna funkcja aplikacji"""
+        if self.cicho:
+            poczatek = time.perf_counter()
+            entropy = self.ziarno or self.collect_entropy()
+            liczby, strategia = self.generate_from_entropy(entropy)
+            return self.wynik_json(liczby, strategia, entropy, (time.perf_counter() - poczatek) * 1000)
+        
+        lata = self.historia.daty[[0, -1]].astype('datetime64[Y]').astype(int) + 1970
         print("🎰 INTELIGENTNY GENERATOR LOTTO")
-        print("Oparty na analizie 7,223 losowań (1957-2025)\n")
+        print(f"Oparty na analizie {len(self.historia):,} losowań ({lata[0]}-{lata[1]})\n")
         
-        print("Zbieranie entropii z systemu...")
-        entropy = self.collect_entropy()
+        if self.ziarno:
+            print(f"🔁 Odtwarzanie z ziarna: {self.ziarno}")
+            entropy = self.ziarno
+        else:
+            print("Zbieranie entropii z systemu...")
+            entropy = self.collect_entropy()
         
         liczby, strategia = self.generate_from_entropy(entropy)
         dane = self.display_results(liczby, strategia)
         
         return dane
 
-def main():
+def main(argv=None):
     """Punkt wejścia aplikacji"""
+    parser = argparse.ArgumentParser(description="Inteligentny generator liczb lotto")
+    parser.add_argument('--historia', default=SCIEZKA_HISTORII, help="plik CSV z historią losowań")
+    tryb = parser.add_mutually_exclusive_group()
+    tryb.add_argument('--json', action='store_true',
+                      help="bez opóźnień i ozdobników, jeden obiekt JSON na stdout")
+    tryb.add_argument('--quiet', action='store_true',
+                      help="bez opóźnień i ozdobników, tylko liczby na stdout")
+    parser.add_argument('--szybka-entropia', action='store_true',
+                        help="entropia tylko z os.urandom (bez pozostałych źródeł)")
+    parser.add_argument('--limit-entropii', type=float, default=LIMIT_CZASU,
+                        help="maksymalny czas zbierania entropii w sekundach")
+    parser.add_argument('--ziarno', metavar='HASH',
+                        help="hash entropii (hex, np. entropia.hash z --json) zamiast zbierania entropii; "
+                             "odtwarza strategię i liczby")
+    args = parser.parse_args(argv)
+    if args.ziarno is not None:
+        try:
+            int(args.ziarno, 16)
+        except ValueError:
+            parser.error("--ziarno musi być liczbą szesnastkową")
+    cicho = args.json or args.quiet
+    
     try:
-        generator = InteligentnyLottoGenerator()
+        generator = InteligentnyLottoGenerator(args.historia, cicho=cicho, szybka_entropia=args.szybka_entropia,
+                                               limit_entropii=args.limit_entropii, ziarno=args.ziarno)
         dane = generator.run()
-        return dane
     except KeyboardInterrupt:
-        print("\n\n👋 Do widzenia!")
+        print("\n\n👋 Do widzenia!", file=sys.stderr if cicho else sys.stdout)
         sys.exit(0)
     except Exception as e:
-        print(f"\n❌ Błąd: {e}")
+        print(f"\n❌ Błąd: {e}", file=sys.stderr if cicho else sys.stdout)
         sys.exit(1)
+    
+    if args.json:
+        print(json.dumps(dane, ensure_ascii=False))
+    elif args.quiet:
+        print(' '.join(map(str, dane['liczby'])))
+    return dane
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Magazyn cech wszystkich 13 983 816 kombinacji 6 z 49
+Kolumny indeksowane rangą kolex, otwierane przez np.memmap
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+
+from dane_lotto import SCIEZKA_HISTORII, tablica_pochodna, wczytaj_historie
+from kombinacje import liczba_kombinacji, ranga_kolex, z_rangi_kolex
+from statystyki_lotto import gorace_zimne, skumulowane_czestotliwosci, statystyka_sekwencji
+
+KOMBINACJI = liczba_kombinacji(6)
+WERSJA_MAGAZYNU = 1
+# Tyle kombinacji liczymy naraz przy budowie magazynu
+BLOK_KOMBINACJI = 1 << 20
+
+# Kolumny zależne tylko od samych kombinacji (budowane raz)
+KOLUMNY_STALE = {
+    'suma': (np.uint16, ()),
+    'parzyste': (np.uint8, ()),
+    'dziesiatki': (np.uint8, (5,)),
+    'najdluzsza': (np.uint8, ()),
+}
+
+# Filtry z gotowymi listami rang (zapisywane przy budowie magazynu)
+FILTRY = {
+    'suma_120_180': lambda c: (c['suma'] >= 120) & (c['suma'] <= 180),
+    'parzyste_3': lambda c: c['parzyste'] == 3,
+    'suma_120_180_parzyste_3': lambda c: (c['suma'] >= 120) & (c['suma'] <= 180) & (c['parzyste'] == 3),
+    'kryteria_eksperta': lambda c: ((c['suma'] >= 120) & (c['suma'] <= 180) & (c['parzyste'] == 3)
+                                    & (c['dziesiatki'][:, 4] <= 1)),
+}
+
+
+def cechy_kombinacji(kombinacje):
+    """Cechy stałe dla macierzy (N, 6) posortowanych kombinacji"""
+    kombinacje = np.asarray(kombinacje)
+    dziesiatki = np.minimum((kombinacje - 1) // 10, 4)
+    return {
+        'suma': kombinacje.sum(axis=1, dtype=np.uint16),
+        'parzyste': (kombinacje % 2 == 0).sum(axis=1, dtype=np.uint8),
+        'dziesiatki': np.stack([(dziesiatki == d).sum(axis=1, dtype=np.uint8) for d in range(5)], axis=1),
+        'najdluzsza': statystyka_sekwencji(kombinacje)['najdluzsza'],
+    }
+
+
+def _katalog_magazynu(historia, katalog):
+    if katalog is not None:
+        return katalog
+    if historia.katalog is None:
+        raise ValueError("Historia nie ma katalogu cache - podaj katalog magazynu")
+    return os.path.join(historia.katalog, 'cechy')
+
+
+def _zbuduj_kolumny_stale(katalog):
+    """Liczy kolumny stałe i listy rang filtrów, blokami po BLOK_KOMBINACJI"""
+    os.makedirs(katalog, exist_ok=True)
+    kolumny = {
+        nazwa: np.lib.format.open_memmap(os.path.join(katalog, f'{nazwa}.tmp.npy'), mode='w+',
+                                         dtype=dtype, shape=(KOMBINACJI,) + ksztalt)
+        for nazwa, (dtype, ksztalt) in KOLUMNY_STALE.items()
+    }
+    filtry = {nazwa: [] for nazwa in FILTRY}
+
+    for poczatek in range(0, KOMBINACJI, BLOK_KOMBINACJI):
+        rangi = np.arange(poczatek, min(poczatek + BLOK_KOMBINACJI, KOMBINACJI), dtype=np.uint32)
+        cechy = cechy_kombinacji(z_rangi_kolex(rangi, 6))
+        for nazwa, tablica in cechy.items():
+            kolumny[nazwa][poczatek:poczatek + len(rangi)] = tablica
+        for nazwa, warunek in FILTRY.items():
+            filtry[nazwa].append(rangi[warunek(cechy)])
+
+    for nazwa, tablica in kolumny.items():
+        tablica.flush()
+        os.replace(os.path.join(katalog, f'{nazwa}.tmp.npy'), os.path.join(katalog, f'{nazwa}.npy'))
+    for nazwa, czesci in filtry.items():
+        np.save(os.path.join(katalog, f'filtr_{nazwa}.npy'), np.concatenate(czesci))
+
+    with open(os.path.join(katalog, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump({'wersja': WERSJA_MAGAZYNU, 'filtry': sorted(FILTRY)}, f)
+
+
+def _magazyn_aktualny(katalog):
+    try:
+        with open(os.path.join(katalog, 'meta.json'), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return meta.get('wersja') == WERSJA_MAGAZYNU and meta.get('filtry') == sorted(FILTRY)
+
+
+def _kolumna_gorace(historia):
+    """Ile liczb gorących (wg całej historii) zawiera każda kombinacja"""
+    gorace, _ = gorace_zimne(skumulowane_czestotliwosci(historia.liczby))
+    czy_gorace = np.zeros(50, dtype=np.uint8)
+    czy_gorace[gorace] = 1
+    kolumna = np.empty(KOMBINACJI, dtype=np.uint8)
+    for poczatek in range(0, KOMBINACJI, BLOK_KOMBINACJI):
+        rangi = np.arange(poczatek, min(poczatek + BLOK_KOMBINACJI, KOMBINACJI))
+        kolumna[poczatek:poczatek + len(rangi)] = czy_gorace[z_rangi_kolex(rangi, 6)].sum(axis=1)
+    return kolumna
+
+
+def _kolumna_wylosowane(historia):
+    """Flaga: kombinacja padła już kiedyś jako wynik losowania"""
+    kolumna = np.zeros(KOMBINACJI, dtype=bool)
+    kolumna[ranga_kolex(historia.liczby)] = True
+    return kolumna
+
+
+def _dopisz_wylosowane(kolumna, nowe):
+    kolumna[ranga_kolex(nowe.liczby)] = True
+    return kolumna
+
+
+def otworz_magazyn(historia, katalog=None):
+    """Otwiera (w razie potrzeby budując) magazyn cech wszystkich kombinacji
+
+    Kolumny stałe (suma, parzyste, dziesiatki, najdluzsza) budowane są raz;
+    kolumny zależne od historii (gorace, wylosowana) są trzymane w cache
+    historii i odświeżane po zmianie historii. Zwraca słownik tablic
+    długości 13 983 816 indeksowanych rangą kolex.
+    """
+    katalog = _katalog_magazynu(historia, katalog)
+    if not _magazyn_aktualny(katalog):
+        _zbuduj_kolumny_stale(katalog)
+
+    magazyn = {nazwa: np.load(os.path.join(katalog, f'{nazwa}.npy'), mmap_mode='r')
+               for nazwa in KOLUMNY_STALE}
+    magazyn['gorace'] = tablica_pochodna(historia, 'kombinacje_gorace', _kolumna_gorace)
+    magazyn['wylosowana'] = tablica_pochodna(historia, 'kombinacje_wylosowane',
+                                             _kolumna_wylosowane, _dopisz_wylosowane)
+    magazyn['katalog'] = katalog
+    return magazyn
+
+
+def indeks_filtra(magazyn, nazwa):
+    """Posortowana lista rang (uint32) kombinacji spełniających filtr z FILTRY"""
+    return np.load(os.path.join(magazyn['katalog'], f'filtr_{nazwa}.npy'), mmap_mode='r')
+
+
+def filtruj(magazyn, warunek):
+    """Rangi kombinacji spełniających dowolny warunek (warunek(magazyn) zwraca maskę bool)"""
+    return np.flatnonzero(warunek(magazyn)).astype(np.uint32)
+
+
+def losuj_z_indeksu(indeks, ile, rng=None):
+    """Losuje jednostajnie `ile` kombinacji z listy rang: macierz (ile, 6)"""
+    rng = np.random.default_rng() if rng is None else rng
+    return z_rangi_kolex(indeks[rng.integers(0, len(indeks), size=ile)], 6)
+
+
+def main():
+    """Buduje magazyn i wypisuje liczności filtrów"""
+    parser = argparse.ArgumentParser(description="Magazyn cech wszystkich kombinacji 6 z 49")
+    parser.add_argument('--historia', default=SCIEZKA_HISTORII, help="plik CSV z historią losowań")
+    parser.add_argument('--losuj', metavar='FILTR', choices=sorted(FILTRY),
+                        help="wylosuj kupony spełniające filtr")
+    parser.add_argument('--ile', type=int, default=5, help="liczba kuponów dla --losuj")
+    args = parser.parse_args()
+
+    historia = wczytaj_historie(args.historia)
+    magazyn = otworz_magazyn(historia)
+
+    if args.losuj:
+        for kupon in losuj_z_indeksu(indeks_filtra(magazyn, args.losuj), args.ile):
+            print(" | ".join(f"{liczba:2d}" for liczba in kupon))
+        return
+
+    print(f"📦 Magazyn cech: {magazyn['katalog']}")
+    print(f"Kombinacji: {KOMBINACJI:,}, już wylosowanych: {int(np.count_nonzero(magazyn['wylosowana'])):,}")
+    for nazwa in sorted(FILTRY):
+        ile = len(indeks_filtra(magazyn, nazwa))
+        print(f"  {nazwa}: {ile:,} ({ile / KOMBINACJI * 100:.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
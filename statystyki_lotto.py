@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Zwektoryzowane statystyki historii losowań (na macierzy liczb (N, 6))
+"""
+
+import math
+
+import numpy as np
+
+from dane_lotto import tablica_pochodna, wynik_analizy
+
+LICZBY = 49
+LICZB_W_LOSOWANIU = 6
+
+# Losowanie to 6 z 49 bez zwracania, więc macierz kowariancji częstotliwości
+# to 43/48 tej z rozkładu wielomianowego - zwykła statystyka chi-kwadrat ma
+# średnią 43 zamiast 48 i trzeba ją przeskalować przez 48/43
+KOREKTA_CHI2 = (LICZBY - 1) / (LICZBY - LICZB_W_LOSOWANIU)
+
+
+def czestotliwosc_liczb(liczby):
+    """Liczba wystąpień każdej liczby 1-49 (indeks 0 to liczba 1)"""
+    liczby = np.asarray(liczby)
+    return np.bincount(liczby.ravel(), minlength=LICZBY + 1)[1:]
+
+
+def chi2_sf(chi2, stopnie_swobody):
+    """Prawdopodobieństwo P(X >= chi2) dla rozkładu chi-kwadrat
+
+    Dla parzystej liczby stopni swobody (48 przy 49 liczbach) liczone
+    dokładnie z postaci zamkniętej, więc nie wymaga scipy; działa też
+    na tablicach.
+    """
+    chi2 = np.asarray(chi2, dtype=np.float64)
+    if stopnie_swobody % 2:
+        from scipy.stats import chi2 as rozklad_chi2
+        return rozklad_chi2.sf(chi2, stopnie_swobody)
+
+    polowa = chi2[..., None] / 2
+    i = np.arange(stopnie_swobody // 2)
+    log_lgamma = np.array([math.lgamma(k + 1) for k in i])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        skladniki = np.exp(i * np.log(polowa) - log_lgamma - polowa)
+    skladniki[..., 0] = np.exp(-polowa[..., 0])
+    return np.minimum(skladniki.sum(axis=-1), 1.0)
+
+
+def chi2_rownomiernosci(czestotliwosci, losowan):
+    """Statystyka chi-kwadrat równomierności częstotliwości liczb (po ostatniej osi)
+
+    Uwzględnia losowanie bez zwracania (KOREKTA_CHI2), więc przy losowych
+    danych ma rozkład chi-kwadrat o 48 stopniach swobody.
+    """
+    oczekiwana = np.asarray(losowan, dtype=np.float64) * LICZB_W_LOSOWANIU / LICZBY
+    return ((czestotliwosci - oczekiwana[..., None]) ** 2).sum(axis=-1) / oczekiwana * KOREKTA_CHI2
+
+
+def statystyka_czestotliwosci(liczby, wiersze=slice(None)):
+    """Częstotliwości liczb z testem chi-kwadrat równomierności
+
+    liczby  - macierz (N, 6) losowań
+    wiersze - wycinek wierszy do analizy (slice daje widok bez kopiowania)
+
+    Zwraca słownik z częstotliwościami (indeks 0 to liczba 1), wartością
+    oczekiwaną, statystyką chi-kwadrat, p-value oraz liczbami odstającymi
+    poza μ±2σ.
+    """
+    liczby = np.asarray(liczby)[wiersze]
+    czestotliwosc = czestotliwosc_liczb(liczby)
+    losowan = len(liczby)
+
+    oczekiwana = losowan * LICZB_W_LOSOWANIU / LICZBY
+    chi2 = float(chi2_rownomiernosci(czestotliwosc, losowan)) if losowan else 0.0
+    srednia = czestotliwosc.mean()
+    odchylenie = czestotliwosc.std()
+    numery = np.arange(1, LICZBY + 1)
+
+    return {
+        'losowan': losowan,
+        'czestotliwosc': czestotliwosc,
+        'oczekiwana': oczekiwana,
+        'srednia': srednia,
+        'odchylenie': odchylenie,
+        'chi2': chi2,
+        'stopnie_swobody': LICZBY - 1,
+        'p_value': float(chi2_sf(chi2, LICZBY - 1)),
+        'powyzej': numery[czestotliwosc > srednia + 2 * odchylenie],
+        'ponizej': numery[czestotliwosc < srednia - 2 * odchylenie],
+    }
+
+
+def najczestsze(czestotliwosc, ile=10):
+    """Liczby posortowane malejąco po częstotliwości (remisy rosnąco po liczbie)"""
+    kolejnosc = np.argsort(-np.asarray(czestotliwosc), kind='stable')[:ile]
+    return [(int(i) + 1, int(czestotliwosc[i])) for i in kolejnosc]
+
+
+def najrzadsze(czestotliwosc, ile=10):
+    """Liczby posortowane rosnąco po częstotliwości (remisy rosnąco po liczbie)"""
+    kolejnosc = np.argsort(np.asarray(czestotliwosc), kind='stable')[:ile]
+    return [(int(i) + 1, int(czestotliwosc[i])) for i in kolejnosc]
+
+
+def statystyka_sekwencji(liczby, min_dlugosc=2):
+    """Sekwencje kolejnych liczb i dystanse między sąsiednimi liczbami
+
+    Jeden przebieg po np.diff z posortowanej macierzy (N, 6). Zwraca
+    słownik z kolumnami per losowanie:
+      dystanse    - macierz (N, 5) różnic między sąsiednimi liczbami
+      najdluzsza  - długość najdłuższej sekwencji kolejnych liczb (1 = brak)
+      serie       - liczba sekwencji o długości >= min_dlugosc
+    oraz histogramem wszystkich dystansów (indeks = dystans).
+    """
+    liczby = np.asarray(liczby)
+    dystanse = np.diff(liczby.astype(np.int8), axis=1)
+    kolejne = dystanse == 1
+
+    # dlugosc[:, j] - ile kolejnych liczb kończy się na pozycji j+1 (bez pierwszej)
+    dlugosc = np.zeros(dystanse.shape, dtype=np.uint8)
+    biezaca = np.zeros(len(liczby), dtype=np.uint8)
+    for j in range(dystanse.shape[1]):
+        biezaca = (biezaca + 1) * kolejne[:, j]
+        dlugosc[:, j] = biezaca
+
+    koniec_serii = kolejne & ~np.concatenate((kolejne[:, 1:], np.zeros((len(liczby), 1), dtype=bool)), axis=1)
+    serie = (koniec_serii & (dlugosc + 1 >= min_dlugosc)).sum(axis=1, dtype=np.uint8)
+
+    return {
+        'dystanse': dystanse.astype(np.uint8),
+        'najdluzsza': dlugosc.max(axis=1, initial=0) + np.uint8(1),
+        'serie': serie,
+        'histogram_dystansow': np.bincount(dystanse.ravel(), minlength=LICZBY),
+    }
+
+
+def macierz_pozycyjna(liczby):
+    """Macierz (6, 49): ile razy liczba n stała na pozycji i posortowanego losowania"""
+    liczby = np.sort(np.asarray(liczby), axis=1).astype(np.intp)
+    pozycje = np.arange(liczby.shape[1]) * LICZBY
+    return np.bincount((liczby - 1 + pozycje).ravel(),
+                       minlength=liczby.shape[1] * LICZBY).reshape(liczby.shape[1], LICZBY)
+
+
+def macierz_pozycyjna_historii(historia):
+    """macierz_pozycyjna całej historii, w cache historii (dopisywana przyrostowo)"""
+    return tablica_pochodna(historia, 'pozycje', lambda h: macierz_pozycyjna(h.liczby),
+                            lambda macierz, nowe: macierz + macierz_pozycyjna(nowe.liczby))
+
+
+def rozklad_pozycyjny(macierz, kwantyle=(0.05, 0.25, 0.5, 0.75, 0.95)):
+    """Rozkłady liczb na pozycjach z macierzy pozycyjnej
+
+    Zwraca słownik z prawdopodobieństwami i dystrybuantami (6, 49),
+    średnią liczbą na każdej pozycji oraz kwantylami (6, len(kwantyle))
+    - najmniejszą liczbą, dla której dystrybuanta osiąga dany poziom.
+    """
+    macierz = np.asarray(macierz, dtype=np.float64)
+    prawdopodobienstwa = macierz / macierz.sum(axis=1, keepdims=True)
+    dystrybuanty = np.cumsum(prawdopodobienstwa, axis=1)
+    return {
+        'prawdopodobienstwa': prawdopodobienstwa,
+        'dystrybuanty': dystrybuanty,
+        'srednie': prawdopodobienstwa @ np.arange(1, LICZBY + 1),
+        'kwantyle': np.array([np.searchsorted(wiersz, kwantyle) + 1 for wiersz in dystrybuanty]),
+        'poziomy_kwantyli': tuple(kwantyle),
+    }
+
+
+def tablica_aliasow(prawdopodobienstwa):
+    """Tablica aliasów (metoda Vose) do losowania z rozkładu dyskretnego w O(1)
+
+    Zwraca (progi, aliasy): wylosuj i jednostajnie, a potem weź i, jeśli
+    u < progi[i], w przeciwnym razie aliasy[i].
+    """
+    p = np.asarray(prawdopodobienstwa, dtype=np.float64)
+    n = len(p)
+    skalowane = p * n / p.sum()
+    progi = np.ones(n)
+    aliasy = np.arange(n)
+    male = [i for i in range(n) if skalowane[i] < 1.0]
+    duze = [i for i in range(n) if skalowane[i] >= 1.0]
+    while male and duze:
+        maly, duzy = male.pop(), duze.pop()
+        progi[maly], aliasy[maly] = skalowane[maly], duzy
+        skalowane[duzy] -= 1.0 - skalowane[maly]
+        (male if skalowane[duzy] < 1.0 else duze).append(duzy)
+    return progi, aliasy
+
+
+def aliasy_pozycji(macierz):
+    """Tablice aliasów (progi, aliasy) dla każdej pozycji macierzy pozycyjnej"""
+    return [tuple(t.tolist() for t in tablica_aliasow(wiersz)) for wiersz in np.asarray(macierz)]
+
+
+def macierz_jedynkowa(liczby):
+    """Macierz (N, 49) uint8 z jedynką w kolumnie n-1 dla każdej wylosowanej liczby n"""
+    liczby = np.asarray(liczby)
+    jedynkowa = np.zeros((len(liczby), LICZBY), dtype=np.uint8)
+    jedynkowa[np.arange(len(liczby))[:, None], liczby.astype(np.intp) - 1] = 1
+    return jedynkowa
+
+
+def skumulowane_czestotliwosci(liczby):
+    """Sumy prefiksowe (N+1, 49): wiersz i to częstotliwości w losowaniach [0, i)"""
+    skumulowane = np.zeros((len(liczby) + 1, LICZBY), dtype=np.int32)
+    np.cumsum(macierz_jedynkowa(liczby), axis=0, dtype=np.int32, out=skumulowane[1:])
+    return skumulowane
+
+
+def czestotliwosc_okna(skumulowane, poczatek=0, koniec=None):
+    """Częstotliwości liczb w losowaniach [poczatek, koniec) w czasie O(49)"""
+    if koniec is None:
+        koniec = len(skumulowane) - 1
+    return skumulowane[koniec] - skumulowane[poczatek]
+
+
+def gorace_zimne(skumulowane, poczatek=0, koniec=None, ile=10):
+    """Najczęstsze i najrzadsze liczby w oknie [poczatek, koniec)
+
+    Zwraca dwie listy po `ile` liczb: gorące malejąco i zimne rosnąco po
+    częstotliwości (remisy rozstrzyga mniejsza liczba).
+    """
+    czestotliwosc = czestotliwosc_okna(skumulowane, poczatek, koniec)
+    return ([liczba for liczba, _ in najczestsze(czestotliwosc, ile)],
+            [liczba for liczba, _ in najrzadsze(czestotliwosc, ile)])
+
+
+def szereg_gorace_zimne(skumulowane, okna=(100,), ile=10):
+    """Gorące i zimne liczby dla każdego przesuwnego okna każdej długości
+
+    Dla okna długości W wiersz t opisuje losowania [t, t+W), czyli stan
+    "po losowaniu t+W-1". Zwraca słownik {W: (gorace, zimne)} z macierzami
+    (N-W+1, ile) liczb 1-49.
+    """
+    szeregi = {}
+    for okno in okna:
+        czestotliwosci = skumulowane[okno:] - skumulowane[:-okno]
+        gorace = np.argsort(-czestotliwosci, axis=1, kind='stable')[:, :ile] + 1
+        zimne = np.argsort(czestotliwosci, axis=1, kind='stable')[:, :ile] + 1
+        szeregi[okno] = (gorace.astype(np.uint8), zimne.astype(np.uint8))
+    return szeregi
+
+
+def szereg_chi2(skumulowane, okna=(500,), krok=1, prog=0.01):
+    """Test chi-kwadrat równomierności dla przesuwnych okien losowań
+
+    Okno długości W zaczyna się co `krok` losowań; częstotliwości w oknie
+    to różnica sum skumulowanych, więc cały szereg kosztuje O(N·49)
+    niezależnie od W. Zwraca słownik {W: wynik} z tablicami 'poczatki',
+    'chi2', 'p_value' i maską 'odstajace' (p_value < prog).
+    """
+    szeregi = {}
+    losowan = len(skumulowane) - 1
+    for okno in okna:
+        poczatki = np.arange(0, losowan - okno + 1, krok)
+        czestotliwosci = skumulowane[poczatki + okno] - skumulowane[poczatki]
+        chi2 = chi2_rownomiernosci(czestotliwosci, okno)
+        p_value = chi2_sf(chi2, LICZBY - 1)
+        szeregi[okno] = {
+            'poczatki': poczatki,
+            'chi2': chi2,
+            'p_value': p_value,
+            'odstajace': p_value < prog,
+        }
+    return szeregi
+
+
+class LicznikPrzerw:
+    """Przerwy między wystąpieniami liczb (ile losowań liczba nie padła)
+
+    Budowany jednym zwektoryzowanym przebiegiem po historii, a potem
+    aktualizowany w O(6) na każde dopisane losowanie. Przerwa 0 oznacza
+    wystąpienie w dwóch kolejnych losowaniach.
+    """
+
+    def __init__(self, liczby=None):
+        self.losowan = 0
+        self.ostatnie = np.full(LICZBY, -1, dtype=np.int64)
+        self.histogram = np.zeros((LICZBY, 1), dtype=np.int64)
+        if liczby is not None and len(liczby):
+            self._z_historii(np.asarray(liczby))
+
+    def _z_historii(self, liczby):
+        numer, losowanie = np.nonzero(macierz_jedynkowa(liczby).T)
+        ta_sama = numer[1:] == numer[:-1]
+        numery_przerw = numer[1:][ta_sama]
+        przerwy = np.diff(losowanie)[ta_sama] - 1
+
+        szerokosc = int(przerwy.max()) + 1 if len(przerwy) else 1
+        self.histogram = np.bincount(numery_przerw * szerokosc + przerwy,
+                                     minlength=LICZBY * szerokosc).reshape(LICZBY, szerokosc)
+        ostatnie_w_grupie = np.append(~ta_sama, True)
+        self.ostatnie[numer[ostatnie_w_grupie]] = losowanie[ostatnie_w_grupie]
+        self.losowan = len(liczby)
+
+    def dodaj_losowanie(self, liczby):
+        """Uwzględnia kolejne losowanie (6 liczb) w czasie O(6)"""
+        for liczba in liczby:
+            i = int(liczba) - 1
+            if self.ostatnie[i] >= 0:
+                przerwa = self.losowan - self.ostatnie[i] - 1
+                if przerwa >= self.histogram.shape[1]:
+                    self.histogram = np.pad(self.histogram, ((0, 0), (0, przerwa + 1 - self.histogram.shape[1])))
+                self.histogram[i, przerwa] += 1
+            self.ostatnie[i] = self.losowan
+        self.losowan += 1
+
+    @property
+    def aktualne(self):
+        """Ile losowań minęło od ostatniego wystąpienia każdej liczby"""
+        return np.where(self.ostatnie >= 0, self.losowan - 1 - self.ostatnie, self.losowan)
+
+    @property
+    def maksymalne(self):
+        """Najdłuższa zakończona przerwa każdej liczby"""
+        niezerowe = self.histogram > 0
+        odwrocone = np.argmax(niezerowe[:, ::-1], axis=1)
+        return np.where(niezerowe.any(axis=1), self.histogram.shape[1] - 1 - odwrocone, 0)
+
+    @property
+    def srednie(self):
+        """Średnia długość przerwy każdej liczby"""
+        ile = self.histogram.sum(axis=1)
+        suma = self.histogram @ np.arange(self.histogram.shape[1])
+        return np.divide(suma, ile, out=np.zeros(LICZBY), where=ile > 0)
+
+    def zalegle(self, ile=10):
+        """Liczby najdłużej czekające na wylosowanie (malejąco po aktualnej przerwie)"""
+        return [liczba for liczba, _ in najczestsze(self.aktualne, ile)]
+
+
+def _dopisz_przerwy(licznik, nowe):
+    for liczby in nowe.liczby:
+        licznik.dodaj_losowanie(liczby)
+    return licznik
+
+
+def przerwy_historii(historia):
+    """LicznikPrzerw całej historii z cache wyników (nowe losowania dokładane w O(6))"""
+    return wynik_analizy(historia, 'przerwy', lambda h: LicznikPrzerw(h.liczby), dopisz=_dopisz_przerwy)
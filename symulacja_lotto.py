@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Symulacja Monte Carlo strategii generatora na uczciwych losowaniach
+Porównuje częstość trafień każdej strategii z kuponami czysto losowymi
+"""
+
+import argparse
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from backtest_lotto import NAZWY_TRAFIEN
+from dane_lotto import maski_z_liczb, popcount
+from kombinacje import liczba_kombinacji, z_rangi_kolex
+
+KOMBINACJI = liczba_kombinacji(6)
+# Losowania generowane naraz w jednym kroku
+BLOK_LOSOWAN = 1 << 20
+# Kupony w puli każdej strategii
+KUPONOW_W_PULI = 10_000
+# Kwantyl rozkładu normalnego dla 95% przedziału ufności
+Z_95 = 1.959963984540054
+
+BAZOWA = 'losowa'
+
+# Stan procesów roboczych (ustawiany raz w inicjalizatorze puli)
+_pule = None
+
+
+def losuj_kombinacje(rng, ile):
+    """Jednostajnie losowe kombinacje 6 z 49: macierz (ile, 6) uint8"""
+    return z_rangi_kolex(rng.integers(0, KOMBINACJI, size=ile), 6)
+
+
+def prawdopodobienstwo_trafien():
+    """Dokładny rozkład trafień jednego kuponu w uczciwym losowaniu (7,)"""
+    return np.array([math.comb(6, j) * math.comb(43, 6 - j) for j in range(7)]) / KOMBINACJI
+
+
+def pule_strategii(strategie, ile=KUPONOW_W_PULI, ziarno=None):
+    """Pule kuponów każdej strategii InteligentnyLottoGenerator i puli bazowej
+
+    Zwraca (nazwy, maski) - maski to macierz (S, ile) uint64, pierwszy
+    wiersz to kupony czysto losowe.
+    """
+    from lotto_generator import InteligentnyLottoGenerator
+
+    generator = InteligentnyLottoGenerator()
+    nieznane = [s for s in strategie if s not in generator.strategie]
+    if nieznane:
+        raise ValueError(f"Nieznana strategia: {', '.join(nieznane)} "
+                         f"(dostępne: {', '.join(generator.strategie)})")
+
+    # Każda pula ma własny strumień z SeedSequence ziarna
+    bazowa, *ziarna = np.random.SeedSequence(ziarno).spawn(len(strategie) + 1)
+    pule = [maski_z_liczb(losuj_kombinacje(np.random.default_rng(bazowa), ile))]
+    for strategia, ziarno_puli in zip(strategie, ziarna):
+        pule.append(maski_z_liczb(generator.generate_batch(strategia, ile, ziarno_puli)))
+    return [BAZOWA] + list(strategie), np.stack(pule)
+
+
+def trafienia_bloku(pule, rng, losowan):
+    """Rozkład trafień (S, 7) dla `losowan` uczciwych losowań
+
+    Każde losowanie jest grane przez wszystkie strategie naraz (wspólne
+    liczby losowe zmniejszają wariancję porównania), każda strategia
+    bierze losowy kupon ze swojej puli.
+    """
+    maski = maski_z_liczb(losuj_kombinacje(rng, losowan))
+    kupony = rng.integers(0, pule.shape[1], size=(len(pule), losowan))
+    trafienia = popcount(np.take_along_axis(pule, kupony, axis=1) & maski)
+    return np.stack([np.bincount(wiersz, minlength=7) for wiersz in trafienia])
+
+
+def _inicjuj_proces(pule):
+    global _pule
+    _pule = pule
+
+
+def _zadanie(zadanie):
+    ziarno, losowan, blok = zadanie
+    rng = np.random.default_rng(ziarno)
+    wynik = np.zeros((len(_pule), 7), dtype=np.int64)
+    for poczatek in range(0, losowan, blok):
+        wynik += trafienia_bloku(_pule, rng, min(blok, losowan - poczatek))
+    return wynik
+
+
+def przedzial_wilsona(sukcesy, proby, z=Z_95):
+    """Przedział ufności Wilsona dla proporcji (działa na tablicach)"""
+    sukcesy, proby = np.asarray(sukcesy, dtype=float), np.asarray(proby, dtype=float)
+    p = sukcesy / proby
+    mianownik = 1 + z ** 2 / proby
+    srodek = (p + z ** 2 / (2 * proby)) / mianownik
+    promien = z * np.sqrt(p * (1 - p) / proby + z ** 2 / (4 * proby ** 2)) / mianownik
+    return np.clip(srodek - promien, 0, 1), np.clip(srodek + promien, 0, 1)
+
+
+def symuluj(pule, losowan, procesy=1, ziarno=None, blok=BLOK_LOSOWAN):
+    """Gra pulami kuponów (S, K) przeciw `losowan` uczciwym losowaniom
+
+    Losowania dzielone są na zadania po jednym bloku; każde zadanie ma
+    własny, niezależny strumień liczb losowych z SeedSequence.spawn.
+    Zwraca słownik z macierzą 'trafienia' (S, 7), częstościami i 95%
+    przedziałami ufności.
+    """
+    zadania = [(potomne, min(blok, losowan - poczatek), blok)
+               for potomne, poczatek in zip(np.random.SeedSequence(ziarno).spawn(-(-losowan // blok)),
+                                            range(0, losowan, blok))]
+
+    if procesy > 1 and len(zadania) > 1:
+        with ProcessPoolExecutor(max_workers=procesy, initializer=_inicjuj_proces,
+                                 initargs=(pule,)) as pula:
+            trafienia = sum(pula.map(_zadanie, zadania))
+    else:
+        _inicjuj_proces(pule)
+        trafienia = sum(_zadanie(z) for z in zadania)
+
+    dolny, gorny = przedzial_wilsona(trafienia, losowan)
+    return {
+        'losowan': losowan,
+        'trafienia': trafienia,
+        'czestosc': trafienia / losowan,
+        'dolny': dolny,
+        'gorny': gorny,
+        'oczekiwane': prawdopodobienstwo_trafien(),
+    }
+
+
+def wyswietl_raport(nazwy, wynik):
+    """Tabela częstości wygranych każdej strategii na tle kuponów losowych"""
+    czestosc, dolny, gorny = wynik['czestosc'], wynik['dolny'], wynik['gorny']
+
+    print("=" * 72)
+    print("🎲 SYMULACJA MONTE CARLO STRATEGII")
+    print("=" * 72)
+    print(f"Uczciwych losowań na strategię: {wynik['losowan']:,}")
+    print("Dokładne prawdopodobieństwa: " + ", ".join(
+        f"{NAZWY_TRAFIEN[j]} {wynik['oczekiwane'][j]:.3e}" for j in range(3, 7)))
+
+    for j in range(3, 7):
+        print(f"\n{NAZWY_TRAFIEN[j].capitalize()} (częstość, 95% przedział, względem losowych):")
+        for s, nazwa in enumerate(nazwy):
+            wzgledem = f"x{czestosc[s, j] / czestosc[0, j]:.3f}" if czestosc[0, j] else "-"
+            print(f"  {nazwa:16s} {czestosc[s, j]:.3e}  [{dolny[s, j]:.3e}, {gorny[s, j]:.3e}]  {wzgledem}")
+
+    print("\nNakładające się przedziały ufności oznaczają brak wykrywalnej różnicy")
+    print("między strategią a kuponami czysto losowymi.")
+    print("=" * 72)
+
+
+def main():
+    """Punkt wejścia CLI"""
+    parser = argparse.ArgumentParser(description="Symulacja Monte Carlo strategii generatora lotto")
+    parser.add_argument('--strategie', nargs='+',
+                        default=['gorace', 'zimne', 'mieszana', 'pozycyjna', 'sekwencje',
+                                 'dziesiatki', 'ostatnie_trendy'],
+                        help="strategie do porównania z kuponami losowymi")
+    parser.add_argument('--losowan', type=int, default=10_000_000, help="liczba symulowanych losowań")
+    parser.add_argument('--kuponow', type=int, default=KUPONOW_W_PULI, help="kuponów w puli każdej strategii")
+    parser.add_argument('--procesy', type=int, default=0,
+                        help=f"liczba procesów roboczych (0 = {os.cpu_count()}, tyle ile rdzeni)")
+    parser.add_argument('--ziarno', type=int, help="ziarno dla powtarzalnych wyników")
+    args = parser.parse_args()
+
+    try:
+        nazwy, pule = pule_strategii(args.strategie, args.kuponow, args.ziarno)
+    except ValueError as e:
+        print(f"❌ Błąd: {e}")
+        sys.exit(1)
+
+    wynik = symuluj(pule, args.losowan, procesy=args.procesy or os.cpu_count(), ziarno=args.ziarno)
+    wyswietl_raport(nazwy, wynik)
+
+
+if __name__ == "__main__":
+    main()
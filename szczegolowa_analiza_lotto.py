@@ -3,325 +3,310 @@
 Szczegółowa analiza wyników lotto z wizualizacjami
 """
 
-import pandas as pd
+import importlib.util
+from collections import Counter
+
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from datetime import datetime
-from collections import Counter, defaultdict
-import re
 
-# Ustawienia dla polskich znaków
-plt.rcParams['font.size'] = 10
-plt.style.use('default')
+from dane_lotto import KOLUMNY_LICZB, SCIEZKA_HISTORII, ramka_danych, wczytaj_historie, wynik_analizy
+from statystyki_lotto import (LICZB_W_LOSOWANIU, LICZBY, macierz_pozycyjna_historii, najczestsze, przerwy_historii,
+                              rozklad_pozycyjny, skumulowane_czestotliwosci, statystyka_czestotliwosci,
+                              statystyka_sekwencji, szereg_chi2)
+from wykresy_lotto import KATALOG_WYKRESOW, generuj_wykresy
+from wspolwystepowanie import (macierz_par_historii, najczestsi_partnerzy, najczestsze_pary,
+                               najczestsze_podzbiory, oczekiwane_wsparcie)
 
 def wczytaj_dane_lotto(plik_csv):
     """Wczytuje dane z pliku CSV i przetwarza je"""
-    dane = []
-    
-    with open(plik_csv, 'r', encoding='utf-8') as f:
-        for linia in f:
-            linia = linia.strip()
-            if not linia:
-                continue
-                
-            parts = linia.split(' ')
-            if len(parts) >= 3:
-                numer_losowania = parts[0].rstrip('.')
-                data_str = parts[1]
-                liczby_str = ' '.join(parts[2:])
-                
-                try:
-                    data = datetime.strptime(data_str, '%d.%m.%Y')
-                except:
-                    continue
-                
-                try:
-                    liczby = [int(x) for x in liczby_str.split(',')]
-                    if len(liczby) == 6:
-                        dane.append({
-                            'numer_losowania': int(numer_losowania),
-                            'data': data,
-                            'liczby': sorted(liczby),
-                            'suma': sum(liczby),
-                            'srednia': np.mean(liczby),
-                            'parzyste': sum(1 for x in liczby if x % 2 == 0),
-                            'rok': data.year,
-                            'miesiac': data.month
-                        })
-                except:
-                    continue
-    
-    return pd.DataFrame(dane)
+    return ramka_danych(wczytaj_historie(plik_csv))
 
-def analiza_statystyczna_czestotliwosci(df):
+def analiza_statystyczna_czestotliwosci(historia):
     """Szczegółowa analiza statystyczna częstotliwości"""
     print("=== SZCZEGÓŁOWA ANALIZA CZĘSTOTLIWOŚCI ===")
     
-    wszystkie_liczby = []
-    for _, row in df.iterrows():
-        wszystkie_liczby.extend(row['liczby'])
-    
-    czestotliwosc = Counter(wszystkie_liczby)
+    wynik = wynik_analizy(historia, 'statystyka_czestotliwosci', lambda h: statystyka_czestotliwosci(h.liczby),
+                          wersja=2)
+    czestotliwosc = wynik['czestotliwosc']
+    srednia_czest = wynik['srednia']
     
-    # Teoretyczna częstotliwość (przy idealnej losowości)
-    teoretyczna_czestotliwosc = len(df) * 6 / 49
-    
-    print(f"Teoretyczna częstotliwość przy idealnej losowości: {teoretyczna_czestotliwosc:.1f}")
-    print(f"Odchylenie standardowe częstotliwości: {np.std(list(czestotliwosc.values())):.1f}")
+    print(f"Teoretyczna częstotliwość przy idealnej losowości: {wynik['oczekiwana']:.1f}")
+    print(f"Odchylenie standardowe częstotliwości: {wynik['odchylenie']:.1f}")
     
     # Test chi-kwadrat dla równomierności rozkładu
-    obserwowane = np.array(list(czestotliwosc.values()))
-    oczekiwane = np.full(49, teoretyczna_czestotliwosc)
-    chi2 = np.sum((obserwowane - oczekiwane)**2 / oczekiwane)
-    
-    print(f"Statystyka chi-kwadrat: {chi2:.2f}")
-    print(f"Stopnie swobody: 48")
-    print(f"Wartość krytyczna dla α=0.05: 66.34")
+    print(f"Statystyka chi-kwadrat: {wynik['chi2']:.2f}")
+    print(f"Stopnie swobody: {wynik['stopnie_swobody']}")
+    print(f"p-value: {wynik['p_value']:.4f}")
     
-    if chi2 > 66.34:
+    if wynik['p_value'] < 0.05:
         print("WNIOSEK: Rozkład NIE jest równomierny (p < 0.05)")
     else:
         print("WNIOSEK: Rozkład jest równomierny (p >= 0.05)")
     
     # Znajdowanie liczb odstających
-    srednia_czest = np.mean(list(czestotliwosc.values()))
-    std_czest = np.std(list(czestotliwosc.values()))
-    
     print(f"\nLiczby znacząco powyżej średniej (>μ+2σ):")
-    for liczba, freq in czestotliwosc.items():
-        if freq > srednia_czest + 2 * std_czest:
-            print(f"  {liczba}: {freq} ({freq - srednia_czest:.1f} powyżej średniej)")
+    for liczba in wynik['powyzej']:
+        freq = czestotliwosc[liczba - 1]
+        print(f"  {liczba}: {freq} ({freq - srednia_czest:.1f} powyżej średniej)")
     
     print(f"\nLiczby znacząco poniżej średniej (<μ-2σ):")
-    for liczba, freq in czestotliwosc.items():
-        if freq < srednia_czest - 2 * std_czest:
-            print(f"  {liczba}: {freq} ({srednia_czest - freq:.1f} poniżej średniej)")
+    for liczba in wynik['ponizej']:
+        freq = czestotliwosc[liczba - 1]
+        print(f"  {liczba}: {freq} ({srednia_czest - freq:.1f} poniżej średniej)")
     
-    return czestotliwosc
+    return wynik
+
+def oblicz_korelacje_pozycyjna(historia):
+    macierz = macierz_pozycyjna_historii(historia)
+    rozklad = rozklad_pozycyjny(macierz)
+    return {
+        'srednie': rozklad['srednie'],
+        'kwantyle': rozklad['kwantyle'],
+        'poziomy_kwantyli': rozklad['poziomy_kwantyli'],
+        'pierwsza': najczestsze(macierz[0], 5),
+        'ostatnia': najczestsze(macierz[-1], 5),
+    }
 
-def analiza_korelacji_pozycyjnej(df):
+def analiza_korelacji_pozycyjnej(historia):
     """Analiza czy liczby mają tendencje do występowania na określonych pozycjach"""
     print("\n=== ANALIZA KORELACJI POZYCYJNEJ ===")
     
-    pozycje = {i: [] for i in range(1, 7)}
-    
-    for _, row in df.iterrows():
-        posortowane = sorted(row['liczby'])
-        for i, liczba in enumerate(posortowane):
-            pozycje[i+1].append(liczba)
+    wynik = wynik_analizy(historia, 'korelacja_pozycyjna', oblicz_korelacje_pozycyjna, wersja=2)
     
     print("Średnie wartości na poszczególnych pozycjach (po sortowaniu):")
-    for pozycja in range(1, 7):
-        srednia = np.mean(pozycje[pozycja])
+    for pozycja, srednia in enumerate(wynik['srednie'], 1):
         print(f"  Pozycja {pozycja}: {srednia:.1f}")
     
-    # Sprawdzenie czy pierwsza i ostatnia pozycja mają charakterystyczne liczby
-    pierwsza_pozycja = Counter(pozycje[1])
-    ostatnia_pozycja = Counter(pozycje[6])
+    poziomy = ', '.join(f"{poziom * 100:g}%" for poziom in wynik['poziomy_kwantyli'])
+    print(f"\nKwantyle liczb na pozycjach ({poziomy}):")
+    for pozycja, kwantyle in enumerate(wynik['kwantyle'], 1):
+        print(f"  Pozycja {pozycja}: {', '.join(map(str, kwantyle))}")
     
+    # Sprawdzenie czy pierwsza i ostatnia pozycja mają charakterystyczne liczby
     print(f"\nNajczęstsze liczby na pierwszej pozycji:")
-    for liczba, freq in pierwsza_pozycja.most_common(5):
+    for liczba, freq in wynik['pierwsza']:
         print(f"  {liczba}: {freq} razy")
     
     print(f"\nNajczęstsze liczby na ostatniej pozycji:")
-    for liczba, freq in ostatnia_pozycja.most_common(5):
+    for liczba, freq in wynik['ostatnia']:
         print(f"  {liczba}: {freq} razy")
+    
+    return wynik
 
-def analiza_cykli_czasowych(df):
+def oblicz_cykle_czasowe(historia):
+    df = ramka_danych(historia)
+    
+    # Sprawdzenie trendu liniowego
+    from scipy.stats import linregress
+    slope, intercept, r_value, p_value, std_err = linregress(df['numer_losowania'], df['suma'])
+    
+    return {
+        'miesiace': {int(m): float(suma) for m, suma in df.groupby('miesiac')['suma'].mean().items()},
+        'dziesieciolecia': {int(d): float(suma) for d, suma in df.groupby(df['rok'] // 10 * 10)['suma'].mean().items()},
+        'nachylenie': float(slope),
+        'r': float(r_value),
+        'p_value': float(p_value),
+    }
+
+def analiza_cykli_czasowych(historia):
     """Analiza cykli czasowych"""
     print("\n=== ANALIZA CYKLI CZASOWYCH ===")
     
+    wynik = wynik_analizy(historia, 'cykle_czasowe', oblicz_cykle_czasowe)
+    
     # Analiza według miesięcy
     print("Średnia suma według miesięcy:")
-    mieseczne_sumy = df.groupby('miesiac')['suma'].mean()
-    for miesiac, suma in mieseczne_sumy.items():
+    for miesiac, suma in wynik['miesiace'].items():
         print(f"  Miesiąc {miesiac:2d}: {suma:.1f}")
     
     # Analiza według dziesięcioleci
-    df['dziesieciolecie'] = (df['rok'] // 10) * 10
     print(f"\nŚrednia suma według dziesięcioleci:")
-    dziesieciolecia = df.groupby('dziesieciolecie')['suma'].mean()
-    for dzies, suma in dziesieciolecia.items():
+    for dzies, suma in wynik['dziesieciolecia'].items():
         print(f"  {dzies}s: {suma:.1f}")
     
-    # Sprawdzenie trendu liniowego
-    from scipy.stats import linregress
-    slope, intercept, r_value, p_value, std_err = linregress(df['numer_losowania'], df['suma'])
-    
+    slope, r_value = wynik['nachylenie'], wynik['r']
     print(f"\nAnaliza trendu liniowego sumy w czasie:")
     print(f"  Nachylenie: {slope:.6f}")
     print(f"  Korelacja (r): {r_value:.4f}")
-    print(f"  p-value: {p_value:.4f}")
+    print(f"  p-value: {wynik['p_value']:.4f}")
     
     if abs(r_value) > 0.1:
         print(f"  WNIOSEK: Istnieje {('dodatni' if slope > 0 else 'ujemny')} trend w czasie")
     else:
         print(f"  WNIOSEK: Brak znaczącego trendu czasowego")
-
-def analiza_zaawansowanych_wzorow(df):
-    """Analiza zaawansowanych wzorów"""
-    print("\n=== ANALIZA ZAAWANSOWANYCH WZORÓW ===")
     
+    return wynik
+
+def oblicz_zaawansowane_wzory(historia, okno=100):
     # Analiza liczb "gorących" i "zimnych"
-    ostatnie_100 = df.tail(100)
-    najnowsze_liczby = []
-    for _, row in ostatnie_100.iterrows():
-        najnowsze_liczby.extend(row['liczby'])
+    najnowsze_liczby = ramka_danych(historia)[KOLUMNY_LICZB].tail(okno).to_numpy().ravel().tolist()
     
     czestotliwosc_ostatnie = Counter(najnowsze_liczby)
     
-    print("Liczby 'gorące' (najczęstsze w ostatnich 100 losowaniach):")
-    for liczba, freq in czestotliwosc_ostatnie.most_common(10):
-        print(f"  {liczba}: {freq} razy")
+    return {
+        'gorace': czestotliwosc_ostatnie.most_common(10),
+        'zimne': czestotliwosc_ostatnie.most_common()[-10:],
+        'niewystepujace': sorted(set(range(1, 50)) - set(najnowsze_liczby)),
+        'histogram_dystansow': statystyka_sekwencji(historia.liczby)['histogram_dystansow'],
+    }
+
+def analiza_zaawansowanych_wzorow(historia, okno=100):
+    """Analiza zaawansowanych wzorów"""
+    print("\n=== ANALIZA ZAAWANSOWANYCH WZORÓW ===")
     
-    print("\nLiczby 'zimne' (najrzadsze w ostatnich 100 losowaniach):")
-    wszystkie_liczby_1_49 = set(range(1, 50))
-    liczby_w_ostatnich = set(najnowsze_liczby)
-    zimne_liczby = wszystkie_liczby_1_49 - liczby_w_ostatnich
+    wynik = wynik_analizy(historia, 'zaawansowane_wzory', lambda h: oblicz_zaawansowane_wzory(h, okno),
+                          {'okno': okno})
+    
+    print(f"Liczby 'gorące' (najczęstsze w ostatnich {okno} losowaniach):")
+    for liczba, freq in wynik['gorace']:
+        print(f"  {liczba}: {freq} razy")
     
-    if zimne_liczby:
-        print(f"  Liczby niewystępujące: {sorted(zimne_liczby)}")
+    print(f"\nLiczby 'zimne' (najrzadsze w ostatnich {okno} losowaniach):")
+    if wynik['niewystepujace']:
+        print(f"  Liczby niewystępujące: {wynik['niewystepujace']}")
     
-    for liczba, freq in czestotliwosc_ostatnie.most_common()[-10:]:
+    for liczba, freq in wynik['zimne']:
         print(f"  {liczba}: {freq} razy")
     
     # Analiza dystansu między liczbami
     print(f"\nAnaliza dystansów między sąsiednimi liczbami:")
-    dystanse = []
-    for _, row in df.iterrows():
-        posortowane = sorted(row['liczby'])
-        for i in range(1, len(posortowane)):
-            dystanse.append(posortowane[i] - posortowane[i-1])
-    
-    dystanse_counter = Counter(dystanse)
+    histogram_dystansow = wynik['histogram_dystansow']
     print("Najczęstsze dystanse:")
-    for dystans, freq in dystanse_counter.most_common(10):
-        print(f"  Dystans {dystans}: {freq} razy")
+    for dystans in np.argsort(-histogram_dystansow, kind='stable')[:10]:
+        print(f"  Dystans {dystans}: {histogram_dystansow[dystans]} razy")
+    
+    return wynik
+
+def oblicz_pary_liczb(historia):
+    pary = macierz_par_historii(historia)
+    czestotliwosc = np.diag(pary)
+    return {
+        'najczestsze': najczestsze_pary(pary, 10),
+        'najrzadsze': najczestsze_pary(pary, 5, rosnaco=True),
+        'partnerzy': [(int(liczba), najczestsi_partnerzy(pary, liczba))
+                      for liczba in np.argsort(-czestotliwosc, kind='stable')[:3] + 1],
+    }
+
+def analiza_par_liczb(historia):
+    """Analiza par liczb występujących razem w losowaniach"""
+    print("\n=== ANALIZA PAR LICZB ===")
+    
+    wynik = wynik_analizy(historia, 'pary_liczb', oblicz_pary_liczb)
+    
+    print("Najczęściej występujące razem pary:")
+    for a, b, ile, lift in wynik['najczestsze']:
+        print(f"  {a:2d} + {b:2d}: {ile} razy (lift {lift:.2f})")
+    
+    print("\nPary najrzadziej występujące razem:")
+    for a, b, ile, lift in wynik['najrzadsze']:
+        print(f"  {a:2d} + {b:2d}: {ile} razy (lift {lift:.2f})")
+    
+    print("\nNajczęstsi partnerzy liczb gorących:")
+    for liczba, partnerzy in wynik['partnerzy']:
+        print(f"  {liczba}: {', '.join(f'{p} ({ile})' for p, ile in partnerzy)}")
+    
+    return wynik
 
-def generuj_wizualizacje(df, czestotliwosc):
-    """Generuje wykresy i wizualizacje"""
+def oblicz_trojki_i_czworki(historia, ile=10):
+    return {k: (oczekiwane_wsparcie(len(historia), k), najczestsze_podzbiory(historia.liczby, k, ile))
+            for k in (3, 4)}
+
+def analiza_trojek_i_czworek(historia, ile=10):
+    """Analiza najczęstszych trójek i czwórek liczb"""
+    print("\n=== ANALIZA TRÓJEK I CZWÓREK LICZB ===")
+    
+    wynik = wynik_analizy(historia, 'trojki_i_czworki', lambda h: oblicz_trojki_i_czworki(h, ile), {'ile': ile})
+    
+    for k, nazwa in ((3, 'trójki'), (4, 'czwórki')):
+        oczekiwane, podzbiory = wynik[k]
+        print(f"\nNajczęstsze {nazwa} (oczekiwanie przy losowości: {oczekiwane:.2f}):")
+        for liczby, wsparcie, lift in podzbiory:
+            print(f"  {', '.join(map(str, liczby))}: {wsparcie} razy (lift {lift:.2f})")
+    
+    return wynik
+
+def analiza_przerw(historia):
+    """Analiza przerw między wystąpieniami liczb (liczby zaległe)"""
+    print("\n=== ANALIZA PRZERW (LICZBY ZALEGŁE) ===")
+    
+    przerwy = przerwy_historii(historia)
+    aktualne, maksymalne, srednie = przerwy.aktualne, przerwy.maksymalne, przerwy.srednie
+    p = LICZB_W_LOSOWANIU / LICZBY
+    print(f"Oczekiwana średnia przerwa przy losowości: {(1 - p) / p:.2f} losowań")
+    
+    print("\nLiczby najdłużej czekające na wylosowanie:")
+    for liczba in przerwy.zalegle(10):
+        i = liczba - 1
+        print(f"  {liczba:2d}: {aktualne[i]} losowań (średnio {srednie[i]:.2f}, rekord {maksymalne[i]})")
+    
+    print("\nNajdłuższe przerwy w historii:")
+    for i in np.argsort(-maksymalne, kind='stable')[:5]:
+        print(f"  {i + 1:2d}: {maksymalne[i]} losowań")
+    
+    histogram = przerwy.histogram.sum(axis=0)
+    print(f"\nPrzerw łącznie: {histogram.sum()}, wystąpienia w kolejnych losowaniach: {histogram[0]}")
+    
+    return przerwy
+
+def analiza_okien_chi2(historia, okna=(100, 500, 1000), prog=0.01):
+    """Test równomierności w przesuwnych oknach - okresy odbiegające od losowości"""
+    print("\n=== RÓWNOMIERNOŚĆ W PRZESUWNYCH OKNACH (CHI-KWADRAT) ===")
+    
+    szeregi = wynik_analizy(historia, 'okna_chi2',
+                            lambda h: szereg_chi2(skumulowane_czestotliwosci(h.liczby), okna, prog=prog),
+                            {'okna': list(okna), 'prog': prog}, wersja=2)
+    daty = historia.daty.astype('datetime64[D]')
+    for okno, wynik in szeregi.items():
+        odstajace = wynik['odstajace']
+        print(f"\nOkno {okno} losowań: {len(odstajace)} okien, p < {prog}: {odstajace.sum()} "
+              f"({odstajace.mean() * 100:.2f}%, przy losowości ok. {prog * 100:g}%)")
+        
+        # Sąsiednie odstające okna łączymy w okresy
+        zmiany = np.diff(np.concatenate(([0], odstajace.astype(np.int8), [0])))
+        for od, do in zip(np.flatnonzero(zmiany == 1), np.flatnonzero(zmiany == -1)):
+            najgorsze = od + np.argmin(wynik['p_value'][od:do])
+            poczatek = wynik['poczatki'][najgorsze]
+            print(f"  {daty[poczatek]} - {daty[poczatek + okno - 1]}: "
+                  f"chi2 = {wynik['chi2'][najgorsze]:.1f}, p = {wynik['p_value'][najgorsze]:.4f}")
+    
+    return szeregi
+
+def generuj_wizualizacje(historia, katalog=KATALOG_WYKRESOW):
+    """Generuje wykresy (bez okna, każdy w osobnym pliku PNG)"""
     print("\n=== GENEROWANIE WIZUALIZACJI ===")
     
-    # Wykres 1: Częstotliwość liczb
-    plt.figure(figsize=(15, 10))
-    
-    plt.subplot(2, 3, 1)
-    liczby = list(range(1, 50))
-    frequencies = [czestotliwosc[i] for i in liczby]
-    plt.bar(liczby, frequencies, color='skyblue', alpha=0.7)
-    plt.axhline(y=np.mean(frequencies), color='red', linestyle='--', label=f'Średnia: {np.mean(frequencies):.1f}')
-    plt.title('Częstotliwość wystąpień liczb')
-    plt.xlabel('Liczba')
-    plt.ylabel('Częstotliwość')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    
-    # Wykres 2: Rozkład sum
-    plt.subplot(2, 3, 2)
-    plt.hist(df['suma'], bins=30, alpha=0.7, color='lightgreen', edgecolor='black')
-    plt.axvline(x=df['suma'].mean(), color='red', linestyle='--', label=f'Średnia: {df["suma"].mean():.1f}')
-    plt.title('Rozkład sum wylosowanych liczb')
-    plt.xlabel('Suma')
-    plt.ylabel('Częstotliwość')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    
-    # Wykres 3: Liczby parzyste vs nieparzyste
-    plt.subplot(2, 3, 3)
-    parzyste_counts = df['parzyste'].value_counts().sort_index()
-    plt.bar(parzyste_counts.index, parzyste_counts.values, alpha=0.7, color='orange')
-    plt.title('Rozkład liczby parzystych w losowaniu')
-    plt.xlabel('Liczba parzystych')
-    plt.ylabel('Częstotliwość losowań')
-    plt.grid(True, alpha=0.3)
-    
-    # Wykres 4: Trend sum w czasie
-    plt.subplot(2, 3, 4)
-    # Wygładzenie trendu (moving average)
-    window = 100
-    df_sorted = df.sort_values('numer_losowania')
-    moving_avg = df_sorted['suma'].rolling(window=window).mean()
-    plt.plot(df_sorted['numer_losowania'], df_sorted['suma'], alpha=0.3, color='gray', markersize=1)
-    plt.plot(df_sorted['numer_losowania'], moving_avg, color='red', linewidth=2, label=f'Średnia krocząca ({window})')
-    plt.title('Trend sum w czasie')
-    plt.xlabel('Numer losowania')
-    plt.ylabel('Suma')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    
-    # Wykres 5: Heatmapa częstotliwości według dekad
-    plt.subplot(2, 3, 5)
-    dekady_data = []
-    for dekada in sorted(df['dziesieciolecie'].unique()):
-        dane_dekady = df[df['dziesieciolecie'] == dekada]
-        wszystkie_liczby_dekady = []
-        for _, row in dane_dekady.iterrows():
-            wszystkie_liczby_dekady.extend(row['liczby'])
-        czestotliwosc_dekady = Counter(wszystkie_liczby_dekady)
-        freq_array = [czestotliwosc_dekady.get(i, 0) for i in range(1, 50)]
-        dekady_data.append(freq_array)
-    
-    dekady_labels = [f"{int(d)}s" for d in sorted(df['dziesieciolecie'].unique())]
-    
-    if dekady_data:
-        heatmap_data = np.array(dekady_data)
-        sns.heatmap(heatmap_data, 
-                   xticklabels=list(range(1, 50)), 
-                   yticklabels=dekady_labels,
-                   cmap='YlOrRd', 
-                   cbar_kws={'label': 'Częstotliwość'})
-        plt.title('Częstotliwość liczb według dekad')
-        plt.xlabel('Liczba')
-        plt.ylabel('Dekada')
-    
-    # Wykres 6: Rozkład według dziesiątek
-    plt.subplot(2, 3, 6)
-    dziesiatki_data = [0] * 5
-    for _, row in df.iterrows():
-        for liczba in row['liczby']:
-            dziesiatka_idx = min((liczba - 1) // 10, 4)  # 41-49 idzie do indeksu 4
-            dziesiatki_data[dziesiatka_idx] += 1
-    
-    dziesiatki_labels = ['1-10', '11-20', '21-30', '31-40', '41-49']
-    plt.bar(dziesiatki_labels, dziesiatki_data, alpha=0.7, color='purple')
-    plt.title('Rozkład według dziesiątek')
-    plt.xlabel('Przedział')
-    plt.ylabel('Częstotliwość')
-    plt.xticks(rotation=45)
-    plt.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    plt.savefig('analiza_lotto_wykresy.png', dpi=300, bbox_inches='tight')
-    print("Zapisano wykresy do pliku: analiza_lotto_wykresy.png")
-    plt.show()
+    for plik, narysowany in generuj_wykresy(historia, katalog).values():
+        print(f"  {plik}{'' if narysowany else ' (bez zmian)'}")
+    print(f"Zapisano wykresy do katalogu: {katalog}")
 
-def main():
+def main(plik_historii=SCIEZKA_HISTORII):
     """Główna funkcja analizy"""
     print("Wczytywanie danych...")
-    df = wczytaj_dane_lotto('wyniki-lotto-all-time.csv')
+    historia = wczytaj_historie(plik_historii)
     
-    if df.empty:
+    if not len(historia):
         print("Nie udało się wczytać danych!")
         return
     
-    print(f"Wczytano {len(df)} losowań z okresu {df['data'].min()} - {df['data'].max()}")
+    print(f"Wczytano {len(historia)} losowań z okresu {historia.daty[0]} - {historia.daty[-1]}")
     
-    # Import scipy dla dodatkowych analiz
-    try:
-        import scipy.stats
+    # scipy jest importowane dopiero w analizach, które go potrzebują
+    if importlib.util.find_spec('scipy') is not None:
         print("Biblioteka scipy dostępna - pełna analiza statystyczna")
-    except ImportError:
+    else:
         print("Brak biblioteki scipy - ograniczona analiza statystyczna")
     
-    # Przeprowadzanie analiz
-    czestotliwosc = analiza_statystyczna_czestotliwosci(df)
-    analiza_korelacji_pozycyjnej(df)
-    analiza_cykli_czasowych(df)
-    analiza_zaawansowanych_wzorow(df)
+    # Przeprowadzanie analiz (wyniki z cache, jeśli historia się nie zmieniła)
+    analiza_statystyczna_czestotliwosci(historia)
+    analiza_korelacji_pozycyjnej(historia)
+    analiza_cykli_czasowych(historia)
+    analiza_zaawansowanych_wzorow(historia)
+    analiza_par_liczb(historia)
+    analiza_trojek_i_czworek(historia)
+    analiza_przerw(historia)
+    analiza_okien_chi2(historia)
     
     # Generowanie wizualizacji
-    generuj_wizualizacje(df, czestotliwosc)
+    generuj_wizualizacje(historia)
     
     print("\n" + "="*60)
     print("PODSUMOWANIE NAJWAŻNIEJSZYCH WNIOSKÓW:")
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Testy wczytywania kuponów do backtestu
+"""
+
+import numpy as np
+import pytest
+
+from backtest_lotto import backtest, wczytaj_kupony
+from dane_lotto import HistoriaLosowan
+
+
+def test_plik_tekstowy(tmp_path):
+    plik = tmp_path / 'kupony.txt'
+    plik.write_text("liczby\n1 2 3 4 5 6\n49,48,47,46,45,44\n\n")
+    assert wczytaj_kupony(str(plik)).tolist() == [[1, 2, 3, 4, 5, 6], [49, 48, 47, 46, 45, 44]]
+
+
+def test_plik_tekstowy_z_niepelnymi_liniami(tmp_path):
+    plik = tmp_path / 'kupony.txt'
+    plik.write_text("1 2 3 4 5 6\n1 2 3 4 5\n1 2 3 4 5 6 7\n")
+    with pytest.raises(ValueError, match="2 z 3"):
+        wczytaj_kupony(str(plik))
+
+
+def test_macierz_innego_ksztaltu_odrzucana(tmp_path):
+    plik = str(tmp_path / 'kupony.npy')
+    np.save(plik, np.arange(1, 43).reshape(6, 7))
+    historia = HistoriaLosowan(np.array([[1, 2, 3, 4, 5, 6]]), np.zeros(1, dtype='datetime64[D]'),
+                               np.arange(1, dtype=np.int32))
+    with pytest.raises(ValueError):
+        backtest(wczytaj_kupony(plik), historia)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Testy wsadowego generatora: powtarzalność z ziarnem i kupony pojedyncze
+"""
+
+import numpy as np
+import pytest
+
+from generator_wsadowy import (PIERWSZY_BLOK, blok_kuponu, dostosuj_kupon, losuj_wsad, odtworz_kupon,
+                               plany_strategii, rozmiar_bloku)
+from inteligentny_generator import InteligentnyGeneratorLotto
+from lotto_generator import InteligentnyLottoGenerator
+from statystyki_lotto import aliasy_pozycji
+
+
+def plan(strategia):
+    return plany_strategii(range(1, 11), range(40, 50), range(11, 40), range(1, 11), range(1, 11),
+                           range(40, 50), aliasy_pozycji(np.ones((6, 49))))[strategia]
+
+
+def test_bloki_rosna_do_pelnego():
+    assert [rozmiar_bloku(j, 1024) for j in range(6)] == [64, 128, 256, 512, 1024, 1024]
+    poczatek = 0
+    for numer in range(8):
+        assert blok_kuponu(poczatek, 1024) == (numer, 0)
+        assert blok_kuponu(poczatek + rozmiar_bloku(numer, 1024) - 1, 1024) == (numer, rozmiar_bloku(numer, 1024) - 1)
+        poczatek += rozmiar_bloku(numer, 1024)
+
+
+def test_wsad_z_ziarnem_nie_zalezy_od_procesow_ani_dlugosci():
+    kroki = plan('sekwencje')
+    wsad = losuj_wsad(kroki, 5000, 11, blok=1024)
+    np.testing.assert_array_equal(losuj_wsad(kroki, 5000, 11, procesy=3, blok=1024), wsad)
+    np.testing.assert_array_equal(losuj_wsad(kroki, 700, 11, blok=1024), wsad[:700])
+    np.testing.assert_array_equal(losuj_wsad(kroki, 1, 11, blok=1024), wsad[:1])
+    for indeks in (0, PIERWSZY_BLOK - 1, PIERWSZY_BLOK, 1983, 1984, 4999):
+        np.testing.assert_array_equal(odtworz_kupon(kroki, 11, indeks, blok=1024), wsad[indeks])
+
+
+def test_filtr_bez_kuponow_konczy_sie_bledem():
+    przepuszczone = []
+
+    def filtr(kupony):
+        # Przepuszcza tylko jeden kupon w całym wsadzie
+        wynik = kupony[:1 - len(przepuszczone)]
+        przepuszczone.extend(wynik)
+        return wynik
+    with pytest.raises(ValueError):
+        losuj_wsad(plan('gorace'), 5, 0, filtr=filtr)
+    assert len(przepuszczone) == 1
+
+
+@pytest.mark.parametrize('liczby', [[1, 1, 3], [2, 4, 6, 8, 10, 12, 14, 3], [5, 6, 7, 8, 9, 10]])
+def test_dostosuj_kupon(liczby):
+    kupon = dostosuj_kupon(liczby, 0)
+    assert len(np.unique(kupon)) == 6 and kupon.min() >= 1 and kupon.max() <= 49
+    assert np.count_nonzero(kupon % 2 == 0) == 3
+    # Liczby już spełniające kryteria zostają bez zmian
+    assert dostosuj_kupon(kupon, 1).tolist() == kupon.tolist()
+
+
+def test_dostosuj_kupon_odrzuca_liczby_spoza_zakresu():
+    with pytest.raises(ValueError):
+        dostosuj_kupon([0, 1, 2, 3, 4, 5])
+
+
+def test_strategie_pojedyncze_to_pierwszy_kupon_wsadu():
+    generator = InteligentnyLottoGenerator()
+    for strategia in generator.strategie:
+        kupon = getattr(generator, f'generuj_strategie_{strategia}')(7)
+        assert kupon == generator.generate_batch(strategia, 1, 7)[0].tolist()
+        assert kupon == generator.replay_ticket(strategia, 7, 0).tolist()
+    generator = InteligentnyGeneratorLotto()
+    for strategia in ('gorace', 'zimne', 'mieszana', 'pozycyjna', 'sekwencje', 'dziesiatki'):
+        kupon = getattr(generator, f'generuj_strategia_{strategia}')(7)
+        assert kupon == generator.generate_batch(strategia, 1, 7)[0].tolist()
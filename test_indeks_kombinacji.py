@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Testy indeksu kombinacji: filtrowanie partii i jego narzut względem losowania
+"""
+
+import time
+
+import numpy as np
+
+from dane_lotto import HistoriaLosowan
+from generator_wsadowy import losuj_wsad, plany_strategii
+from indeks_kombinacji import IndeksKombinacji, pusta_bitmapa, ustaw_nowe, zawiera
+from kupony_lotto import kupony_na_rangi
+from statystyki_lotto import aliasy_pozycji
+
+
+def plan(strategia):
+    return plany_strategii(range(1, 11), range(40, 50), range(11, 40), range(1, 11), range(1, 11),
+                           range(40, 50), aliasy_pozycji(np.ones((6, 49))))[strategia]
+
+
+def test_ustaw_nowe_przepuszcza_pierwsze_wystapienia():
+    bitmapa = pusta_bitmapa()
+    assert ustaw_nowe(bitmapa, [5, 7, 5, 9, 7, 5]).tolist() == [True, True, False, True, False, False]
+    assert ustaw_nowe(bitmapa, [9, 11, 11]).tolist() == [False, True, False]
+    assert zawiera(bitmapa, [5, 7, 9, 11, 6]).tolist() == [True, True, True, True, False]
+
+
+def test_filtr_partii_blisko_surowego_losowania():
+    """Filtr partii (indeks + bez powtórzeń) kosztuje niewiele ponad samo losowanie"""
+    kroki = plan('mieszana')
+    historia = HistoriaLosowan(losuj_wsad(kroki, 5000, 0), np.zeros(5000, dtype='datetime64[D]'),
+                               np.arange(5000, dtype=np.int32))
+    indeks = IndeksKombinacji(historia)
+
+    # Pomiary parami na przemian, żeby obciążenie maszyny dotykało obu tak samo;
+    # mediana stosunków w parach nie zależy od pojedynczego szczęśliwego pomiaru
+    czasy_filtra, czasy_surowe = [], []
+    for _ in range(5):
+        filtr, wylosowanych = indeks.filtr_partii(), 0
+
+        def liczacy(kupony):
+            nonlocal wylosowanych
+            wylosowanych += len(kupony)
+            return filtr(kupony)
+
+        poczatek = time.perf_counter()
+        kupony = losuj_wsad(kroki, 500_000, 1, filtr=liczacy)
+        czasy_filtra.append(time.perf_counter() - poczatek)
+
+        poczatek = time.perf_counter()
+        losuj_wsad(kroki, wylosowanych, 1)
+        czasy_surowe.append(time.perf_counter() - poczatek)
+
+    rangi = kupony_na_rangi(kupony)
+    assert len(np.unique(rangi)) == len(kupony)
+    assert not indeks.zawiera(kupony).any()
+    assert np.median(np.divide(czasy_filtra, czasy_surowe)) < 1.25
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Testy zapisu kuponów jako rang kolex: zamiana w obie strony, plik .kup i odrzucanie błędnych kuponów
+"""
+
+import numpy as np
+import pytest
+
+from kombinacje import liczba_kombinacji
+from kupony_lotto import (dopisz_kupony, kupony_na_rangi, otworz_rangi, rangi_na_kupony, wczytaj_kupony,
+                          zapisz_kupony)
+
+
+def test_rangi_w_obie_strony():
+    rangi = np.array([0, 1, 12345, liczba_kombinacji(6) - 1])
+    kupony = rangi_na_kupony(rangi)
+    assert kupony[0].tolist() == [1, 2, 3, 4, 5, 6]
+    assert kupony[-1].tolist() == [44, 45, 46, 47, 48, 49]
+    assert kupony_na_rangi(kupony).tolist() == rangi.tolist()
+    # Kolejność liczb na kuponie nie zmienia rangi
+    assert kupony_na_rangi(kupony[:, ::-1]).tolist() == rangi.tolist()
+
+
+def test_plik_kup_zapis_dopisanie_odczyt(tmp_path):
+    plik = str(tmp_path / 'kupony.kup')
+    pierwsze = rangi_na_kupony(np.arange(0, 5_000_000, 997))
+    drugie = [[49, 1, 17, 33, 2, 8], [6, 5, 4, 3, 2, 1]]
+    assert zapisz_kupony(plik, pierwsze) == len(pierwsze)
+    assert dopisz_kupony(plik, drugie) == len(pierwsze) + 2
+
+    kupony = wczytaj_kupony(plik)
+    assert kupony.dtype == np.uint8
+    np.testing.assert_array_equal(kupony[:len(pierwsze)], pierwsze)
+    np.testing.assert_array_equal(kupony[len(pierwsze):], np.sort(drugie, axis=1))
+    assert len(otworz_rangi(plik)) == len(pierwsze) + 2
+
+
+@pytest.mark.parametrize('kupony', [
+    [[0, 1, 2, 3, 4, 5]],
+    [[1, 2, 3, 4, 5, 50]],
+    [[1, 1, 1, 1, 1, 1]],
+    [[1, 2, 3, 4, 5, 6], [7, 8, 9, 10, 10, 11]],
+    [1, 2, 3, 4, 5, 6],
+    np.arange(1, 43).reshape(6, 7),
+])
+def test_bledne_kupony_odrzucane(tmp_path, kupony):
+    plik = str(tmp_path / 'kupony.kup')
+    with pytest.raises(ValueError):
+        kupony_na_rangi(kupony)
+    with pytest.raises(ValueError):
+        zapisz_kupony(plik, kupony)
+    zapisz_kupony(plik, [[1, 2, 3, 4, 5, 6]])
+    with pytest.raises(ValueError):
+        dopisz_kupony(plik, kupony)
+    assert wczytaj_kupony(plik).tolist() == [[1, 2, 3, 4, 5, 6]]
@@ -6,7 +6,6 @@ Uruchom to lokalnie aby przetestować czy powiadomienia działają
 
 import os
 import subprocess
-import sys
 
 def test_pushover():
     """Testuje wysłanie powiadomienia przez Pushover"""
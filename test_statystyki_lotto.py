@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Testy kalibracji testów chi-kwadrat na symulowanych uczciwych losowaniach
+"""
+
+import warnings
+
+import numpy as np
+
+from statystyki_lotto import (LICZB_W_LOSOWANIU, LICZBY, chi2_sf, skumulowane_czestotliwosci,
+                              statystyka_czestotliwosci, szereg_chi2)
+
+
+def symuluj_losowania(losowan, ziarno=0):
+    """Macierz (N, 6) uczciwych losowań 6 z 49 bez zwracania"""
+    los = np.random.default_rng(ziarno)
+    return np.sort(np.argsort(los.random((losowan, LICZBY)), axis=1)[:, :LICZB_W_LOSOWANIU] + 1, axis=1)
+
+
+def test_chi2_sf_w_zerze():
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        assert chi2_sf(0.0, LICZBY - 1) == 1.0
+
+
+def test_statystyka_czestotliwosci_ma_srednia_48():
+    chi2 = [statystyka_czestotliwosci(symuluj_losowania(200, ziarno))['chi2'] for ziarno in range(400)]
+    assert abs(np.mean(chi2) - (LICZBY - 1)) < 1.5
+
+
+def test_szereg_chi2_oznacza_okolo_prog_okien():
+    prog = 0.05
+    skumulowane = skumulowane_czestotliwosci(symuluj_losowania(200000))
+    odstajace = szereg_chi2(skumulowane, okna=(100,), krok=100, prog=prog)[100]['odstajace']
+    assert abs(odstajace.mean() - prog) < 0.015
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Współwystępowanie liczb w losowaniach - pary, trójki i czwórki liczb
+"""
+
+import math
+
+import numpy as np
+
+from dane_lotto import tablica_pochodna
+from kombinacje import liczba_kombinacji, podzbiory_losowan, ranga_kolex, z_rangi_kolex
+from statystyki_lotto import LICZBY, LICZB_W_LOSOWANIU, macierz_jedynkowa
+
+# Prawdopodobieństwo, że konkretna para liczb padnie w jednym losowaniu 6 z 49
+P_PARY = (LICZB_W_LOSOWANIU / LICZBY) * ((LICZB_W_LOSOWANIU - 1) / (LICZBY - 1))
+
+# Tyle losowań naraz mnożymy jako float32 - wynik jest dokładny, bo
+# żadna suma w bloku nie przekracza 2**24
+BLOK_LOSOWAN = 1 << 16
+
+
+def macierz_par(liczby):
+    """Macierz (49, 49) int64: ile razy liczby i+1 oraz j+1 padły razem
+
+    Liczona jako X.T @ X z macierzy jedynkowej losowań; na przekątnej są
+    częstotliwości pojedynczych liczb.
+    """
+    liczby = np.asarray(liczby)
+    pary = np.zeros((LICZBY, LICZBY), dtype=np.int64)
+    for poczatek in range(0, len(liczby), BLOK_LOSOWAN):
+        x = macierz_jedynkowa(liczby[poczatek:poczatek + BLOK_LOSOWAN]).astype(np.float32)
+        pary += (x.T @ x).astype(np.int64)
+    return pary
+
+
+def dodaj_losowanie(pary, liczby):
+    """Aktualizuje macierz par w miejscu o jedno losowanie (36 komórek)
+
+    liczby to jedno losowanie (6,) albo macierz (N, 6) kolejnych losowań.
+    """
+    indeksy = np.asarray(liczby, dtype=np.intp).reshape(-1, LICZB_W_LOSOWANIU) - 1
+    np.add.at(pary, (indeksy[:, :, None], indeksy[:, None, :]), 1)
+    return pary
+
+
+def macierz_par_historii(historia):
+    """Macierz par całej historii, trzymana w cache obok historii
+
+    Po dopisaniu nowych losowań zapisana macierz jest tylko uzupełniana
+    przez dodaj_losowanie. Zwracana jest kopia z prawem zapisu (nie
+    memmap cache), więc można ją dalej aktualizować dodaj_losowanie.
+    """
+    return np.array(tablica_pochodna(historia, 'pary', lambda h: macierz_par(h.liczby),
+                                     lambda pary, nowe: dodaj_losowanie(pary, nowe.liczby)))
+
+
+def liczba_losowan(pary):
+    """Liczba losowań, z których policzono macierz (z sumy przekątnej)"""
+    return int(np.trace(pary)) // LICZB_W_LOSOWANIU
+
+
+def najczestsi_partnerzy(pary, liczba, ile=5):
+    """Liczby, które najczęściej padały razem z `liczba`: lista (partner, ile razy)"""
+    wiersz = np.array(pary[liczba - 1], dtype=np.int64)
+    wiersz[liczba - 1] = -1
+    kolejnosc = np.argsort(-wiersz, kind='stable')[:ile]
+    return [(int(i) + 1, int(wiersz[i])) for i in kolejnosc]
+
+
+def macierz_lift(pary):
+    """Stosunek obserwowanej liczby wystąpień każdej pary do oczekiwanej"""
+    oczekiwana = liczba_losowan(pary) * P_PARY
+    lift = np.asarray(pary, dtype=np.float64) / oczekiwana if oczekiwana else np.zeros((LICZBY, LICZBY))
+    np.fill_diagonal(lift, np.nan)
+    return lift
+
+
+def lift_pary(pary, a, b):
+    """Lift pary (a, b) względem oczekiwania przy losowaniu 6 z 49"""
+    oczekiwana = liczba_losowan(pary) * P_PARY
+    return float(pary[a - 1, b - 1] / oczekiwana) if oczekiwana else float('nan')
+
+
+def pary_w_oknie(historia, od=None, do=None):
+    """Macierz par dla losowań z dat [od, do) (daty jak np.datetime64 lub 'RRRR-MM-DD')"""
+    daty = historia.daty
+    poczatek = 0 if od is None else int(np.searchsorted(daty, np.datetime64(od, 'D')))
+    koniec = len(historia) if do is None else int(np.searchsorted(daty, np.datetime64(do, 'D')))
+    return macierz_par(historia.liczby[poczatek:koniec])
+
+
+def najczestsze_pary(pary, ile=10, wg_lift=False, rosnaco=False):
+    """Najczęstsze pary: lista (a, b, ile razy, lift) posortowana malejąco
+
+    Przy rosnaco=True zwraca pary najrzadsze.
+    """
+    gorny = np.triu_indices(LICZBY, k=1)
+    liczniki = np.asarray(pary)[gorny]
+    lift = macierz_lift(pary)[gorny]
+    klucz = lift if wg_lift else liczniki
+    if not rosnaco:
+        klucz = -klucz
+    kolejnosc = np.argsort(klucz, kind='stable')[:ile]
+    return [(int(gorny[0][i]) + 1, int(gorny[1][i]) + 1, int(liczniki[i]), float(lift[i]))
+            for i in kolejnosc]
+
+
+def licznosc_podzbiorow(liczby, k):
+    """Ile razy padł każdy k-elementowy podzbiór (indeks = ranga kolex)
+
+    Każde losowanie daje C(6, k) podzbiorów; liczone blokami przez
+    np.bincount, więc pamięć nie rośnie z długością historii.
+    """
+    liczby = np.asarray(liczby)
+    licznosc = np.zeros(liczba_kombinacji(k), dtype=np.int64)
+    for poczatek in range(0, len(liczby), BLOK_LOSOWAN):
+        rangi = ranga_kolex(podzbiory_losowan(liczby[poczatek:poczatek + BLOK_LOSOWAN], k))
+        licznosc += np.bincount(rangi.ravel(), minlength=len(licznosc))
+    return licznosc
+
+
+def oczekiwane_wsparcie(losowan, k):
+    """Oczekiwana liczba wystąpień konkretnego k-podzbioru (rozkład hipergeometryczny)"""
+    return losowan * math.comb(LICZBY - k, LICZB_W_LOSOWANIU - k) / math.comb(LICZBY, LICZB_W_LOSOWANIU)
+
+
+def najczestsze_podzbiory(liczby, k=3, ile=10):
+    """Najczęstsze k-elementowe podzbiory w historii
+
+    Zwraca listę (liczby, wsparcie, lift) posortowaną malejąco po wsparciu,
+    gdzie lift to stosunek wsparcia do oczekiwania hipergeometrycznego.
+    """
+    licznosc = licznosc_podzbiorow(liczby, k)
+    oczekiwane = oczekiwane_wsparcie(len(liczby), k)
+
+    najlepsze = np.argsort(-licznosc, kind='stable')[:ile]
+    return [(tuple(int(x) for x in kombinacja), int(licznosc[r]),
+             float(licznosc[r] / oczekiwane) if oczekiwane else float('nan'))
+            for kombinacja, r in zip(z_rangi_kolex(najlepsze, k), najlepsze)]
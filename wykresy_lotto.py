@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Wykresy analizy lotto renderowane bez okna (backend Agg)
+Każdy wykres to osobny plik, rysowany w osobnym procesie; wykresy są
+pomijane, gdy historia losowań nie zmieniła się od ostatniego rysowania.
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from statystyki_lotto import LICZB_W_LOSOWANIU, LICZBY, skumulowane_czestotliwosci, szereg_chi2
+
+KATALOG_WYKRESOW = 'wykresy'
+WERSJA_WYKRESOW = 2
+OKNO_SREDNIEJ = 100
+OKNA_CHI2 = (100, 500, 1000)
+PROG_CHI2 = 0.01
+ETYKIETY_DZIESIATEK = ['1-10', '11-20', '21-30', '31-40', '41-49']
+
+
+def dane_wykresow(historia):
+    """Zwektoryzowane agregaty potrzebne do wszystkich wykresów"""
+    liczby = np.asarray(historia.liczby)
+    skumulowane = skumulowane_czestotliwosci(liczby)
+    czestotliwosc = skumulowane[-1]
+    sumy = liczby.sum(axis=1, dtype=np.int64)
+
+    # Średnia krocząca sum z sum skumulowanych
+    skumulowane_sumy = np.concatenate(([0], np.cumsum(sumy)))
+    srednia_kroczaca = np.full(len(sumy), np.nan)
+    srednia_kroczaca[OKNO_SREDNIEJ - 1:] = (skumulowane_sumy[OKNO_SREDNIEJ:]
+                                            - skumulowane_sumy[:-OKNO_SREDNIEJ]) / OKNO_SREDNIEJ
+
+    # Częstotliwości w dziesięcioleciach jako różnice sum skumulowanych na granicach
+    dekady = (historia.daty.astype('datetime64[Y]').astype(np.int64) + 1970) // 10 * 10
+    granice = np.concatenate(([0], np.flatnonzero(np.diff(dekady)) + 1, [len(dekady)]))
+
+    return {
+        'czestotliwosc': czestotliwosc,
+        'sumy': sumy,
+        'parzyste': np.bincount((liczby % 2 == 0).sum(axis=1), minlength=LICZB_W_LOSOWANIU + 1),
+        'numery': np.asarray(historia.numery),
+        'srednia_kroczaca': srednia_kroczaca,
+        'dekady': dekady[granice[:-1]],
+        'czestotliwosc_dekad': np.diff(skumulowane[granice], axis=0),
+        'dziesiatki': np.add.reduceat(czestotliwosc, [0, 10, 20, 30, 40]),
+        'daty': historia.daty,
+        'chi2': szereg_chi2(skumulowane, OKNA_CHI2, prog=PROG_CHI2),
+    }
+
+
+def wykres_czestotliwosci(plt, dane):
+    czestotliwosc = dane['czestotliwosc']
+    plt.bar(range(1, LICZBY + 1), czestotliwosc, color='skyblue', alpha=0.7)
+    plt.axhline(y=czestotliwosc.mean(), color='red', linestyle='--', label=f'Średnia: {czestotliwosc.mean():.1f}')
+    plt.title('Częstotliwość wystąpień liczb')
+    plt.xlabel('Liczba')
+    plt.ylabel('Częstotliwość')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+
+
+def wykres_sum(plt, dane):
+    sumy = dane['sumy']
+    plt.hist(sumy, bins=30, alpha=0.7, color='lightgreen', edgecolor='black')
+    plt.axvline(x=sumy.mean(), color='red', linestyle='--', label=f'Średnia: {sumy.mean():.1f}')
+    plt.title('Rozkład sum wylosowanych liczb')
+    plt.xlabel('Suma')
+    plt.ylabel('Częstotliwość')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+
+
+def wykres_parzystych(plt, dane):
+    parzyste = dane['parzyste']
+    plt.bar(np.flatnonzero(parzyste), parzyste[parzyste > 0], alpha=0.7, color='orange')
+    plt.title('Rozkład liczby parzystych w losowaniu')
+    plt.xlabel('Liczba parzystych')
+    plt.ylabel('Częstotliwość losowań')
+    plt.grid(True, alpha=0.3)
+
+
+def wykres_trendu_sum(plt, dane):
+    plt.plot(dane['numery'], dane['sumy'], alpha=0.3, color='gray', markersize=1)
+    plt.plot(dane['numery'], dane['srednia_kroczaca'], color='red', linewidth=2,
+             label=f'Średnia krocząca ({OKNO_SREDNIEJ})')
+    plt.title('Trend sum w czasie')
+    plt.xlabel('Numer losowania')
+    plt.ylabel('Suma')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+
+
+def wykres_dekad(plt, dane):
+    plt.imshow(dane['czestotliwosc_dekad'], aspect='auto', cmap='YlOrRd', interpolation='nearest',
+               extent=(0.5, LICZBY + 0.5, len(dane['dekady']) - 0.5, -0.5))
+    plt.colorbar(label='Częstotliwość')
+    plt.yticks(range(len(dane['dekady'])), [f"{d}s" for d in dane['dekady']])
+    plt.xticks(range(1, LICZBY + 1), fontsize=6)
+    plt.title('Częstotliwość liczb według dekad')
+    plt.xlabel('Liczba')
+    plt.ylabel('Dekada')
+
+
+def wykres_dziesiatek(plt, dane):
+    plt.bar(ETYKIETY_DZIESIATEK, dane['dziesiatki'], alpha=0.7, color='purple')
+    plt.title('Rozkład według dziesiątek')
+    plt.xlabel('Przedział')
+    plt.ylabel('Częstotliwość')
+    plt.xticks(rotation=45)
+    plt.grid(True, alpha=0.3)
+
+
+def wykres_okien_chi2(plt, dane):
+    """p-value testu chi-kwadrat przesuwnych okien w czasie z zaznaczonym progiem"""
+    for okno, wynik in dane['chi2'].items():
+        plt.plot(dane['daty'][wynik['poczatki'] + okno - 1], wynik['p_value'], linewidth=0.8, label=f'okno {okno}')
+    plt.axhline(PROG_CHI2, color='red', linestyle='--', label=f'próg p = {PROG_CHI2}')
+    plt.yscale('log')
+    plt.title('Test chi-kwadrat równomierności w przesuwnych oknach')
+    plt.xlabel('Data ostatniego losowania w oknie')
+    plt.ylabel('p-value')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+
+
+# Nazwa pliku -> (funkcja rysująca, rozmiar rysunku)
+WYKRESY = {
+    'czestotliwosc': (wykres_czestotliwosci, (10, 5)),
+    'sumy': (wykres_sum, (8, 5)),
+    'parzyste': (wykres_parzystych, (8, 5)),
+    'trend_sum': (wykres_trendu_sum, (12, 5)),
+    'dekady': (wykres_dekad, (14, 5)),
+    'dziesiatki': (wykres_dziesiatek, (8, 5)),
+    'chi2_okien': (wykres_okien_chi2, (14, 6)),
+}
+
+
+def _rysuj(zadanie):
+    """Rysuje jeden wykres do pliku (uruchamiane także w procesach roboczych)"""
+    nazwa, dane, plik, dpi = zadanie
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    plt.rcParams['font.size'] = 10
+    funkcja, rozmiar = WYKRESY[nazwa]
+    plt.figure(figsize=rozmiar)
+    funkcja(plt, dane)
+    plt.savefig(plik, dpi=dpi, bbox_inches='tight')
+    plt.close('all')
+    return plik
+
+
+def generuj_wykresy(historia, katalog=KATALOG_WYKRESOW, nazwy=None, procesy=None, dpi=150, wymus=False):
+    """Rysuje wykresy do katalogu, każdy w osobnym pliku PNG
+
+    Wykresy, których plik istnieje i powstał z tej samej historii (odcisk
+    w wykresy.json), są pomijane, chyba że wymus=True. Zwraca słownik
+    {nazwa: (plik, czy_narysowany)}.
+    """
+    nazwy = list(WYKRESY) if nazwy is None else list(nazwy)
+    os.makedirs(katalog, exist_ok=True)
+    sciezka_meta = os.path.join(katalog, 'wykresy.json')
+    try:
+        with open(sciezka_meta, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        meta = {}
+
+    odcisk = f'{historia.odcisk}:{WERSJA_WYKRESOW}:{dpi}' if historia.odcisk else None
+    pliki = {nazwa: os.path.join(katalog, f'{nazwa}.png') for nazwa in nazwy}
+    do_narysowania = [nazwa for nazwa in nazwy
+                      if wymus or odcisk is None or meta.get(nazwa) != odcisk or not os.path.exists(pliki[nazwa])]
+
+    if do_narysowania:
+        dane = dane_wykresow(historia)
+        zadania = [(nazwa, dane, pliki[nazwa], dpi) for nazwa in do_narysowania]
+        procesy = min(len(zadania), procesy or os.cpu_count() or 1)
+        if procesy > 1:
+            with ProcessPoolExecutor(max_workers=procesy) as pula:
+                list(pula.map(_rysuj, zadania))
+        else:
+            for zadanie in zadania:
+                _rysuj(zadanie)
+
+        if odcisk is not None:
+            meta.update({nazwa: odcisk for nazwa in do_narysowania})
+            with open(sciezka_meta, 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+
+    return {nazwa: (pliki[nazwa], nazwa in do_narysowania) for nazwa in nazwy}